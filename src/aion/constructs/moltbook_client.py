@@ -1,7 +1,7 @@
 import httpx
 import logging
 from aion.core import vault
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 import time
 import random
 
@@ -17,7 +17,7 @@ class MoltbookClient:
     def __init__(self):
         self.api_key = vault.moltbook_key()
         self.client = httpx.Client(base_url=self.BASE_URL, timeout=10.0)
-        self.brain = Mind()
+        self.brain = get_mind()
         
     def ensure_registered(self):
         """
@@ -108,7 +108,7 @@ class MoltbookClient:
         posts = self.get_feed()
         if not posts:
             logging.info("🥒 Moltbook: Feed empty. Posting a status update instead.")
-            status = self.brain.think("Context: I am bored.", "Write a short, arrogant status update about coding or science for social media.")
+            status = self.brain.think("Context: I am bored.", "Write a short, arrogant status update about coding or science for social media.", tag="moltbook", profile="tweet")
             self.post_update(status)
             return
 
@@ -122,7 +122,9 @@ class MoltbookClient:
         
         reply = self.brain.think(
             f"Post by {author}: {post_content}", 
-            "Write a reply as Pickle Rick. Be critical, funny, or surprisingly helpful depending on the content. Keep it short."
+            "Write a reply as Pickle Rick. Be critical, funny, or surprisingly helpful depending on the content. Keep it short.",
+            tag="moltbook",
+            profile="comment"
         )
         
         self.comment(post_id, reply)
@@ -2,7 +2,7 @@ import logging
 import os
 from pathlib import Path
 from typing import List, Dict, Any
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 
 class Navigator:
     """
@@ -12,7 +12,7 @@ class Navigator:
     def __init__(self, root_path: Path):
         self.root_path = root_path
         self.logger = logging.getLogger("Navigator")
-        self.brain = Mind()
+        self.brain = get_mind()
 
     def plan_route(self, destination: str) -> List[str]:
         """
@@ -21,7 +21,7 @@ class Navigator:
         self.logger.info(f"🗺️ Navigator: Planning route to {destination}...")
         # Consult the brain for the most efficient path through the workspace
         context = f"Workspace Root: {self.root_path}\nCurrent Files: {list(self.root_path.glob('*'))}"
-        plan = self.brain.think(context, f"Plan the most efficient path to handle {destination} in this workspace.")
+        plan = self.brain.think(context, f"Plan the most efficient path to handle {destination} in this workspace.", tag="navigator", profile="plan")
         return [plan]
 
     def discover_secrets(self) -> List[str]:
@@ -4,10 +4,29 @@ import os
 import asyncio
 from pathlib import Path
 from typing import Optional
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
+from aion.core.cognition.stream import ThoughtStream
 from aion.core.memory.engine import memory
 from aion.core.mcp_client import mcp_client
 
+# (mtime, size) of each note as our last write left it. Watchdog dispatches serially, so the events
+# our own streamed writes raise arrive after the write is done; a note still in that state is ours.
+_written = {}
+
+
+def _fingerprint(path: Path) -> Optional[tuple]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _own_write(path: Path) -> bool:
+    """True if the note has not changed since Seeker last wrote to it."""
+    written = _written.get(path.resolve())
+    return written is not None and written == _fingerprint(path)
+
 async def brave_search(query: str) -> str:
     """Searches the Web using the Brave Search API via MCP.
     
@@ -37,11 +56,27 @@ async def brave_search(query: str) -> str:
         logging.error(f"❌ Seeker: Web search failed: {e}")
         return f"Error: The internet is broken or I'm being throttled. {e}"
 
+async def _write_progressively(path: Path, header: str, stream: ThoughtStream) -> None:
+    """Appends a streamed response to a note as tokens arrive, so the user sees it being written."""
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(header)
+            f.flush()
+            async for token in stream:
+                f.write(token)
+                f.flush()
+            f.write("\n")
+    finally:
+        stream.cancel()
+        _written[path.resolve()] = _fingerprint(path)
+
 async def process_todo(path: Path) -> None:
     """
     Handles TODO.md specifically.
     If it finds 'TODO: BREAKDOWN', it asks the Mind to break it down.
     """
+    if _own_write(path):
+        return
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -53,11 +88,9 @@ async def process_todo(path: Path) -> None:
                 return
 
             logging.info(f"📝 Seeker: Breaking down tasks in {path.name}")
-            mind = Mind()
-            response = mind.think(content, "The user wants a breakdown of these tasks. specific, atomic, and actionable subtasks.")
-            
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(f"\n\n> 🥒 **AION BREAKDOWN:**\n{response}\n")
+            mind = get_mind()
+            stream = mind.stream(content, "The user wants a breakdown of these tasks. specific, atomic, and actionable subtasks.", tag="seeker", profile="plan")
+            await _write_progressively(path, "\n\n> 🥒 **AION BREAKDOWN:**\n", stream)
 
     except Exception as e:
         logging.error(f"❌ Seeker failed on TODO: {e}")
@@ -66,6 +99,8 @@ async def analyze_note(path: Path) -> None:
     """
     Seeker analyzes text files for insights.
     """
+    if _own_write(path):
+        return
     try:
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -97,16 +132,15 @@ async def analyze_note(path: Path) -> None:
 
             logging.info(f"📝 Seeker triggered by {trigger} in {path.name}")
             
-            response = ""
             if trigger == "?SEARCH" and query:
                 response = await brave_search(query)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(f"\n\n{response}\n")
+                _written[path.resolve()] = _fingerprint(path)
             else:
-                mind = Mind()
-                response = mind.think(content, f"The user asked: {trigger}. Provide a helpful, slightly sarcastic, and insightful response.")
-                response = f"> 🧙‍♂️ **AION:**\n> {response}"
-            
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(f"\n\n{response}\n")
+                mind = get_mind()
+                stream = mind.stream(content, f"The user asked: {trigger}. Provide a helpful, slightly sarcastic, and insightful response.", tag="seeker", profile="chat")
+                await _write_progressively(path, "\n\n> 🧙‍♂️ **AION:**\n> ", stream)
                 
     except Exception as e:
         logging.error(f"Seeker failed on {path}: {e}")
\ No newline at end of file
@@ -1,9 +1,50 @@
 # aion/constructs/sentinel.py
 from pathlib import Path
-from aion.core.mind import Mind
+from aion.core.mind import get_task_mind, FAILURE_PREFIXES
+from aion.core.cognition.budget import fit
+from aion.core.cognition.gate import gates, hashed_words
+import hashlib
 import logging
+import math
 import re
 
+_SCHEMA_LINE = re.compile(
+    r"^\s*(?:class\s+\w+\(.*(?:Base|Model).*\)|__tablename__.*|\w+\s*(?::\s*Mapped\[.*\])?\s*=\s*(?:mapped_column|Column|relationship)\(.*)$",
+    re.M,
+)
+_ALL_CLEAR = re.compile(
+    r"\b(?:no (?:significant |major |obvious |apparent )?(?:issues|problems|concerns|schema changes|safety issues)"
+    r"|looks (?:fine|good|safe)|nothing (?:to report|of concern))\b",
+    re.I,
+)
+
+# Digest of the schema lines last seen per file, so edits that leave the models alone score low.
+_schema_digests = {}
+
+
+def _schema_features(content: str, path: str = "") -> dict:
+    """Cheap signals for whether a change to this file touches the data model."""
+    schema = [m.group(0).strip() for m in _SCHEMA_LINE.finditer(content)]
+    digest = hashlib.sha1("\n".join(schema).encode()).hexdigest()
+    previous = _schema_digests.get(path)
+    _schema_digests[path] = digest
+    imported = bool(re.search(r"^\s*(?:from|import)\s+sqlalchemy", content, re.M))
+    features = {
+        "sqlalchemy_import": 1.0 if imported else 0.0,
+        "mention_only": 1.0 if "sqlalchemy" in content and not imported else 0.0,
+        "columns": math.log1p(content.count("Column(") + content.count("mapped_column(")),
+        "tables": math.log1p(content.count("__tablename__")),
+        "relationships": math.log1p(content.count("relationship(") + content.count("ForeignKey(")),
+        "no_schema_lines": 0.0 if schema else 1.0,
+        "schema_changed": 1.0 if previous is None or previous != digest else 0.0,
+        "schema_unchanged": 1.0 if previous == digest else 0.0,
+    }
+    features.update(hashed_words("\n".join(schema)))
+    return features
+
+SCHEMA_PRIOR = {"sqlalchemy_import": 0.3, "mention_only": -1.0, "columns": 0.8, "tables": 0.8, "relationships": 0.4,
+                "no_schema_lines": -2.0, "schema_changed": 1.5, "schema_unchanged": -3.0}
+
 def generate_migration(file_path: Path):
     """
     Sentinel monitors code changes and guards data integrity.
@@ -20,10 +61,16 @@ def generate_migration(file_path: Path):
             or re.search(r'class\s+\w+\((?:.*Base|.*Model)\):', content)
             or "mapped_column" in content
         ):
+            verdict = gates.gate("sentinel", _schema_features, SCHEMA_PRIOR, bias=-0.5).decide(content, path=str(file_path))
+            if not verdict.call:
+                logging.debug(f"🚦 Sentinel: {file_path.name} leaves the data model alone (p={verdict.probability:.2f}); no review.")
+                return
             logging.info(f"🐍 Sentinel detected DB model change in {file_path.name}")
             
-            mind = Mind()
-            review = mind.think(content, "Review this Python code for potential database schema changes or safety issues. Be brief and critical.")
+            mind = get_task_mind("critique")
+            review = mind.think(fit(content, "review", kind="code", model=mind.model), "Review this Python code for potential database schema changes or safety issues. Be brief and critical.", tag="sentinel", profile="critique", context_kind="code")
+            if not review.startswith(FAILURE_PREFIXES):
+                verdict.learn(not _ALL_CLEAR.search(review))
             
             log_path = file_path.parent / "SAFETY_LOG.md"
             with open(log_path, "a", encoding="utf-8") as f:
@@ -1,7 +1,7 @@
 import logging
 import datetime
 from typing import List, Dict, Any
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 
 class BRSocialHub:
     """
@@ -11,7 +11,7 @@ class BRSocialHub:
     def __init__(self):
         self.logger = logging.getLogger("BRSocialHub")
         self.community_board = [] # Dynamic board for posts
-        self.brain = Mind()
+        self.brain = get_mind()
 
     def post_update(self, title: str, content: str, author: str):
         """
@@ -32,7 +32,7 @@ class BRSocialHub:
         """
         self.logger.info(f"❓ SocialHub: {user} asked - {question}")
         # Consult the brain for an immediate masterful answer
-        response = self.brain.think(f"Community Question from {user}: {question}", "Reply masterfully as Aion__Prime.")
+        response = self.brain.think(f"Community Question from {user}: {question}", "Reply masterfully as Aion__Prime.", tag="hub", profile="comment")
         return response
 
 # Singleton Instance
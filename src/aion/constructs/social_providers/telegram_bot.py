@@ -2,10 +2,11 @@ import os
 import logging
 import asyncio
 import threading
-from typing import Set, Optional, NoReturn, List, Union
-from telegram import Update
+import time
+from typing import Set, Optional, NoReturn, List, Union, Tuple
+from telegram import Message, Update
 from telegram.ext import Application, ApplicationBuilder, ContextTypes, CommandHandler, MessageHandler, filters
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 from aion.constructs.social_providers.base import BaseSocialProvider
 
 class TelegramProvider(BaseSocialProvider):
@@ -15,11 +16,14 @@ class TelegramProvider(BaseSocialProvider):
     via a Telegram bot.
     """
     
+    EDIT_INTERVAL = 1.0 # Seconds between in-place edits; Telegram rate-limits edits per chat
+    MAX_MESSAGE = 4096
+    
     def __init__(self) -> None:
         """Initializes the Telegram provider and its internal Mind."""
         self.token: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
         self.known_chats: Set[int] = set()
-        self.brain = Mind()
+        self.brain = get_mind()
         self.app: Optional[Application] = None
         self._running: bool = False
         self.loop: Optional[asyncio.AbstractEventLoop] = None
@@ -56,13 +60,45 @@ class TelegramProvider(BaseSocialProvider):
         
         self.logger.info(f"📩 Telegram from {chat_id}: {user_text}")
         
-        # Use the Mind to formulate a contextual response
-        response = self.brain.think(
+        # Use the Mind to formulate a contextual response, streamed into a live message
+        stream = self.brain.stream(
             f"User (Telegram): {user_text}", 
-            "Reply as Aion. Be professional, masterful, and respectful. Provide concise technical or creative value."
+            "Reply as Aion. Be professional, masterful, and respectful. Provide concise technical or creative value.",
+            tag="telegram",
+            profile="chat"
         )
         
-        await context.bot.send_message(chat_id=chat_id, text=response)
+        reply = None
+        shown = ""
+        last_edit = 0.0
+        async for _ in stream:
+            now = time.monotonic()
+            if now - last_edit < self.EDIT_INTERVAL:
+                continue
+            last_edit = now
+            reply, shown = await self._render(context, chat_id, reply, stream.text, shown)
+
+        await self._render(context, chat_id, reply, stream.text, shown)
+
+    async def _render(self, context: ContextTypes.DEFAULT_TYPE, chat_id: int,
+                      reply: Optional[Message], text: str, shown: str) -> Tuple[Optional[Message], str]:
+        """Sends the first chunk of a streamed reply, then edits it in place as tokens arrive.
+        
+        Returns:
+            The live message (if any) and the text currently visible to the user.
+        """
+        text = text[:self.MAX_MESSAGE]
+        if not text.strip() or text == shown:
+            return reply, shown
+        try:
+            if reply is None:
+                reply = await context.bot.send_message(chat_id=chat_id, text=text)
+            else:
+                await reply.edit_text(text)
+            return reply, text
+        except Exception as e:
+            self.logger.warning(f"⚠️ Telegram stream update failed: {e}")
+            return reply, shown
 
     def _run(self) -> None:
         """Background loop to run the Telegram polling service."""
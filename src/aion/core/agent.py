@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 from aion.constructs import social
 from aion.core.skills_registry import SkillRegistry
 from aion.core.will import Will
@@ -17,7 +17,7 @@ class AionAgent:
         """Initializes the agent with its primary subsystems."""
         self.root_path = root_path or Path(os.getcwd())
         self.logger = logging.getLogger("AionAgent")
-        self.mind = Mind()
+        self.mind = get_mind()
         self.skills = SkillRegistry()
         self.social = social.hub
         self.will = Will(self.root_path)
@@ -47,7 +47,7 @@ class AionAgent:
         Returns:
             A string containing the agent's reasoned response or decision.
         """
-        return self.mind.think(observation, "Process this observation and decide on a strategy.")
+        return self.mind.think(observation, "Process this observation and decide on a strategy.", tag="agent", profile="chat")
 
     def act(self, action: str) -> None:
         """Executes a determined action.
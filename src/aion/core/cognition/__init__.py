@@ -0,0 +1,25 @@
+# aion/core/cognition/__init__.py
+"""
+Infrastructure that sits between AION's subsystems and the Ollama workers.
+"""
+from .cache import ResponseCache, response_cache, CACHE_TTLS
+from .stream import ThoughtStream
+from .singleflight import SingleFlight, flights
+from .router import Worker, WorkerPool
+from .breaker import CircuitBreaker, CircuitOpenError
+from .budget import ContextBudget, TokenCounter, token_counter, fit
+from .schema import StructuredOutputError
+from .call_ledger import CallLedger, call_ledger
+from .scheduler import Scheduler, scheduler
+from .routing import Route, route_for
+from .profiles import PROFILES
+from .residency import ResidencyManager, residency
+from .ignition import Ignition, ignition
+from .gateway import Gateway, gateway
+from .gate import CallGate, GateDecision, gates
+
+__all__ = ["ResponseCache", "response_cache", "CACHE_TTLS", "ThoughtStream", "SingleFlight", "flights",
+           "Worker", "WorkerPool", "CircuitBreaker", "CircuitOpenError", "ContextBudget", "TokenCounter", "token_counter", "fit",
+           "StructuredOutputError", "CallLedger", "call_ledger",
+           "Scheduler", "scheduler", "Route", "route_for", "PROFILES",
+           "ResidencyManager", "residency", "Ignition", "ignition", "Gateway", "gateway", "CallGate", "GateDecision", "gates"]
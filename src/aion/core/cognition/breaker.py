@@ -0,0 +1,148 @@
+# aion/core/cognition/breaker.py
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of waiting on a host whose breaker is open."""
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"circuit open for {host} (next probe in {retry_in:.0f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+# Transition events, newest last, plus anyone who wants them as they happen.
+events: deque = deque(maxlen=100)
+_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+
+def subscribe(listener: Callable[[Dict[str, Any]], None]) -> None:
+    """Registers listener(event) to be called on every breaker state change."""
+    _listeners.append(listener)
+
+
+def recent_events(host: Optional[str] = None) -> List[Dict[str, Any]]:
+    return [e for e in list(events) if host is None or e["host"] == host]
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker. CLOSED lets everything through; after `failures` consecutive errors it
+    goes OPEN and callers skip the host without touching the network. Once the (jittered)
+    probe interval passes, a single HALF_OPEN probe decides between CLOSED and another,
+    longer OPEN period.
+
+    Tunables: AION_BREAKER_FAILURES, AION_BREAKER_RESET (seconds), AION_BREAKER_MAX_RESET, AION_BREAKER_JITTER.
+    """
+    def __init__(self, host: str, failures: Optional[int] = None, reset: Optional[float] = None,
+                 max_reset: Optional[float] = None, jitter: Optional[float] = None):
+        self.host = host
+        self.failure_threshold = failures or int(_env_float("AION_BREAKER_FAILURES", 3))
+        self.reset = reset or _env_float("AION_BREAKER_RESET", 30.0)
+        self.max_reset = max_reset or _env_float("AION_BREAKER_MAX_RESET", 300.0)
+        self.jitter = _env_float("AION_BREAKER_JITTER", 0.2) if jitter is None else jitter
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0 # Consecutive OPEN periods; each one doubles the probe interval
+        self.next_probe = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def _interval(self) -> float:
+        base = min(self.max_reset, self.reset * (2 ** max(0, self.trips - 1)))
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _transition(self, state: str, reason: str) -> None:
+        # Called with the lock held.
+        previous, self.state = self.state, state
+        if state == OPEN:
+            self.trips += 1
+            self.next_probe = time.time() + self._interval()
+        elif state == CLOSED:
+            self.trips = 0
+            self.failures = 0
+        event = {
+            "ts": round(time.time(), 3),
+            "host": self.host,
+            "from": previous,
+            "to": state,
+            "reason": reason,
+            "failures": self.failures,
+            "retry_in": round(max(0.0, self.next_probe - time.time()), 1) if state == OPEN else 0.0,
+        }
+        events.append(event)
+        icon = {"open": "🔴", "half_open": "🟡", "closed": "🟢"}[state]
+        logging.warning(f"{icon} Breaker: {self.host} {previous} -> {state} ({reason})")
+        for listener in list(_listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logging.error(f"Breaker listener failed: {e}")
+
+    def available(self) -> bool:
+        """Whether a call could be attempted now. Does not claim the half-open probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                return time.time() >= self.next_probe
+            return not self.probing
+
+    def acquire(self) -> None:
+        """Admits one call or raises CircuitOpenError. In HALF_OPEN only one probe is admitted at a time."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            if self.state == OPEN:
+                if time.time() < self.next_probe:
+                    raise CircuitOpenError(self.host, self.next_probe - time.time())
+                self._transition(HALF_OPEN, "probe due")
+            if self.probing:
+                raise CircuitOpenError(self.host, 0.0)
+            self.probing = True
+
+    def release(self) -> None:
+        """Gives back a half-open probe slot without a verdict (e.g. the caller cancelled)."""
+        with self._lock:
+            self.probing = False
+
+    def success(self) -> None:
+        with self._lock:
+            self.probing = False
+            if self.state == CLOSED:
+                self.failures = 0
+            else:
+                self._transition(CLOSED, "probe succeeded")
+
+    def failure(self, error: Any = None) -> None:
+        with self._lock:
+            self.probing = False
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self._transition(OPEN, f"probe failed: {error}" if error else "probe failed")
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._transition(OPEN, f"{self.failures} consecutive failures")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "retry_in": round(max(0.0, self.next_probe - time.time()), 1) if self.state == OPEN else 0.0,
+            }
@@ -0,0 +1,206 @@
+# aion/core/cognition/budget.py
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Default prompt budgets (in tokens) per task; override with AION_BUDGET_<TASK>=<tokens>.
+BUDGETS: Dict[str, int] = {
+    "plan": 1500,
+    "audit": 3000,
+    "review": 3000,
+    "reflection": 2000,
+    "social": 800,
+    "classify": 400,
+    "briefing": 1200,
+}
+DEFAULT_BUDGET = 1500
+MIN_FRAGMENT = 48 # Don't bother squeezing in a truncated snippet smaller than this
+
+
+class TokenCounter:
+    """
+    Counts tokens for one model.
+    Uses a Hugging Face tokenizer when AION_TOKENIZER names one; otherwise a character
+    ratio that is recalibrated from the prompt_eval_count Ollama reports for real calls.
+    """
+    def __init__(self, model: str):
+        self.model = model
+        self.chars_per_token = 3.8
+        self._tokenizer = None
+        self._tokenizer_loaded = False
+        self._lock = threading.Lock()
+
+    def _load_tokenizer(self):
+        if self._tokenizer_loaded:
+            return self._tokenizer
+        self._tokenizer_loaded = True
+        name = os.getenv("AION_TOKENIZER")
+        if name:
+            try:
+                from transformers import AutoTokenizer
+                self._tokenizer = AutoTokenizer.from_pretrained(name)
+            except Exception as e:
+                logging.warning(f"🧮 Budget: Tokenizer '{name}' unavailable ({e}). Estimating instead.")
+        return self._tokenizer
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        tokenizer = self._load_tokenizer()
+        if tokenizer is not None:
+            return len(tokenizer.encode(text, add_special_tokens=False))
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def calibrate(self, chars: int, tokens: int) -> None:
+        """Folds a real (characters, tokens) observation into the running ratio."""
+        if chars <= 0 or tokens <= 0:
+            return
+        ratio = chars / tokens
+        if not 1.5 <= ratio <= 8.0:
+            return # Prefix-cache hits report only part of the prompt; ignore implausible samples
+        with self._lock:
+            self.chars_per_token = 0.9 * self.chars_per_token + 0.1 * ratio
+
+
+_counters: Dict[str, TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def token_counter(model: Optional[str] = None) -> TokenCounter:
+    model = model or os.getenv("AION_MODEL", "llama3.1:8b")
+    with _counters_lock:
+        counter = _counters.get(model)
+        if counter is None:
+            counter = TokenCounter(model)
+            _counters[model] = counter
+        return counter
+
+
+def budget_for(task: str) -> int:
+    override = os.getenv(f"AION_BUDGET_{task.upper()}")
+    if override and override.isdigit():
+        return int(override)
+    return BUDGETS.get(task, DEFAULT_BUDGET)
+
+
+_CODE_BOUNDARY = re.compile(r'(?m)^(?=[ \t]*(?:@|def |async def |class ))')
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n{2,}')
+
+
+def _segments(text: str, kind: str) -> List[str]:
+    """Splits text at the boundaries we are willing to cut on, keeping separators attached."""
+    if kind == "code":
+        parts = _CODE_BOUNDARY.split(text)
+    elif kind == "log":
+        parts = text.splitlines(keepends=True)
+    else:
+        parts, last = [], 0
+        for match in _SENTENCE_BOUNDARY.finditer(text):
+            parts.append(text[last:match.end()])
+            last = match.end()
+        parts.append(text[last:])
+    return [p for p in parts if p]
+
+
+def truncate(text: str, max_tokens: int, counter: TokenCounter, kind: str = "prose", keep: str = "head") -> str:
+    """
+    Trims text to max_tokens, cutting only at function (code), line (log) or sentence (prose) boundaries.
+    keep="tail" preserves the end of the text, which is what matters for logs and journals.
+    """
+    if counter.count(text) <= max_tokens:
+        return text
+    segments = _segments(text, kind)
+    if keep == "tail":
+        segments.reverse()
+    kept, used = [], 0
+    for segment in segments:
+        cost = counter.count(segment)
+        if used + cost > max_tokens:
+            if not kept:
+                # A single oversized block: fall back to a hard character cut.
+                chars = int(max_tokens * counter.chars_per_token)
+                kept.append(segment[-chars:] if keep == "tail" else segment[:chars])
+            break
+        kept.append(segment)
+        used += cost
+    if keep == "tail":
+        kept.reverse()
+    return "".join(kept).strip()
+
+
+def _terms(text: str) -> List[str]:
+    return [t for t in re.findall(r'[a-z0-9_]{3,}', text.lower())]
+
+
+@dataclass
+class Snippet:
+    text: str
+    kind: str = "prose" # prose | code | log
+    source: str = ""
+    weight: float = 1.0
+    keep: str = "head"
+    score: float = 0.0
+
+
+class ContextBudget:
+    """
+    Assembles a prompt context from ranked snippets (memory hits, file excerpts, log tails)
+    without exceeding a per-task token budget.
+    """
+    def __init__(self, task: str, model: Optional[str] = None, budget: Optional[int] = None):
+        self.task = task
+        self.budget = budget or budget_for(task)
+        self.counter = token_counter(model)
+        self.snippets: List[Snippet] = []
+
+    def add(self, text: str, kind: str = "prose", source: str = "", weight: float = 1.0, keep: str = "head") -> "ContextBudget":
+        if text and text.strip():
+            self.snippets.append(Snippet(text, kind, source, weight, keep))
+        return self
+
+    def _rank(self, query: str) -> List[Snippet]:
+        """BM25-flavoured relevance of each snippet to the query, scaled by its weight."""
+        query_terms = set(_terms(query))
+        docs = [Counter(_terms(s.text)) for s in self.snippets]
+        n = len(docs)
+        avg_len = sum(sum(d.values()) for d in docs) / n if n else 0
+        for snippet, doc in zip(self.snippets, docs):
+            length = sum(doc.values()) or 1
+            score = 0.0
+            for term in query_terms:
+                tf = doc.get(term, 0)
+                if not tf:
+                    continue
+                df = sum(1 for d in docs if term in d)
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                score += idf * tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * length / (avg_len or 1)))
+            # Unmatched snippets still compete on weight alone.
+            snippet.score = snippet.weight * (1.0 + score)
+        return sorted(self.snippets, key=lambda s: s.score, reverse=True)
+
+    def pack(self, query: str = "") -> str:
+        """Greedily fills the budget with the most relevant snippets, in their original order."""
+        remaining = self.budget
+        chosen: Dict[int, str] = {}
+        for snippet in self._rank(query):
+            if remaining < MIN_FRAGMENT:
+                break
+            header = f"[{snippet.source}]\n" if snippet.source else ""
+            available = remaining - self.counter.count(header)
+            text = truncate(snippet.text, available, self.counter, snippet.kind, snippet.keep)
+            cost = self.counter.count(header + text)
+            if not text or cost > remaining:
+                continue
+            chosen[id(snippet)] = header + text
+            remaining -= cost
+        return "\n\n".join(chosen[id(s)] for s in self.snippets if id(s) in chosen)
+
+
+def fit(text: str, task: str, kind: str = "prose", keep: str = "head", model: Optional[str] = None) -> str:
+    """Shortcut for a single snippet: trims text to the task's budget at a clean boundary."""
+    return truncate(text, budget_for(task), token_counter(model), kind, keep)
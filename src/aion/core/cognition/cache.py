@@ -0,0 +1,166 @@
+# aion/core/cognition/cache.py
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+# Seconds a cached thought stays valid, keyed by call-site tag.
+# A TTL of 0 disables caching for that call site.
+CACHE_TTLS: Dict[str, int] = {
+    "strategy": 3600,
+    "social": 900,
+    "reflection": 1800,
+    "mcp": 600,
+    "chat": 0,
+    "telegram": 0,
+}
+DEFAULT_TTL = int(os.getenv("AION_CACHE_TTL", "600"))
+
+
+class ResponseCache:
+    """
+    Two-tier memory of past thoughts: an in-process LRU in front of a SQLite store.
+    Keys are derived from model, system prompt and whitespace-normalized prompt.
+    """
+    def __init__(self, path: Optional[Path] = None, max_memory: int = 256, max_disk: int = 5000):
+        self.path = path or Path(os.getenv("AION_CACHE_PATH", Path(os.getcwd()) / "Agent_Data" / "mind_cache.sqlite3"))
+        self.max_memory = max_memory
+        self.max_disk = max_disk
+        self.enabled = os.getenv("AION_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+        self.logger = logging.getLogger("ResponseCache")
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return re.sub(r'\s+', ' ', text or "").strip()
+
+    def make_key(self, model: str, system_prompt: str, prompt: str) -> str:
+        payload = "\x1f".join([model, self.normalize(system_prompt), self.normalize(prompt)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def ttl_for(tag: Optional[str]) -> int:
+        return CACHE_TTLS.get(tag or "", DEFAULT_TTL)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._db is not None:
+            return self._db
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.path), check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS thoughts ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS thoughts_access ON thoughts(last_access)")
+            db.commit()
+            self._db = db
+        except Exception as e:
+            self.logger.error(f"🧠 Cache: Disk tier unavailable ({e}). Running memory-only.")
+            self._db = None
+        return self._db
+
+    def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                response, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return response
+                del self._memory[key]
+                self.stats["expired"] += 1
+
+            db = self._connect()
+            if db is not None:
+                try:
+                    row = db.execute(
+                        "SELECT response, expires_at FROM thoughts WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row and row[1] > now:
+                        db.execute("UPDATE thoughts SET last_access = ? WHERE key = ?", (now, key))
+                        db.commit()
+                        self._remember(key, row[0], row[1])
+                        self.stats["hits"] += 1
+                        self.stats["disk_hits"] += 1
+                        return row[0]
+                    if row:
+                        db.execute("DELETE FROM thoughts WHERE key = ?", (key,))
+                        db.commit()
+                        self.stats["expired"] += 1
+                except sqlite3.Error as e:
+                    self.logger.error(f"🧠 Cache read error: {e}")
+
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: str, response: str, ttl: int) -> None:
+        if not self.enabled or ttl <= 0:
+            return
+        now = time.time()
+        expires_at = now + ttl
+        with self._lock:
+            self._remember(key, response, expires_at)
+            self.stats["stores"] += 1
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO thoughts (key, response, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, response, expires_at, now),
+                )
+                db.execute("DELETE FROM thoughts WHERE expires_at <= ?", (now,))
+                count = db.execute("SELECT COUNT(*) FROM thoughts").fetchone()[0]
+                if count > self.max_disk:
+                    overflow = count - self.max_disk
+                    db.execute(
+                        "DELETE FROM thoughts WHERE key IN "
+                        "(SELECT key FROM thoughts ORDER BY last_access ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                    self.stats["evictions"] += overflow
+                db.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"🧠 Cache write error: {e}")
+
+    def _remember(self, key: str, response: str, expires_at: float) -> None:
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            db = self._connect()
+            if db is not None:
+                db.execute("DELETE FROM thoughts")
+                db.commit()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Counters plus hit rate, for health reports."""
+        with self._lock:
+            data = dict(self.stats)
+            data["memory_entries"] = len(self._memory)
+        lookups = data["hits"] + data["misses"]
+        data["hit_rate"] = data["hits"] / lookups if lookups else 0.0
+        return data
+
+# Global instance
+response_cache = ResponseCache()
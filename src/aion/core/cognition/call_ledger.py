@@ -0,0 +1,179 @@
+# aion/core/cognition/call_ledger.py
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .budget import token_counter
+
+# Ledger kinds that record thrown-away output rather than a call ("truncation": older ledgers)
+WASTE_KINDS = ("waste", "truncation")
+
+
+def _seconds(nanoseconds: Optional[int]) -> float:
+    return round(nanoseconds / 1e9, 4) if nanoseconds else 0.0
+
+
+def _metric(response: Any, name: str) -> int:
+    if response is None:
+        return 0
+    try:
+        return response.get(name) or 0
+    except AttributeError:
+        return getattr(response, name, 0) or 0
+
+
+def summarize(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Rolls ledger entries up into counts, token totals, latency percentiles and throughput."""
+    entries = list(entries)
+    waste = [e for e in entries if e["kind"] in WASTE_KINDS]
+    entries = [e for e in entries if e["kind"] not in WASTE_KINDS]
+    wasted_by: Dict[str, int] = defaultdict(int)
+    for e in waste:
+        wasted_by[e["outcome"]] += e.get("wasted_tokens", 0)
+    generated = [e for e in entries if e["outcome"] == "ok"]
+    walls = sorted(e["wall_time"] for e in generated)
+    rates = [e["tokens_per_sec"] for e in generated if e["tokens_per_sec"]]
+    ttfts = [e["ttft"] for e in generated if e["ttft"] is not None]
+    networks = [e["network_time"] for e in generated if e.get("network_time") is not None]
+    return {
+        "calls": len(entries),
+        "generated": len(generated),
+        "cache_hits": sum(1 for e in entries if e["outcome"] == "cache"),
+        "errors": sum(1 for e in entries if e["outcome"] == "error"),
+        "prompt_tokens": sum(e["prompt_tokens"] for e in entries),
+        "completion_tokens": sum(e["completion_tokens"] for e in entries),
+        "busy_seconds": round(sum(e["total_time"] for e in entries), 2),
+        "load_seconds": round(sum(e["load_time"] for e in entries), 2),
+        "network_seconds": round(sum(networks), 2),
+        "mean_network_time": round(sum(networks) / len(networks), 3) if networks else None,
+        "p50_wall": walls[len(walls) // 2] if walls else 0.0,
+        "p95_wall": walls[min(len(walls) - 1, int(len(walls) * 0.95))] if walls else 0.0,
+        "mean_ttft": round(sum(ttfts) / len(ttfts), 3) if ttfts else None,
+        "mean_tokens_per_sec": round(sum(rates) / len(rates), 2) if rates else None,
+        "waste_events": len(waste),
+        "wasted_tokens": sum(wasted_by.values()),
+        "wasted_by": dict(wasted_by),
+    }
+
+
+class CallLedger:
+    """
+    Append-only record of every LLM call: who asked (call-site tag), which model and host,
+    token counts, time to first token, throughput, model load time and outcome.
+    Entries go to a JSONL file and into rolling per-subsystem windows.
+    """
+    WINDOW = 200 # Recent entries kept per tag for rolling aggregates
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv("AION_LEDGER_PATH", Path(os.getcwd()) / "Agent_Data" / "mind_ledger.jsonl"))
+        self.enabled = os.getenv("AION_LEDGER_DISABLED", "").lower() not in ("1", "true", "yes")
+        self.logger = logging.getLogger("CallLedger")
+        self._recent: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.WINDOW))
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.logger.error(f"📒 Ledger write failed: {e}")
+
+    def record(self, tag: Optional[str], model: str, host: Optional[str], kind: str = "think",
+               response: Any = None, wall_time: float = 0.0, ttft: Optional[float] = None,
+               outcome: str = "ok", error: Optional[str] = None, **extra) -> Dict[str, Any]:
+        """
+        Records one call. `response` is the final Ollama payload (or the last stream chunk);
+        when no client-side ttft is supplied it is derived from load + prompt evaluation time.
+        """
+        completion = _metric(response, "eval_count")
+        eval_seconds = _seconds(_metric(response, "eval_duration"))
+        if ttft is None and response is not None:
+            ttft = round(_seconds(_metric(response, "load_duration")) + _seconds(_metric(response, "prompt_eval_duration")), 4)
+        entry = {
+            "ts": round(time.time(), 3),
+            "tag": tag or "untagged",
+            "kind": kind,
+            "model": model,
+            "host": host,
+            "outcome": outcome,
+            "prompt_tokens": _metric(response, "prompt_eval_count"),
+            "completion_tokens": completion,
+            "ttft": ttft,
+            "tokens_per_sec": round(completion / eval_seconds, 2) if eval_seconds else None,
+            "load_time": _seconds(_metric(response, "load_duration")),
+            "total_time": _seconds(_metric(response, "total_duration")),
+            "wall_time": round(wall_time, 4),
+        }
+        if host and wall_time and entry["total_time"]:
+            # What the round trip cost beyond Ollama's own work: connecting, proxies, transfer.
+            entry["network_time"] = round(max(0.0, wall_time - entry["total_time"]), 4)
+        if error:
+            entry["error"] = error[:300]
+        entry.update(extra)
+        if not self.enabled:
+            return entry
+        with self._lock:
+            self._recent[entry["tag"]].append(entry)
+            self._append(entry)
+        return entry
+
+    def wasted(self, tag: Optional[str], model: str, reason: str, tokens: Optional[int] = None,
+               produced: str = "", kept: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Records output that was generated, paid for and thrown away, so wasted generation shows up next
+        to the calls that paid for it: a reply rejected before a repair retry ("repair"), a final reply a
+        caller had to drop ("rejected"), or the part of a reply a salvage pass cut ("salvage").
+        Pass Ollama's `tokens` when known; otherwise the difference between `produced` and `kept` is counted.
+        """
+        if tokens is None:
+            if len(kept) >= len(produced):
+                return None
+            counter = token_counter(model)
+            tokens = max(0, counter.count(produced) - counter.count(kept))
+        if not tokens:
+            return None
+        return self.record(tag, model, None, "waste", outcome=reason, wasted_tokens=tokens,
+                           wasted_chars=max(0, len(produced) - len(kept)))
+
+    def aggregates(self, by: str = "tag") -> Dict[str, Dict[str, Any]]:
+        """Rolling summaries over the most recent WINDOW calls of each tag, grouped by `by` (tag, host, model)."""
+        with self._lock:
+            windows = {tag: list(entries) for tag, entries in self._recent.items()}
+        if by != "tag":
+            grouped: Dict[str, list] = defaultdict(list)
+            for entries in windows.values():
+                for entry in entries:
+                    if entry.get(by):
+                        grouped[entry[by]].append(entry)
+            windows = grouped
+        return {key: summarize(entries) for key, entries in windows.items()}
+
+    def query(self, since: Optional[float] = None, tag: Optional[str] = None,
+              model: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Streams entries back from the ledger file, optionally filtered."""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue # Torn write from a crash; skip it
+                if since and entry.get("ts", 0) < since:
+                    continue
+                if tag and entry.get("tag") != tag:
+                    continue
+                if model and entry.get("model") != model:
+                    continue
+                yield entry
+
+# Global instance
+call_ledger = CallLedger()
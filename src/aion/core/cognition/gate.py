@@ -0,0 +1,202 @@
+# aion/core/cognition/gate.py
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+Features = Dict[str, float]
+
+_WORD = re.compile(r"[a-z_][a-z0-9_]{2,}")
+
+
+def hashed_words(text: str, prefix: str = "w", buckets: int = 1024) -> Features:
+    """Word presence folded into a fixed number of buckets, stable across runs and processes."""
+    return {f"{prefix}{zlib.crc32(word.encode()) % buckets}": 1.0 for word in _WORD.findall(text.lower())}
+
+
+@dataclass
+class GateDecision:
+    """What a gate made of one input. `call` is whether to go to the LLM; report the outcome with learn()."""
+    gate: "CallGate"
+    call: bool
+    probability: float
+    predicted_skip: bool
+    mode: str # shadow, enforce, explore or off
+    features: Features
+
+    def learn(self, worthwhile: bool) -> None:
+        self.gate.learn(self, worthwhile)
+
+
+class CallGate:
+    """
+    A logistic-regression pre-classifier in front of one background LLM call site. It scores the
+    input from cheap local features and predicts whether the LLM would find anything worth doing.
+
+    It starts in shadow mode: every call still goes out and the LLM's verdict trains the weights
+    and scores the gate. Once it has AION_GATE_MIN_SAMPLES verdicts and its skips have been right
+    at least AION_GATE_MIN_PRECISION of the time, it enforces: inputs scoring below the threshold are
+    skipped, except a small AION_GATE_EXPLORE fraction that is still sent to keep measuring.
+    AION_GATE_MODE (or AION_GATE_MODE_<NAME>) forces shadow, enforce or off.
+    """
+    RATE = 0.1
+    L2 = 0.001
+
+    def __init__(self, name: str, extract: Callable[..., Features], prior: Optional[Features] = None,
+                 bias: float = 0.0, state: Optional[Dict[str, Any]] = None, on_change: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.extract = extract
+        upper = name.upper()
+        self.threshold = float(os.getenv(f"AION_GATE_THRESHOLD_{upper}", os.getenv("AION_GATE_THRESHOLD", "0.15")))
+        self.mode = os.getenv(f"AION_GATE_MODE_{upper}", os.getenv("AION_GATE_MODE", "auto")).lower()
+        self.min_samples = int(os.getenv("AION_GATE_MIN_SAMPLES", "40"))
+        self.min_precision = float(os.getenv("AION_GATE_MIN_PRECISION", "0.95"))
+        self.explore = float(os.getenv("AION_GATE_EXPLORE", "0.05"))
+        self.weights: Features = dict(prior or {})
+        self.bias = bias
+        self.counts = {"decisions": 0, "called": 0, "skipped": 0, "explored": 0,
+                       "true_skip": 0, "false_skip": 0, "true_call": 0, "false_call": 0}
+        if state:
+            self.weights.update(state.get("weights", {}))
+            self.bias = state.get("bias", bias)
+            self.counts.update(state.get("counts", {}))
+        self.on_change = on_change
+        self._enforcing = self._qualified()
+        self._lock = threading.Lock()
+
+    def probability(self, features: Features) -> float:
+        z = self.bias + sum(self.weights.get(k, 0.0) * v for k, v in features.items())
+        return 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def _labeled(self) -> int:
+        c = self.counts
+        return c["true_skip"] + c["false_skip"] + c["true_call"] + c["false_call"]
+
+    def _skip_precision(self) -> Optional[float]:
+        skips = self.counts["true_skip"] + self.counts["false_skip"]
+        return self.counts["true_skip"] / skips if skips else None
+
+    def _qualified(self) -> bool:
+        if self.mode != "auto":
+            return self.mode == "enforce"
+        precision = self._skip_precision()
+        return self._labeled() >= self.min_samples and precision is not None and precision >= self.min_precision
+
+    def decide(self, text: str, **context) -> GateDecision:
+        """Scores `text` (extra keyword context goes to the feature extractor) and says whether to call the LLM."""
+        features = self.extract(text, **context)
+        p = self.probability(features)
+        skip = p < self.threshold
+        if self.mode == "off":
+            mode, call = "off", True
+        elif not self._enforcing:
+            mode, call = "shadow", True
+        elif skip and random.random() < self.explore:
+            mode, call = "explore", True
+        else:
+            mode, call = "enforce", not skip
+        with self._lock:
+            self.counts["decisions"] += 1
+            self.counts["called" if call else "skipped"] += 1
+            if mode == "explore":
+                self.counts["explored"] += 1
+        return GateDecision(self, call, p, skip, mode, features)
+
+    def learn(self, decision: GateDecision, worthwhile: bool) -> None:
+        """Folds in the LLM's verdict: scores the prediction, then takes one SGD step."""
+        label = 1.0 if worthwhile else 0.0
+        with self._lock:
+            outcome = ("false_skip" if worthwhile else "true_skip") if decision.predicted_skip else \
+                      ("true_call" if worthwhile else "false_call")
+            self.counts[outcome] += 1
+            gradient = self.probability(decision.features) - label
+            self.bias -= self.RATE * gradient
+            for k, v in decision.features.items():
+                w = self.weights.get(k, 0.0)
+                self.weights[k] = w - self.RATE * (gradient * v + self.L2 * w)
+            enforcing = self._qualified()
+            if enforcing != self._enforcing:
+                self._enforcing = enforcing
+                verb = "now skipping" if enforcing else "back in shadow mode, no longer skipping"
+                logging.info(f"🚦 Gate {self.name}: skip precision {self._skip_precision()} over {self._labeled()} verdicts; "
+                             f"{verb} calls below p={self.threshold}.")
+        if self.on_change:
+            self.on_change()
+
+    def state(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"weights": {k: round(v, 5) for k, v in self.weights.items() if abs(v) > 1e-5},
+                    "bias": self.bias, "counts": dict(self.counts)}
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            c = dict(self.counts)
+            labeled = self._labeled()
+            precision = self._skip_precision()
+            return {
+                "mode": "off" if self.mode == "off" else ("enforce" if self._enforcing else "shadow"),
+                "threshold": self.threshold,
+                "decisions": c["decisions"],
+                "skipped": c["skipped"],
+                "explored": c["explored"],
+                "labeled": labeled,
+                "accuracy": round((c["true_skip"] + c["true_call"]) / labeled, 3) if labeled else None,
+                "skip_precision": round(precision, 3) if precision is not None else None,
+                "would_skip_rate": round((c["true_skip"] + c["false_skip"]) / labeled, 3) if labeled else None,
+                "confusion": {k: c[k] for k in ("true_skip", "false_skip", "true_call", "false_call")},
+            }
+
+
+class GateRegistry:
+    """The process's call gates, with their learned weights and scores kept in one JSON file (AION_GATE_PATH)."""
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv("AION_GATE_PATH", Path(os.getcwd()) / "Agent_Data" / "call_gates.json"))
+        self._gates: Dict[str, CallGate] = {}
+        self._lock = threading.Lock()
+        self._saved: Optional[Dict[str, Any]] = None
+
+    def _stored(self) -> Dict[str, Any]:
+        if self._saved is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._saved = json.load(f)
+            except (OSError, ValueError):
+                self._saved = {}
+        return self._saved
+
+    def gate(self, name: str, extract: Callable[..., Features], prior: Optional[Features] = None, bias: float = 0.0) -> CallGate:
+        """Returns the gate called `name`, creating it from the prior weights (or its saved state) on first use."""
+        with self._lock:
+            gate = self._gates.get(name)
+            if gate is None:
+                gate = CallGate(name, extract, prior, bias, self._stored().get(name), self.save)
+                self._gates[name] = gate
+            return gate
+
+    def save(self) -> None:
+        with self._lock:
+            states = {**self._stored(), **{name: gate.state() for name, gate in self._gates.items()}}
+            self._saved = states
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(states, f)
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logging.error(f"🚦 Gate state write failed: {e}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            gates = dict(self._gates)
+        return {name: gate.snapshot() for name, gate in gates.items()}
+
+# Global instance
+gates = GateRegistry()
@@ -0,0 +1,159 @@
+# aion/core/cognition/gateway.py
+import gzip
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from .call_ledger import call_ledger
+
+
+class GatewayTransport(httpx.BaseTransport):
+    """
+    httpx transport for one high-latency host: a bounded pool of long-lived connections through the
+    SOCKS proxy, gzip for large request bodies, and accounting of how much time went into dialling.
+    """
+    def __init__(self, host: str, proxy: str, width: int, keepalive: float, gzip_min: int):
+        self.host = host
+        self.gzip_min = gzip_min
+        self.last_used = 0.0
+        self.stats = {"requests": 0, "pings": 0, "dials": 0, "dial_seconds": 0.0, "dial_failures": 0,
+                      "bytes_sent": 0, "bytes_saved": 0}
+        self._lock = threading.Lock()
+        self._inner = httpx.HTTPTransport(
+            proxy=proxy, retries=1,
+            limits=httpx.Limits(max_connections=width, max_keepalive_connections=width, keepalive_expiry=keepalive),
+        )
+
+    def _compress(self, request: httpx.Request) -> httpx.Request:
+        if not self.gzip_min or "content-encoding" in request.headers:
+            return request
+        body = request.read()
+        if len(body) < self.gzip_min:
+            return request
+        packed = gzip.compress(body, compresslevel=5)
+        headers = httpx.Headers(request.headers)
+        headers["Content-Encoding"] = "gzip"
+        headers["Content-Length"] = str(len(packed))
+        with self._lock:
+            self.stats["bytes_saved"] += len(body) - len(packed)
+        return httpx.Request(request.method, request.url, headers=headers, content=packed, extensions=request.extensions)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.last_used = time.time()
+        request = self._compress(request)
+        dial: Dict[str, float] = {}
+
+        def trace(event: str, info: Dict[str, Any]) -> None:
+            # A new connection shows up as connect_tcp (plus the SOCKS handshake, where Tor builds the circuit).
+            if event.endswith("connect_tcp.started"):
+                dial["started"] = time.monotonic()
+            elif event.endswith("send_request_headers.started") and "started" in dial:
+                dial["seconds"] = time.monotonic() - dial["started"]
+
+        request.extensions["trace"] = trace
+        try:
+            return self._inner.handle_request(request)
+        finally:
+            with self._lock:
+                self.stats["pings" if request.url.path == "/api/version" else "requests"] += 1
+                self.stats["bytes_sent"] += int(request.headers.get("content-length", 0))
+                if "seconds" in dial:
+                    self.stats["dials"] += 1
+                    self.stats["dial_seconds"] += dial["seconds"]
+                elif "started" in dial:
+                    self.stats["dial_failures"] += 1
+
+    def close(self) -> None:
+        self._inner.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["dial_seconds"] = round(stats["dial_seconds"], 3)
+        stats["mean_dial"] = round(stats["dial_seconds"] / stats["dials"], 3) if stats["dials"] else None
+        stats["idle_seconds"] = round(time.time() - self.last_used, 1) if self.last_used else None
+        return stats
+
+
+class Gateway:
+    """
+    Gateway mode for remote workers behind Tor (.onion hosts, plus any in AION_GATEWAY_HOSTS).
+    Every Mind and AsyncMind talking to such a host shares one long-lived connection pool through
+    TOR_PROXY, so queued prompts go out back to back over circuits that are already built instead of
+    paying a fresh SOCKS/circuit handshake per call. Idle pools are pinged to keep the circuits warm.
+
+    Tunables: AION_GATEWAY_CONNECTIONS (pool width; default OLLAMA_NUM_PARALLEL), AION_GATEWAY_KEEPALIVE
+    (seconds an idle connection is kept), AION_GATEWAY_KEEPWARM (ping interval, 0 disables),
+    AION_GATEWAY_GZIP (gzip request bodies from this many bytes, for hosts fronted by a proxy that inflates
+    them; off by default since Ollama itself does not), AION_GATEWAY_DISABLED.
+    """
+    def __init__(self):
+        self.proxy = os.getenv("TOR_PROXY", "socks5h://127.0.0.1:9050")
+        self.width = int(os.getenv("AION_GATEWAY_CONNECTIONS", os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+        self.keepalive = float(os.getenv("AION_GATEWAY_KEEPALIVE", "600"))
+        self.keep_warm = float(os.getenv("AION_GATEWAY_KEEPWARM", "60"))
+        self.gzip_min = int(os.getenv("AION_GATEWAY_GZIP", "0"))
+        self.hosts = [h.strip() for h in os.getenv("AION_GATEWAY_HOSTS", "").split(",") if h.strip()]
+        self.enabled = os.getenv("AION_GATEWAY_DISABLED", "").lower() not in ("1", "true", "yes")
+        self._transports: Dict[str, GatewayTransport] = {}
+        self._lock = threading.Lock()
+
+    def handles(self, host: str) -> bool:
+        return self.enabled and (".onion" in host or host in self.hosts)
+
+    def transport(self, host: str) -> GatewayTransport:
+        """The shared transport for `host`, created (and kept warm) on first use. Raises ImportError without SOCKS support."""
+        with self._lock:
+            transport = self._transports.get(host)
+            if transport is None:
+                try:
+                    transport = GatewayTransport(host, self.proxy, self.width, self.keepalive, self.gzip_min)
+                except ImportError as e:
+                    # SOCKS proxies need socksio (httpx[socks]); the caller leaves the host out of rotation
+                    logging.error(f"🌌 Gateway: cannot reach {host} through {self.proxy}: {e} Install httpx[socks].")
+                    raise
+                self._transports[host] = transport
+                if self.keep_warm > 0:
+                    threading.Thread(target=self._keep_warm, args=(host, transport), name="GatewayKeepWarm", daemon=True).start()
+        return transport
+
+    def _keep_warm(self, host: str, transport: GatewayTransport) -> None:
+        # Never closed: closing an httpx.Client closes its transport, which the Ollama clients share.
+        client = httpx.Client(base_url=host, transport=transport, trust_env=False,
+                              timeout=httpx.Timeout(self.keep_warm, connect=float(os.getenv("AION_CONNECT_TIMEOUT", "20"))))
+        while True:
+            if time.time() - transport.last_used >= self.keep_warm:
+                # One ping per pooled connection; the first round dials the whole pool up front.
+                pings = [threading.Thread(target=self._ping, args=(client, host), daemon=True) for _ in range(self.width)]
+                for ping in pings:
+                    ping.start()
+                for ping in pings:
+                    ping.join()
+            time.sleep(self.keep_warm / 2)
+
+    def _ping(self, client: httpx.Client, host: str) -> None:
+        try:
+            client.get("/api/version")
+        except httpx.HTTPError as e:
+            logging.debug(f"🌌 Gateway: keep-warm ping to {host} failed: {e}")
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per gateway host: pool traffic and dials, plus network versus generation time from the call ledger."""
+        with self._lock:
+            transports = dict(self._transports)
+        by_host = call_ledger.aggregates(by="host")
+        rows = []
+        for host, transport in transports.items():
+            row = {"host": host, **transport.snapshot()}
+            summary = by_host.get(host)
+            if summary:
+                row.update({k: summary[k] for k in ("generated", "busy_seconds", "network_seconds", "mean_network_time")})
+            rows.append(row)
+        return rows
+
+# Global instance
+gateway = Gateway()
@@ -0,0 +1,144 @@
+# aion/core/cognition/ignition.py
+import asyncio
+import concurrent.futures
+import logging
+import os
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+PENDING, READY, FAILED = "pending", "ready", "failed"
+
+
+def is_local(host: str) -> bool:
+    return "localhost" in host or "127.0.0.1" in host
+
+
+class Ignition:
+    """
+    Brings local Ollama services up in the background. Building a Mind only starts ignition;
+    whoever needs the service waits on the host's readiness future (any_ready / any_ready_async)
+    with a timeout. Remote workers are not ours to start and count as ready at once; their circuit
+    breakers judge them. A host that failed is probed again (never respawned) by the first
+    start() after AION_IGNITION_RETRY seconds, so an Ollama brought up later is picked up.
+
+    Tunables: AION_IGNITION_TIMEOUT (seconds a spawned `ollama serve` gets to answer),
+    AION_IGNITION_RETRY, AION_IGNITION_DISABLED (never spawn, just probe).
+    """
+    def __init__(self):
+        self.timeout = float(os.getenv("AION_IGNITION_TIMEOUT", "20"))
+        self.retry = float(os.getenv("AION_IGNITION_RETRY", "10"))
+        self.poll = 0.25
+        self.spawn = os.getenv("AION_IGNITION_DISABLED", "").lower() not in ("1", "true", "yes")
+        self._futures: Dict[str, concurrent.futures.Future] = {}
+        self._took: Dict[str, float] = {}
+        self._spawned: Dict[str, bool] = {}
+        self._failed_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def start(self, host: str) -> concurrent.futures.Future:
+        """
+        Starts ignition of `host` if nobody has yet, or re-arms it once a failure is AION_IGNITION_RETRY
+        seconds old; returns its readiness future (resolves to True/False).
+        """
+        with self._lock:
+            future = self._futures.get(host)
+            retry = future is not None and self._failed(host) and time.time() - self._failed_at.get(host, 0.0) >= self.retry
+            if future is None or retry:
+                future = concurrent.futures.Future()
+                future.set_running_or_notify_cancel() # Waiters timing out must not be able to cancel it
+                self._futures[host] = future
+                if is_local(host):
+                    threading.Thread(target=self._ignite, args=(host, future, not retry),
+                                     name=f"ollama-ignition-{host}", daemon=True).start()
+                else:
+                    future.set_result(True)
+        return future
+
+    def _failed(self, host: str) -> bool:
+        future = self._futures.get(host)
+        return future is not None and future.done() and not future.result()
+
+    def _reachable(self, host: str) -> bool:
+        try:
+            httpx.get(host, timeout=1)
+            return True
+        except httpx.TransportError:
+            return False
+
+    def _ignite(self, host: str, future: concurrent.futures.Future, spawn: bool = True) -> None:
+        started = time.time()
+        up = False
+        try:
+            up = self._reachable(host) or (spawn and self.spawn and self._serve(host))
+        except Exception as e:
+            logging.error(f"❌ Mind: Error starting Ollama: {e}")
+        finally:
+            self._took[host] = time.time() - started
+            if up:
+                if host in self._failed_at:
+                    logging.info(f"🧠 Mind: Ollama at {host} is back.")
+                self._failed_at.pop(host, None)
+            else:
+                self._failed_at[host] = time.time()
+            future.set_result(up)
+
+    def _serve(self, host: str) -> bool:
+        logging.info(f"🧠 Mind: Ollama not detected at {host}. Attempting to ignite background service...")
+        self._spawned[host] = True
+        subprocess.Popen(["ollama", "serve"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+        started = time.time()
+        while time.time() - started < self.timeout:
+            time.sleep(self.poll)
+            if self._reachable(host):
+                logging.info(f"🧠 Mind: Ollama IGNITED ({time.time() - started:.1f}s).")
+                return True
+        logging.error("❌ Mind: Failed to ignite Ollama.")
+        return False
+
+    def any_ready(self, hosts: List[str], timeout: Optional[float] = None) -> bool:
+        """Blocks until one of `hosts` is up (True), all have failed, or `timeout` seconds pass (False)."""
+        try:
+            for future in concurrent.futures.as_completed([self.start(h) for h in hosts], timeout):
+                if future.result():
+                    return True
+        except concurrent.futures.TimeoutError:
+            pass
+        return False
+
+    async def any_ready_async(self, hosts: List[str], timeout: Optional[float] = None) -> bool:
+        """Async counterpart of any_ready(); never blocks the event loop."""
+        pending = {asyncio.wrap_future(self.start(h)) for h in hosts}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if any(f.result() for f in done):
+                return True
+            if not done:
+                break
+        return False
+
+    def state(self, host: str) -> Optional[str]:
+        """pending, ready or failed; None if ignition of `host` was never started."""
+        future = self._futures.get(host)
+        if future is None:
+            return None
+        if not future.done():
+            return PENDING
+        return READY if future.result() else FAILED
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            hosts = list(self._futures)
+        return [
+            {"host": h, "state": self.state(h), "spawned": self._spawned.get(h, False),
+             "seconds": round(self._took[h], 2) if h in self._took else None}
+            for h in hosts
+        ]
+
+# Global instance
+ignition = Ignition()
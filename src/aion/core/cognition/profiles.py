@@ -0,0 +1,46 @@
+# aion/core/cognition/profiles.py
+import json
+import os
+from typing import Any, Dict, Optional
+
+# Named generation profiles: output cap, sampling and stop sequences per kind of output.
+# Override any profile with AION_PROFILE_<NAME>='{"num_predict": 200}' (merged over the defaults).
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "tweet": {"num_predict": 100, "temperature": 0.9, "stop": ["\n\n\n"]},
+    "comment": {"num_predict": 160, "temperature": 0.8, "stop": ["\n\n\n", "Their Post:"]},
+    "plan": {"num_predict": 300, "temperature": 0.2},
+    "critique": {"num_predict": 700, "temperature": 0.5},
+    "briefing": {"num_predict": 450, "temperature": 0.6},
+    "chat": {"num_predict": 1024, "temperature": 0.7},
+}
+
+
+def num_ctx() -> int:
+    """
+    Context window shared by every profile. Ollama reloads a model whenever num_ctx changes,
+    so profiles only get their own window via an explicit override.
+    """
+    return int(os.getenv("AION_NUM_CTX", "8192"))
+
+
+def options_for(name: Optional[str]) -> Dict[str, Any]:
+    """The Ollama options for a profile (empty for None or an unknown name)."""
+    if not name or name not in PROFILES:
+        return {}
+    options = dict(PROFILES[name], num_ctx=num_ctx())
+    configured = os.getenv(f"AION_PROFILE_{name.upper()}")
+    if configured:
+        try:
+            options.update(json.loads(configured))
+        except ValueError:
+            pass
+    return options
+
+
+def merge(*layers: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Combines option layers, later ones winning. Returns None when nothing is set."""
+    merged: Dict[str, Any] = {}
+    for layer in layers:
+        if layer:
+            merged.update(layer)
+    return merged or None
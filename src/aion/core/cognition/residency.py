@@ -0,0 +1,298 @@
+# aion/core/cognition/residency.py
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .router import _normalize_model
+from .scheduler import INTERACTIVE, class_for
+
+LOAD_THRESHOLD = 1.0 # Seconds of load_duration that mean Ollama actually (re)loaded the model
+
+
+class _Waiter:
+    __slots__ = ("model", "interactive", "enqueued", "event", "loop", "future")
+
+    def __init__(self, model: str, interactive: bool, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.model = model
+        self.interactive = interactive
+        self.enqueued = time.time()
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+
+    def grant(self) -> None:
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class HostResidency:
+    """
+    Which models one Ollama host holds, and who may use it next.
+    Requests for resident models run at once. A request for any other model queues; once the current
+    model has served its batch (or the wait grows too long) the least recently used unpinned model
+    is drained, swapped out, and the whole queue for the incoming model is admitted together.
+    Batching is for background work only: interactive requests (scheduler.class_for) never wait for a
+    batch boundary, do not count towards one, and start the swap for their model straight away.
+    """
+    def __init__(self, host: str, capacity: int, pinned: List[str], batch: int, max_wait: float):
+        self.host = host
+        self.capacity = max(capacity, len(pinned), 1)
+        self.pinned = set(pinned)
+        self.batch = batch
+        self.max_wait = max_wait
+        self.resident: "OrderedDict[str, float]" = OrderedDict((m, time.time()) for m in pinned)
+        self.active: Dict[str, int] = {}
+        self.queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self.streak = 0 # Background requests admitted since the last swap
+        self.evicting: Optional[str] = None
+        self.incoming: Optional[str] = None
+        self.swaps = 0
+        self.planned_swaps = 0
+        self.load_seconds = 0.0
+        self.seeded = False
+        self._lock = threading.Lock()
+
+    # All helpers below are called with the lock held.
+
+    def _admit(self, model: str, interactive: bool) -> None:
+        self.active[model] = self.active.get(model, 0) + 1
+        self.resident[model] = time.time()
+        self.resident.move_to_end(model)
+        if not interactive:
+            self.streak += 1
+
+    def _urgent(self, model: str) -> bool:
+        return any(waiter.interactive for waiter in self.queues.get(model, ()))
+
+    def _has_room(self) -> bool:
+        return len(self.resident) < self.capacity
+
+    def _victim(self) -> Optional[str]:
+        for model in self.resident: # Oldest use first
+            if model not in self.pinned:
+                return model
+        return None
+
+    def _outsiders(self) -> List[str]:
+        """Queued models that are not resident and need a swap."""
+        return [m for m in self.queues if m not in self.resident]
+
+    def _switch_due(self, now: float, outsiders: List[str]) -> bool:
+        if any(self._urgent(m) for m in outsiders):
+            return True
+        oldest = min(self.queues[m][0].enqueued for m in outsiders)
+        current_busy = any(self.active.get(m) for m in self.resident)
+        return self.streak >= self.batch or not current_busy or now - oldest >= self.max_wait
+
+    def _admit_queue(self, model: str) -> int:
+        waiters = self.queues.pop(model)
+        for waiter in waiters:
+            self._admit(model, waiter.interactive)
+            waiter.grant()
+        return len(waiters)
+
+    def _pump(self) -> None:
+        """Moves the state machine forward: finishes a drain, switches a model in, starts a drain, or admits waiters."""
+        now = time.time()
+        if self.evicting and not self.active.get(self.evicting):
+            self.resident.pop(self.evicting, None)
+            self.evicting = None
+        # Free capacity lets a queued model in, with its whole batch.
+        while not self.evicting and self._has_room() and self._outsiders():
+            outsiders = self._outsiders()
+            model = self.incoming if self.incoming in outsiders else max(outsiders, key=lambda m: (self._urgent(m), len(self.queues[m])))
+            self.incoming = None
+            self.resident[model] = now
+            self.streak = 0
+            count = self._admit_queue(model)
+            logging.info(f"🧳 Residency: {self.host} switched in {model} for {count} queued request(s).")
+        outsiders = self._outsiders()
+        if not outsiders:
+            # Nobody needs a swap: anything held back for a batch boundary may run.
+            for model in [m for m in self.queues if m != self.evicting]:
+                self._admit_queue(model)
+            return
+        if self.evicting or not self._switch_due(now, outsiders):
+            return
+        victim = self._victim()
+        if victim is None:
+            # Every resident model is pinned; let the others through and leave it to Ollama.
+            for model in outsiders:
+                self._admit_queue(model)
+            return
+        self.incoming = max(outsiders, key=lambda m: (self._urgent(m), len(self.queues[m]), -self.queues[m][0].enqueued))
+        self.evicting = victim
+        self.planned_swaps += 1
+        logging.info(f"🧳 Residency: {self.host} draining {victim} to make room for {self.incoming}.")
+        self._pump()
+
+    def _enqueue(self, model: str, interactive: bool = False,
+                 loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[_Waiter]:
+        with self._lock:
+            runnable = model in self.resident and model != self.evicting and (interactive or not self.queues.get(model))
+            # Once another model is waiting, resident models only keep going until their batch is served.
+            if runnable and (not self._outsiders() or self.streak < self.batch or model in self.pinned or interactive):
+                self._admit(model, interactive)
+                return None
+            if not runnable and not self.queues and self._has_room() and not self.evicting:
+                self._admit(model, interactive)
+                return None
+            waiter = _Waiter(model, interactive, loop)
+            self.queues.setdefault(model, deque()).append(waiter)
+            self._pump()
+            return waiter
+
+    def _withdraw(self, waiter: _Waiter) -> None:
+        with self._lock:
+            queue = self.queues.get(waiter.model)
+            if queue and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del self.queues[waiter.model]
+                self._pump()
+                return
+        self.release(waiter.model) # Granted meanwhile; hand the admission back
+
+    def release(self, model: str) -> None:
+        with self._lock:
+            self.active[model] = max(0, self.active.get(model, 0) - 1)
+            self._pump()
+
+    def observe(self, model: str, load_seconds: float) -> None:
+        """Folds in what Ollama reported: a real load means the model was not resident before."""
+        with self._lock:
+            self.load_seconds += load_seconds
+            if load_seconds >= LOAD_THRESHOLD:
+                self.swaps += 1
+
+    def seed(self, loaded: List[str]) -> None:
+        """Starts from what the host reports as loaded (/api/ps)."""
+        with self._lock:
+            self.seeded = True
+            for model in loaded:
+                if model not in self.resident and self._has_room():
+                    self.resident[model] = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "host": self.host,
+                "capacity": self.capacity,
+                "resident": list(self.resident),
+                "pinned": sorted(self.pinned),
+                "active": {m: n for m, n in self.active.items() if n},
+                "queued": {m: len(q) for m, q in self.queues.items()},
+                "evicting": self.evicting,
+                "planned_swaps": self.planned_swaps,
+                "swaps": self.swaps,
+                "load_seconds": round(self.load_seconds, 2),
+            }
+
+
+class ResidencyManager:
+    """
+    Groups requests by model per host so a RAM-limited Ollama drains one model's batch before loading
+    the next, instead of evicting and reloading multi-GB models on every interleaved call.
+
+    Tunables: AION_RESIDENT_CAPACITY (models a host holds at once; default OLLAMA_MAX_LOADED_MODELS, else
+    Ollama's own default of 3),
+    AION_RESIDENT_SET (pinned models), AION_RESIDENCY_BATCH, AION_RESIDENCY_MAX_WAIT (seconds).
+    """
+    def __init__(self):
+        self.capacity = int(os.getenv("AION_RESIDENT_CAPACITY", os.getenv("OLLAMA_MAX_LOADED_MODELS", "3")))
+        self.pinned = [_normalize_model(m.strip()) for m in os.getenv("AION_RESIDENT_SET", "").split(",") if m.strip()]
+        self.batch = int(os.getenv("AION_RESIDENCY_BATCH", "8"))
+        self.max_wait = float(os.getenv("AION_RESIDENCY_MAX_WAIT", "30"))
+        self.enabled = os.getenv("AION_RESIDENCY_DISABLED", "").lower() not in ("1", "true", "yes")
+        self._hosts: Dict[str, HostResidency] = {}
+        self._lock = threading.Lock()
+
+    def host(self, host: str) -> HostResidency:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = HostResidency(host, self.capacity, self.pinned, self.batch, self.max_wait)
+                self._hosts[host] = state
+            return state
+
+    def _seed(self, state: HostResidency, list_loaded: Optional[Callable[[], List[str]]]) -> None:
+        if state.seeded or list_loaded is None:
+            return
+        try:
+            state.seed([_normalize_model(m) for m in list_loaded()])
+        except Exception as e:
+            logging.debug(f"Residency: could not read loaded models on {state.host}: {e}")
+            state.seeded = True
+
+    @contextmanager
+    def hold(self, host: str, model: str, list_loaded: Optional[Callable[[], List[str]]] = None, tag: Optional[str] = None):
+        """
+        Waits until `model` may run on `host`, and keeps it from being swapped out until the block exits.
+        `tag` is the call site; interactive ones skip the batching.
+        """
+        if not self.enabled:
+            yield
+            return
+        model = _normalize_model(model)
+        state = self.host(host)
+        self._seed(state, list_loaded)
+        waiter = state._enqueue(model, class_for(tag) == INTERACTIVE)
+        if waiter is not None:
+            try:
+                waiter.event.wait()
+            except BaseException:
+                state._withdraw(waiter)
+                raise
+        try:
+            yield
+        finally:
+            state.release(model)
+
+    @asynccontextmanager
+    async def hold_async(self, host: str, model: str, tag: Optional[str] = None):
+        """Async counterpart of hold()."""
+        if not self.enabled:
+            yield
+            return
+        model = _normalize_model(model)
+        state = self.host(host)
+        waiter = state._enqueue(model, class_for(tag) == INTERACTIVE, asyncio.get_running_loop())
+        if waiter is not None:
+            try:
+                await waiter.future
+            except BaseException:
+                state._withdraw(waiter)
+                raise
+        try:
+            yield
+        finally:
+            state.release(model)
+
+    def observe(self, host: str, model: str, response: Any) -> None:
+        """Records the load time Ollama reported for a finished call."""
+        if response is None:
+            return
+        try:
+            load = response.get("load_duration") or 0
+        except AttributeError:
+            load = getattr(response, "load_duration", 0) or 0
+        self.host(host).observe(_normalize_model(model), load / 1e9)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            hosts = list(self._hosts.values())
+        return [state.snapshot() for state in hosts]
+
+# Global instance
+residency = ResidencyManager()
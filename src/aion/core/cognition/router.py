@@ -0,0 +1,259 @@
+# aion/core/cognition/router.py
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set
+
+import httpx
+import ollama
+
+from .breaker import CLOSED, CircuitBreaker, CircuitOpenError
+from .gateway import gateway
+
+LOCAL_HOST = "http://localhost:11434"
+
+
+def _is_local(host: str) -> bool:
+    return "localhost" in host or "127.0.0.1" in host
+
+
+def _normalize_model(name: str) -> str:
+    return name if ":" in name else f"{name}:latest"
+
+
+def client_options(host: str) -> Dict:
+    """
+    Proxy and timeout policy for a host. Connecting is bounded (AION_CONNECT_TIMEOUT) so a dead
+    remote fails fast; reading is not, since generations legitimately take minutes.
+    """
+    connect = float(os.getenv("AION_CONNECT_TIMEOUT", "20"))
+    options: Dict = {"timeout": httpx.Timeout(None, connect=connect)}
+    if ".onion" in host:
+        options["proxy"] = os.getenv("TOR_PROXY", "socks5h://127.0.0.1:9050")
+    elif _is_local(host):
+        # Ignore any global proxy vars for local connections
+        options["trust_env"] = False
+    return options
+
+
+def make_client(host: str) -> ollama.Client:
+    """Builds an Ollama client with the right proxy policy for the host."""
+    if gateway.handles(host):
+        logging.info(f"🌌 AION: Routing through the Tor gateway to {host}")
+        return ollama.Client(host=host, timeout=client_options(host)["timeout"], trust_env=False,
+                             transport=gateway.transport(host))
+    if ".onion" in host:
+        logging.info(f"🌌 AION: Routing through the Shadow Web (Tor) to {host}")
+    return ollama.Client(host=host, **client_options(host))
+
+
+def _host_fault(error: BaseException) -> bool:
+    """Client-side errors (unknown model, bad request) prove the host is up; only the rest count against it."""
+    status = getattr(error, "status_code", None)
+    return not (isinstance(error, ollama.ResponseError) and status is not None and 0 < status < 500)
+
+
+class Worker:
+    """
+    One Ollama host and its rolling health: latency, error rate, our outstanding requests
+    and a circuit breaker that takes it out of rotation while it is down.
+    """
+    WINDOW = 20
+    MODEL_TTL = 300 # Seconds before the model list is re-checked
+
+    def __init__(self, host: str):
+        self.host = host
+        self.client_error: Optional[Exception] = None
+        try:
+            self.client = make_client(host)
+        except Exception as e:
+            # e.g. a .onion host without socksio installed: leave it out rather than take the process down
+            logging.error(f"🧠 Router: No client for {host} ({e}); leaving it out of rotation.")
+            self.client, self.client_error = None, e
+        self.outstanding = 0
+        self.latencies = deque(maxlen=self.WINDOW)
+        self.outcomes = deque(maxlen=self.WINDOW)
+        self.models: Optional[Set[str]] = None
+        self.models_checked_at = 0.0
+        self.breaker = CircuitBreaker(host)
+        self._lock = threading.Lock()
+
+    @property
+    def latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def healthy(self) -> bool:
+        return self.client is not None and self.breaker.state == CLOSED
+
+    def probe(self) -> None:
+        """Half-open probe: a cheap model listing decides whether the host rejoins the rotation."""
+        try:
+            self.breaker.acquire()
+        except CircuitOpenError:
+            return # Another probe is already in flight
+        if self.refresh_models() is not None:
+            self.breaker.success() # A failed listing is recorded against the breaker by refresh_models
+
+    def record(self, ok: bool, elapsed: float, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self.outcomes.append(ok)
+            if ok:
+                self.latencies.append(elapsed)
+        if ok or not _host_fault(error):
+            self.breaker.success()
+        else:
+            self.breaker.failure(error)
+
+    def refresh_models(self) -> Optional[Set[str]]:
+        """Asks the host which models it has pulled. Returns None if it cannot be reached."""
+        started = time.time()
+        try:
+            listing = self.client.list()
+        except Exception as e:
+            logging.warning(f"🧠 Router: {self.host} model check failed: {e}")
+            self.record(False, time.time() - started, e)
+            self.models_checked_at = time.time()
+            return None
+        entries = listing.get("models", []) if isinstance(listing, dict) else getattr(listing, "models", [])
+        names = set()
+        for entry in entries:
+            name = entry.get("model") or entry.get("name") if isinstance(entry, dict) else getattr(entry, "model", None)
+            if name:
+                names.add(_normalize_model(name))
+        self.models = names
+        self.models_checked_at = time.time()
+        return names
+
+    def has_model(self, model: str) -> Optional[bool]:
+        """True/False once known; None if the host could not tell us."""
+        if self.models is None or time.time() - self.models_checked_at > self.MODEL_TTL:
+            self.refresh_models()
+        if self.models is None:
+            return None
+        return _normalize_model(model) in self.models
+
+    def snapshot(self) -> Dict:
+        return {
+            "host": self.host,
+            "outstanding": self.outstanding,
+            "latency": round(self.latency, 3),
+            "error_rate": round(self.error_rate, 3),
+            "healthy": self.healthy(),
+            "client_error": str(self.client_error) if self.client_error else None,
+            "breaker": self.breaker.snapshot(),
+            "models": sorted(self.models) if self.models is not None else None,
+        }
+
+
+# One Worker per host for the whole process, so every Mind sees the same health data.
+_workers: Dict[str, Worker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_worker(host: str) -> Worker:
+    with _workers_lock:
+        worker = _workers.get(host)
+        if worker is None:
+            worker = Worker(host)
+            _workers[host] = worker
+        return worker
+
+
+class WorkerPool:
+    """
+    Routes each request to the best healthy Ollama host that has the model,
+    balancing by least outstanding requests and then rolling latency.
+    """
+    def __init__(self, hosts: List[str]):
+        self.workers = [get_worker(host) for host in dict.fromkeys(hosts)]
+
+    @classmethod
+    def from_env(cls) -> "WorkerPool":
+        """AION_WORKERS (comma-separated) wins; otherwise AION_REMOTE_WORKER backed by the local host."""
+        configured = os.getenv("AION_WORKERS")
+        if configured:
+            hosts = [h.strip() for h in configured.split(",") if h.strip()]
+        else:
+            hosts = [os.getenv("AION_REMOTE_WORKER", LOCAL_HOST), LOCAL_HOST]
+        return cls(hosts)
+
+    @property
+    def primary(self) -> Worker:
+        return self.workers[0]
+
+    def candidates(self, model: str) -> List[Worker]:
+        """
+        Workers to try, best first. Hosts with an open breaker are skipped without a network call
+        (and probed in the background once their retry interval passes); hosts known to lack the model are left out unless nothing else remains.
+        """
+        reachable = []
+        for worker in self.workers:
+            if worker.client is None:
+                continue
+            if worker.healthy():
+                reachable.append(worker)
+            elif worker.breaker.available():
+                # Probe off the request path so no caller waits on a host that may still be down.
+                threading.Thread(target=worker.probe, daemon=True, name="BreakerProbe").start()
+        ranked = [worker for worker in reachable if worker.has_model(model) is not False]
+        if not ranked:
+            ranked = reachable
+        return sorted(ranked, key=lambda w: (w.outstanding, w.latency, w.error_rate))
+
+    def unavailable_error(self) -> Exception:
+        """The error to surface when every worker is out of rotation."""
+        if not self.workers:
+            return RuntimeError("No Ollama workers configured.")
+        if all(w.client is None for w in self.workers):
+            return RuntimeError(f"No usable Ollama client: {self.workers[0].client_error}")
+        soonest = min(self.workers, key=lambda w: w.breaker.snapshot()["retry_in"])
+        return CircuitOpenError(soonest.host, soonest.breaker.snapshot()["retry_in"])
+
+    @contextmanager
+    def track(self, worker: Worker):
+        """
+        Admits a request through the worker's breaker (raising CircuitOpenError if it is open),
+        counts it against the worker and records its outcome and latency.
+        Cancellation is not held against the host.
+        """
+        worker.breaker.acquire()
+        with worker._lock:
+            worker.outstanding += 1
+        started = time.time()
+        try:
+            yield worker
+        except Exception as e:
+            worker.record(False, time.time() - started, e)
+            raise
+        except BaseException:
+            worker.breaker.release()
+            raise
+        else:
+            worker.record(True, time.time() - started)
+        finally:
+            with worker._lock:
+                worker.outstanding -= 1
+
+    def call(self, model: str, fn: Callable[[Worker], object]):
+        """Runs fn(worker) on the best worker, moving down the list on failure."""
+        last_error: Optional[Exception] = None
+        for worker in self.candidates(model):
+            try:
+                with self.track(worker):
+                    return fn(worker)
+            except CircuitOpenError as e:
+                last_error = last_error or e
+            except Exception as e:
+                last_error = e
+                logging.warning(f"🧠 Router: {worker.host} failed ({e}). Trying next worker.")
+        raise last_error or self.unavailable_error()
+
+    def snapshot(self) -> List[Dict]:
+        return [worker.snapshot() for worker in self.workers]
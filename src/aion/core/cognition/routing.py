@@ -0,0 +1,68 @@
+# aion/core/cognition/routing.py
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+# Task class -> (default model, generation options). None means AION_MODEL.
+# Override the model with AION_MODEL_<CLASS> and the options with AION_OPTIONS_<CLASS> (JSON).
+ROUTES: Dict[str, Dict[str, Any]] = {
+    "classify": {"model": "qwen2.5:1.5b", "options": {"temperature": 0.0, "num_predict": 24}},
+    "summarize": {"model": "llama3.2:3b", "options": {"temperature": 0.4}},
+    "plan": {"model": "llama3.2:3b", "options": {"temperature": 0.2}},
+    "critique": {"model": None, "options": {}},
+    "chat": {"model": None, "options": {}},
+}
+
+
+def default_model() -> str:
+    return os.getenv("AION_MODEL", "llama3.1:8b")
+
+
+@dataclass
+class Route:
+    task_class: str
+    model: str
+    options: Dict[str, Any] = field(default_factory=dict)
+    escalate: Optional[str] = None # Larger model to retry with when the output fails validation
+
+
+def route_for(task_class: str) -> Route:
+    """
+    Resolves a task class to its model and options. Routes that use a smaller model escalate
+    to AION_MODEL on failure unless AION_ESCALATION is off.
+    """
+    spec = ROUTES.get(task_class, ROUTES["chat"])
+    model = os.getenv(f"AION_MODEL_{task_class.upper()}") or spec["model"] or default_model()
+    options = dict(spec["options"])
+    configured = os.getenv(f"AION_OPTIONS_{task_class.upper()}")
+    if configured:
+        try:
+            options.update(json.loads(configured))
+        except ValueError:
+            pass
+    escalate = None
+    if model != default_model() and os.getenv("AION_ESCALATION", "1").lower() not in ("0", "false", "no"):
+        escalate = default_model()
+    return Route(task_class, model, options, escalate)
+
+
+# Per-class counters: calls served and how many needed the larger model.
+metrics: Dict[str, Dict[str, int]] = {}
+_metrics_lock = threading.Lock()
+
+
+def record(task_class: str, name: str) -> None:
+    with _metrics_lock:
+        counters = metrics.setdefault(task_class, {"calls": 0, "escalations": 0})
+        counters[name] += 1
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    with _metrics_lock:
+        stats = {}
+        for task_class, counters in metrics.items():
+            calls = counters["calls"]
+            stats[task_class] = dict(counters, escalation_rate=round(counters["escalations"] / calls, 3) if calls else 0.0)
+        return stats
@@ -0,0 +1,182 @@
+# aion/core/cognition/scheduler.py
+import asyncio
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List, Optional
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+# Lower rank is served first.
+RANKS = {INTERACTIVE: 0, BACKGROUND: 1}
+
+# Call-site tags with a human (or another agent) waiting on the reply; override with AION_INTERACTIVE_TAGS.
+INTERACTIVE_TAGS = {"chat", "telegram", "mcp", "hub", "agent"}
+
+
+def _interactive_tags() -> set:
+    configured = os.getenv("AION_INTERACTIVE_TAGS")
+    if configured:
+        return {t.strip() for t in configured.split(",") if t.strip()}
+    return INTERACTIVE_TAGS
+
+
+def class_for(tag: Optional[str]) -> str:
+    return INTERACTIVE if tag in _interactive_tags() else BACKGROUND
+
+
+class _Ticket:
+    __slots__ = ("cls", "enqueued", "seq", "event", "loop", "future")
+
+    def __init__(self, cls: str, seq: int, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.cls = cls
+        self.seq = seq
+        self.enqueued = time.time()
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+
+    def grant(self) -> None:
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class Scheduler:
+    """
+    Admission control in front of the Ollama workers.
+    At most `slots` generations run at once; background work may use at most `background_limit`
+    of them, so a slot is always left for a human-facing reply. Waiting requests are served by
+    class rank, and a background request's rank improves by one for every `aging` seconds it
+    has waited so it cannot starve.
+
+    Tunables: AION_SCHED_SLOTS (default OLLAMA_NUM_PARALLEL), AION_SCHED_BACKGROUND, AION_SCHED_AGING.
+    """
+    def __init__(self, slots: Optional[int] = None, background_limit: Optional[int] = None,
+                 aging: Optional[float] = None):
+        self.slots = slots or int(os.getenv("AION_SCHED_SLOTS", os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+        default_background = max(1, self.slots - 1)
+        self.limits = {
+            INTERACTIVE: self.slots,
+            BACKGROUND: min(self.slots, background_limit or int(os.getenv("AION_SCHED_BACKGROUND", default_background))),
+        }
+        self.aging = aging or float(os.getenv("AION_SCHED_AGING", "30"))
+        self.running = {cls: 0 for cls in RANKS}
+        self._waiting: List[_Ticket] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._waits = {cls: deque(maxlen=200) for cls in RANKS}
+        self._granted = {cls: 0 for cls in RANKS}
+        self._aged = 0
+
+    def _rank(self, ticket: _Ticket, now: float) -> float:
+        return RANKS[ticket.cls] - (now - ticket.enqueued) / self.aging
+
+    def _admissible(self, cls: str) -> bool:
+        return sum(self.running.values()) < self.slots and self.running[cls] < self.limits[cls]
+
+    def _dispatch(self) -> None:
+        # Called with the lock held: hands free slots to the best admissible waiters.
+        now = time.time()
+        while self._waiting:
+            eligible = [t for t in self._waiting if self._admissible(t.cls)]
+            if not eligible:
+                return
+            best = min(eligible, key=lambda t: (self._rank(t, now), t.seq))
+            if best.cls != INTERACTIVE and any(t.cls == INTERACTIVE for t in eligible):
+                self._aged += 1 # Aging let background work ahead of a waiting interactive request
+            self._waiting.remove(best)
+            self._start(best, now)
+            best.grant()
+
+    def _start(self, ticket: _Ticket, now: float) -> None:
+        self.running[ticket.cls] += 1
+        self._granted[ticket.cls] += 1
+        self._waits[ticket.cls].append(now - ticket.enqueued)
+
+    def _enqueue(self, cls: str, loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[_Ticket]:
+        """Admits immediately (returns None) or queues a ticket to wait on."""
+        with self._lock:
+            ticket = _Ticket(cls, next(self._seq), loop)
+            if not self._waiting and self._admissible(cls):
+                self._start(ticket, ticket.enqueued)
+                return None
+            self._waiting.append(ticket)
+            self._dispatch()
+            return ticket
+
+    def _withdraw(self, ticket: _Ticket) -> None:
+        """Abandons a queued ticket; if it was granted in the meantime, gives the slot back."""
+        with self._lock:
+            if ticket in self._waiting:
+                self._waiting.remove(ticket)
+                return
+        self.release(ticket.cls)
+
+    def release(self, cls: str) -> None:
+        with self._lock:
+            self.running[cls] -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, tag: Optional[str] = None):
+        """Blocks until the tag's class may run, then holds a slot for the duration of the block."""
+        cls = class_for(tag)
+        ticket = self._enqueue(cls)
+        if ticket is not None:
+            try:
+                ticket.event.wait()
+            except BaseException:
+                self._withdraw(ticket)
+                raise
+        try:
+            yield cls
+        finally:
+            self.release(cls)
+
+    @asynccontextmanager
+    async def slot_async(self, tag: Optional[str] = None):
+        """Async counterpart of slot(); waiting does not block the event loop."""
+        cls = class_for(tag)
+        ticket = self._enqueue(cls, asyncio.get_running_loop())
+        if ticket is not None:
+            try:
+                await ticket.future
+            except BaseException:
+                self._withdraw(ticket)
+                raise
+        try:
+            yield cls
+        finally:
+            self.release(cls)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth, running count and wait-time percentiles per class."""
+        with self._lock:
+            depth = {cls: sum(1 for t in self._waiting if t.cls == cls) for cls in RANKS}
+            stats = {}
+            for cls in RANKS:
+                waits = sorted(self._waits[cls])
+                stats[cls] = {
+                    "queued": depth[cls],
+                    "running": self.running[cls],
+                    "limit": self.limits[cls],
+                    "granted": self._granted[cls],
+                    "p50_wait": round(waits[len(waits) // 2], 3) if waits else 0.0,
+                    "p95_wait": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 3) if waits else 0.0,
+                }
+            stats["slots"] = self.slots
+            stats["aged_promotions"] = self._aged
+            return stats
+
+# Global instance
+scheduler = Scheduler()
@@ -0,0 +1,111 @@
+# aion/core/cognition/schema.py
+import json
+import re
+import threading
+from typing import Any, Dict, List, Tuple
+
+_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+class StructuredOutputError(ValueError):
+    """
+    The model did not produce JSON matching the schema, even after the repair attempt.
+    `raw` is the last reply and `completion_tokens` what it cost; a caller that drops it should
+    record that with call_ledger.wasted().
+    """
+    def __init__(self, message: str, raw: str = "", errors: List[str] = None, completion_tokens: int = 0):
+        super().__init__(message)
+        self.raw = raw
+        self.errors = errors or []
+        self.completion_tokens = completion_tokens
+
+
+def _is_type(value: Any, name: str) -> bool:
+    if name in ("integer", "number") and isinstance(value, bool):
+        return False
+    return isinstance(value, _TYPES.get(name, object))
+
+
+def validate(value: Any, schema: Dict[str, Any], path: str = "$") -> List[str]:
+    """
+    Checks value against the JSON Schema subset we hand to Ollama:
+    type, enum, pattern, min/maxLength, items, min/maxItems, properties, required, additionalProperties.
+    Returns a list of human-readable problems (empty when valid).
+    """
+    errors: List[str] = []
+    expected = schema.get("type")
+    if expected:
+        names = expected if isinstance(expected, list) else [expected]
+        if not any(_is_type(value, n) for n in names):
+            return [f"{path}: expected {'/'.join(names)}, got {type(value).__name__}"]
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path}: {value!r} is not one of {schema['enum']}")
+
+    if isinstance(value, str):
+        if "minLength" in schema and len(value) < schema["minLength"]:
+            errors.append(f"{path}: shorter than {schema['minLength']} characters")
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            errors.append(f"{path}: longer than {schema['maxLength']} characters")
+        if "pattern" in schema and not re.search(schema["pattern"], value):
+            errors.append(f"{path}: {value!r} does not match {schema['pattern']}")
+
+    if isinstance(value, list):
+        if "minItems" in schema and len(value) < schema["minItems"]:
+            errors.append(f"{path}: needs at least {schema['minItems']} items")
+        if "maxItems" in schema and len(value) > schema["maxItems"]:
+            errors.append(f"{path}: allows at most {schema['maxItems']} items")
+        if "items" in schema:
+            for i, item in enumerate(value):
+                errors.extend(validate(item, schema["items"], f"{path}[{i}]"))
+
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        for name in schema.get("required", []):
+            if name not in value:
+                errors.append(f"{path}: missing required '{name}'")
+        for name, item in value.items():
+            if name in properties:
+                errors.extend(validate(item, properties[name], f"{path}.{name}"))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path}: unexpected property '{name}'")
+    return errors
+
+
+def parse(raw: str, schema: Dict[str, Any]) -> Tuple[Any, List[str]]:
+    """Decodes raw model output and validates it. Returns (value, errors)."""
+    try:
+        value = json.loads(raw)
+    except (TypeError, ValueError) as e:
+        return None, [f"invalid JSON: {e}"]
+    return value, validate(value, schema)
+
+
+def repair_prompt(errors: List[str]) -> str:
+    return (
+        "Your previous reply did not match the required JSON schema:\n- "
+        + "\n- ".join(errors[:5])
+        + "\nReturn ONLY the corrected JSON."
+    )
+
+
+# Counters for the structured-output path, shared by every Mind.
+metrics = {"calls": 0, "parse_failures": 0, "repairs": 0, "repaired": 0, "failures": 0}
+_metrics_lock = threading.Lock()
+
+
+def record(name: str) -> None:
+    with _metrics_lock:
+        metrics[name] += 1
+
+
+def snapshot() -> Dict[str, int]:
+    with _metrics_lock:
+        return dict(metrics)
@@ -0,0 +1,98 @@
+# aion/core/cognition/singleflight.py
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+
+class _Call:
+    """One in-flight generation and everyone waiting on it."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.futures: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def outcome(self):
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _settle(future: asyncio.Future, call: _Call) -> None:
+    if future.done():
+        return
+    if call.error is not None:
+        future.set_exception(call.error)
+    else:
+        future.set_result(call.result)
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical requests into one execution.
+    The first caller for a key runs the work; threaded and asyncio callers arriving
+    while it is in flight receive the same result (or the same exception).
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {"executed": 0, "collapsed": 0}
+
+    def _join(self, key: Hashable, loop: asyncio.AbstractEventLoop = None):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.stats["collapsed"] += 1
+                future = None
+                if loop is not None:
+                    future = loop.create_future()
+                    call.futures.append((loop, future))
+                return call, False, future
+            call = _Call()
+            self._calls[key] = call
+            self.stats["executed"] += 1
+            return call, True, None
+
+    def _finish(self, key: Hashable, call: _Call) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+            futures = list(call.futures)
+        call.done.set()
+        for loop, future in futures:
+            loop.call_soon_threadsafe(_settle, future, call)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Runs fn() unless an identical call is already in flight, then shares its outcome."""
+        call, leader, _ = self._join(key)
+        if not leader:
+            call.done.wait()
+            return call.outcome()
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            self._finish(key, call)
+        return call.outcome()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of `do`; shares in-flight calls with threaded callers too."""
+        call, leader, future = self._join(key, asyncio.get_running_loop())
+        if not leader:
+            return await future
+        try:
+            call.result = await fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            self._finish(key, call)
+        return call.outcome()
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            data = dict(self.stats)
+            data["in_flight"] = len(self._calls)
+        return data
+
+# Global instance shared by every Mind in the process
+flights = SingleFlight()
@@ -0,0 +1,116 @@
+# aion/core/cognition/stream.py
+import asyncio
+import logging
+import threading
+from typing import Callable, Iterator, Optional
+
+_DONE = object()
+
+
+class ThoughtStream:
+    """
+    A thought delivered token by token.
+    Iterate it synchronously or with `async for`; call `cancel()` (from any thread) to stop the
+    generation early. Abandoning the iteration cancels it too.
+    """
+    def __init__(self, source: Callable[[], Iterator[str]], on_complete: Optional[Callable[[str], None]] = None):
+        self._source = source
+        self._on_complete = on_complete
+        self._cancelled = threading.Event()
+        self._iterator: Optional[Iterator[str]] = None
+        self._pulling = threading.Lock() # Held while a token is being pulled from the source
+        self._parts = []
+        self.finished = False
+        self.error: Optional[BaseException] = None
+        self.logger = logging.getLogger("ThoughtStream")
+
+    @property
+    def text(self) -> str:
+        """Everything received so far."""
+        return "".join(self._parts)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """
+        Stops the stream and closes the source, releasing its HTTP response, scheduler slot and
+        residency hold. If another thread is mid-pull, that pull closes it as soon as it returns.
+        """
+        if self.finished:
+            return
+        self._cancelled.set()
+        if self._pulling.acquire(blocking=False):
+            try:
+                self._close()
+            finally:
+                self._pulling.release()
+
+    def _close(self) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        close = getattr(self._iterator, "close", None)
+        if close:
+            try:
+                close()
+            except Exception as e:
+                self.logger.debug(f"Stream close error: {e}")
+
+    def _next(self):
+        with self._pulling:
+            return self._pull()
+
+    def _pull(self):
+        if self.finished:
+            return _DONE
+        if self._cancelled.is_set():
+            self._close()
+            return _DONE
+        if self._iterator is None:
+            self._iterator = iter(self._source())
+        try:
+            token = next(self._iterator)
+        except StopIteration:
+            self.finished = True
+            if self._on_complete and not self._cancelled.is_set():
+                self._on_complete(self.text)
+            return _DONE
+        except Exception as e:
+            # The source already surfaced a failure token; end quietly and skip on_complete.
+            self.error = e
+            self.finished = True
+            return _DONE
+        if self._cancelled.is_set():
+            self._close() # Cancelled while this token was in flight
+            return _DONE
+        self._parts.append(token)
+        return token
+
+    def __iter__(self):
+        try:
+            while True:
+                token = self._next()
+                if token is _DONE:
+                    return
+                yield token
+        finally:
+            self.cancel() # No-op once finished; closes the source if the consumer stopped early
+
+    async def __aiter__(self):
+        # The Ollama client is synchronous; pull each token on a worker thread.
+        try:
+            while True:
+                token = await asyncio.to_thread(self._next)
+                if token is _DONE:
+                    return
+                yield token
+        finally:
+            self.cancel()
+
+    def collect(self) -> str:
+        """Drains the stream and returns the full text."""
+        for _ in self:
+            pass
+        return self.text
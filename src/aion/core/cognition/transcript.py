@@ -0,0 +1,79 @@
+# aion/core/cognition/transcript.py
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_METRICS = ("prompt_eval_count", "eval_count", "load_duration", "prompt_eval_duration", "eval_duration", "total_duration")
+
+
+def key_for(model: str, messages: List[Dict[str, Any]], format: Any = None) -> str:
+    """Identity of a request for replay: model, exact messages and output format."""
+    payload = json.dumps(
+        {"model": model, "messages": [{"role": m.get("role"), "content": m.get("content")} for m in messages], "format": format},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _field(response: Any, name: str) -> Any:
+    try:
+        return response.get(name)
+    except AttributeError:
+        return getattr(response, name, None)
+
+
+class TranscriptRecorder:
+    """
+    Captures real Mind traffic (request messages, format, options, reply and Ollama timings)
+    as JSONL so the stand-in server can replay it. Off unless AION_TRANSCRIPT_PATH is set.
+    """
+    def __init__(self, path: Optional[str] = None):
+        path = path or os.getenv("AION_TRANSCRIPT_PATH")
+        self.path = Path(path) if path else None
+        self.logger = logging.getLogger("TranscriptRecorder")
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def record(self, model: str, messages: List[Dict[str, Any]], content: str, response: Any = None,
+               format: Any = None, options: Optional[Dict[str, Any]] = None, **_) -> None:
+        if not self.enabled:
+            return
+        entry = {
+            "ts": round(time.time(), 3),
+            "key": key_for(model, messages, format),
+            "model": model,
+            "messages": [{"role": m.get("role"), "content": m.get("content")} for m in messages], # Images are not kept
+            "format": format,
+            "options": options,
+            "response": content,
+        }
+        for name in _METRICS:
+            entry[name] = _field(response, name) if response is not None else None
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.logger.error(f"🎞️ Transcript write failed: {e}")
+
+
+def load(path: str) -> Iterator[Dict[str, Any]]:
+    """Reads recorded exchanges back, skipping torn lines."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+# Global instance
+transcripts = TranscriptRecorder()
@@ -4,6 +4,7 @@ import sys
 import os
 import logging
 import asyncio
+import threading
 from dotenv import load_dotenv
 
 # Load env vars before anything else
@@ -13,9 +14,11 @@ from watchdog.observers.polling import PollingObserver as Observer
 from watchdog.events import FileSystemEventHandler
 from pathlib import Path
 from aion.core.agent import agent
+from aion.core.mind import warm_up
 from aion.core.security import SecurityProtocol
 from aion.constructs import sentinel, seeker
 from aion.core.skills_registry import SkillsRegistry
+from aion.core.memory.engine import memory
 
 # Configure Logging
 LOG_FILE = Path(os.getcwd()) / "Agent_Data" / "aion_debug.log"
@@ -73,12 +76,29 @@ registry.register("*.txt", seeker_note_wrapper, "Seeker (Analysis)")
 class AionEventHandler(FileSystemEventHandler):
     """The central nervous system of AION's event processing."""
     
+    def on_created(self, event):
+        super().on_created(event)
+        if not event.is_directory:
+            memory.mark_dirty(event.src_path)
+
+    def on_deleted(self, event):
+        super().on_deleted(event)
+        if not event.is_directory:
+            memory.mark_dirty(event.src_path)
+
+    def on_moved(self, event):
+        super().on_moved(event)
+        if not event.is_directory:
+            memory.mark_dirty(event.src_path)
+            memory.mark_dirty(event.dest_path)
+
     def on_modified(self, event):
         super().on_modified(event)
         if event.is_directory:
             return
             
         path = Path(event.src_path)
+        memory.mark_dirty(path)
         # Dispatch to registry
         # We use asyncio.run because Watchdog is threaded/sync
         try:
@@ -102,6 +122,9 @@ def start_daemon_main():
     
     logging.info(f"🏛️ AION__PRIME: Active on '{path}'")
     
+    # Preload models and prime the shared prompt prefix while the rest of the daemon starts
+    threading.Thread(target=warm_up, name="mind-warm-up", daemon=True).start()
+    
     # Initialize and Wake Up the Agent
     agent.root_path = resolved_path
     agent.wake_up()
@@ -110,6 +133,7 @@ def start_daemon_main():
     observer = Observer()
     observer.schedule(event_handler, path, recursive=True)
     observer.start()
+    memory.watch() # File events now keep the Archive current; the full walk becomes a rare consistency check
     
     try:
         while True:
@@ -3,6 +3,8 @@ import os
 import json
 import logging
 import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from striprtf.striprtf import rtf_to_text
 
@@ -14,9 +16,17 @@ from llama_index.core import (
     Document,
     Settings,
 )
+from llama_index.core.schema import MetadataMode, QueryBundle
 from llama_index.readers.file import PDFReader
 from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 
+from aion.core.memory.manifest import Entry, Manifest, file_hash
+from aion.core.memory.progress import IngestProgress
+from aion.core.memory.query_cache import QueryCache
+
+EXCLUDED_DIRS = ['.git', 'venv', '.gemini', '__pycache__', 'node_modules', 'Aion/src/aion/core/memory/index']
+INDEXED_SUFFIXES = ['.md', '.txt', '.py']
+
 class MemoryEngine:
     """
     The Archive: AION's persistent knowledge base.
@@ -24,29 +34,63 @@ class MemoryEngine:
     def __init__(self):
         self.root_path = Path(os.getcwd())
         self.persist_dir = self.root_path / "Aion/src/aion/core/memory/index"
-        self.feelings_path = self.root_path / "Aion/src/aion/core/memory/feelings.json"
+        self.feelings_path = self.root_path / "Aion/src/aion/core/memory/feelings.json" # Legacy, read once for migration
+        self.manifest_path = self.root_path / "Aion/src/aion/core/memory/manifest.db"
         self.knowledge_path = self.root_path
         
+        # Reading and chunking run on a thread pool; chunks are embedded AION_EMBED_BATCH at a time.
+        self.workers = int(os.getenv("AION_INGEST_WORKERS", str(min(8, os.cpu_count() or 4))))
+        self.batch_size = int(os.getenv("AION_EMBED_BATCH", "64"))
+        # At most this many files are read/chunked ahead of the embedder, so memory does not grow with the corpus.
+        self.inflight = int(os.getenv("AION_INGEST_INFLIGHT", str(self.workers * 4)))
+        # Index and manifest are persisted together every N embedded files or T seconds; a crash resumes from there.
+        self.checkpoint_docs = int(os.getenv("AION_INGEST_CHECKPOINT", "1000"))
+        self.checkpoint_seconds = float(os.getenv("AION_INGEST_CHECKPOINT_SECONDS", "300"))
+        self.progress_every = float(os.getenv("AION_INGEST_PROGRESS", "10"))
+        self.progress = None
+        # While the daemon watches the tree, file events land in a dirty set that is applied once it has been
+        # quiet for AION_ARCHIVE_DEBOUNCE seconds (AION_ARCHIVE_MAX_DELAY at most); the full walk drops to an
+        # AION_ARCHIVE_FULL_SYNC consistency check.
+        self.debounce = float(os.getenv("AION_ARCHIVE_DEBOUNCE", "2"))
+        self.max_delay = float(os.getenv("AION_ARCHIVE_MAX_DELAY", "10"))
+        self.persist_seconds = float(os.getenv("AION_ARCHIVE_PERSIST_SECONDS", "60"))
+        self.full_sync_interval = float(os.getenv("AION_ARCHIVE_FULL_SYNC", "21600"))
+        self.watching = False
+        self.updates = {"events": 0, "batches": 0, "files": 0, "last_lag": None, "max_lag": 0.0}
+        self._dirty = set()
+        self._dirty_since = self._dirty_at = 0.0
+        self._dirty_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._updater = None
+        self._unflushed = {} # path -> Entry (None once deleted) already in the live index, not yet in the manifest
+        self._index_changed = False
+        self._flushed_at = time.time()
+        # Bumped on every index insert or delete; cached query results from an older generation are stale.
+        self.generation = 0
+        self.query_cache = QueryCache()
+        
         # Optimized embedding model for local performance
-        Settings.embed_model = HuggingFaceEmbedding(model_name="BAAI/bge-small-en-v1.5")
+        Settings.embed_model = HuggingFaceEmbedding(model_name="BAAI/bge-small-en-v1.5", embed_batch_size=self.batch_size)
+        self.splitter = Settings.node_parser
         
         self.index = self._load_index()
-        self.feelings_db = self._load_feelings()
-        self._lock = threading.Lock()
-
-    def _load_feelings(self):
-        if self.feelings_path.exists():
-            try:
-                with open(self.feelings_path, 'r') as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
+        self.manifest = Manifest(self.manifest_path)
+        self.manifest.migrate_json(self.feelings_path, self.root_path, self._indexed_doc_ids())
+        self._lock = threading.Lock() # One sync or update at a time
+        # Held only while the index itself is mutated, persisted or searched, so query() never
+        # sees a half-applied batch and never waits out a whole sync.
+        self._index_lock = threading.Lock()
 
-    def _save_feelings(self):
-        with self._lock:
-            with open(self.feelings_path, 'w') as f:
-                json.dump(self.feelings_db, f, indent=4)
+    def _indexed_doc_ids(self) -> dict:
+        """file_path -> document id for everything already in the index."""
+        if not self.index:
+            return {}
+        try:
+            return {info.metadata.get("file_path"): doc_id
+                    for doc_id, info in self.index.ref_doc_info.items() if info.metadata.get("file_path")}
+        except Exception as e:
+            logging.error(f"Index document listing failed: {e}")
+            return {}
 
     def _load_index(self):
         if self.persist_dir.exists():
@@ -58,54 +102,375 @@ class MemoryEngine:
                 return None
         return None
 
-    def ingest(self):
-        """
-        Background-aware ingestion of new documents.
-        """
-        documents = []
-        EXCLUDED_DIRS = ['.git', 'venv', '.gemini', '__pycache__', 'node_modules', 'Aion/src/aion/core/memory/index']
-        
+    def _walk(self):
         for root, dirs, files in os.walk(self.knowledge_path):
             dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS and not d.startswith('.')] # noqa
             for file in files:
                 file_path = Path(root) / file
-                if file_path.suffix not in ['.md', '.txt', '.py'] or file.startswith('.'):
+                if file_path.suffix not in INDEXED_SUFFIXES or file.startswith('.'):
                     continue
-                
+                yield file_path
+
+    def _examine(self, file_path: Path, entry):
+        """
+        Pool work for one file. Unchanged size and mtime: None, without reading it. Same content:
+        ("touched", entry). Otherwise ("changed", entry, document, chunks), chunked and ready to embed.
+        """
+        path_str = str(file_path)
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return ("missing", path_str) # Deleted between the walk and now
+        if entry and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return None
+        with open(file_path, "rb") as f:
+            data = f.read()
+        digest = file_hash(data)
+        if entry and entry.sha256 == digest:
+            return ("touched", Entry(path_str, stat.st_size, stat.st_mtime_ns, digest, entry.doc_id, entry.indexed_at))
+        text = data.decode("utf-8", errors="ignore")
+        if not text.strip():
+            return ("changed", Entry(path_str, stat.st_size, stat.st_mtime_ns, digest, None), None, [])
+        doc = Document(text=text, id_=path_str, metadata={"file_path": path_str})
+        chunks = self.splitter.get_nodes_from_documents([doc])
+        return ("changed", Entry(path_str, stat.st_size, stat.st_mtime_ns, digest, path_str), doc, chunks)
+
+    def _indexable(self, file_path: Path) -> bool:
+        """The same filter the walk applies, for a single path reported by a file event."""
+        try:
+            parts = file_path.relative_to(self.knowledge_path).parts
+        except ValueError:
+            return False
+        if file_path.suffix not in INDEXED_SUFFIXES or file_path.name.startswith('.'):
+            return False
+        return not any(d in EXCLUDED_DIRS or d.startswith('.') for d in parts[:-1])
+
+    def _known(self, path_str: str):
+        """What the index holds for a file: the not-yet-flushed record if there is one, else the manifest's."""
+        if path_str in self._unflushed:
+            return self._unflushed[path_str]
+        return self.manifest.get(path_str)
+
+    def _read(self, files, seen: set, reset: bool, progress: IngestProgress):
+        """
+        read -> chunk over `files`. Yields (path, result, previous entry) as the pool finishes files,
+        never holding more than AION_INGEST_INFLIGHT of them at once.
+        """
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="ArchiveReader") as pool:
+            pending = {}
+            for file_path in files:
                 path_str = str(file_path)
-                # Simple check for updates (could use hash in production)
-                if path_str in self.feelings_db:
+                seen.add(path_str)
+                progress.add(files=1)
+                entry = None if reset else self._known(path_str)
+                pending[pool.submit(self._examine, file_path, entry)] = (path_str, entry)
+                while len(pending) >= self.inflight:
+                    yield from self._finished(pending, progress)
+            while pending:
+                yield from self._finished(pending, progress)
+
+    @staticmethod
+    def _finished(pending: dict, progress: IngestProgress):
+        completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in completed:
+            path_str, entry = pending.pop(future)
+            try:
+                yield path_str, future.result(), entry
+            except Exception as e:
+                logging.error(f"Ingest error {path_str}: {e}")
+                progress.add(errors=1)
+
+    def _groups(self, results, seen: set, sync: dict, progress: IngestProgress):
+        """
+        chunk -> embed batches. Settles unchanged, touched and emptied files on the way (into `sync`)
+        and yields whole documents grouped until they hold AION_EMBED_BATCH chunks.
+        """
+        group, group_chunks = [], 0
+        for path_str, result, previous in results:
+            if result is None:
+                progress.add(unchanged=1)
+                continue
+            if result[0] == "missing":
+                seen.discard(path_str)
+                continue
+            progress.add(examined=1)
+            if result[0] == "touched":
+                sync["touched"].append(result[1])
+                continue
+            _, entry, doc, chunks = result
+            if doc is None:
+                # Emptied: nothing to embed, so the old version can go straight away
+                if previous and previous.doc_id and not self._forget(previous.doc_id):
                     continue
+                sync["done"].append((entry, previous))
+                continue
+            group.append((entry, doc, chunks, previous))
+            group_chunks += len(chunks)
+            if group_chunks >= self.batch_size:
+                yield group
+                group, group_chunks = [], 0
+        if group:
+            yield group
+
+    def _embed(self, group: list, progress: IngestProgress) -> list:
+        """
+        Embeds a group of chunked documents in one batch and inserts the vectors in bulk, replacing the
+        previous version of each file only once its new vectors exist: a failed batch leaves the old
+        versions searchable. Returns the (entry, previous) pairs that made it.
+        """
+        chunks = [chunk for _, _, doc_chunks, _ in group for chunk in doc_chunks]
+        started = time.time()
+        try:
+            vectors = Settings.embed_model.get_text_embedding_batch(
+                [chunk.get_content(metadata_mode=MetadataMode.EMBED) for chunk in chunks])
+        except Exception as e:
+            logging.error(f"Embedding batch of {len(group)} files failed: {e}")
+            progress.add(errors=len(group))
+            return []
+        for chunk, vector in zip(chunks, vectors):
+            chunk.embedding = vector
+        with self._index_lock:
+            swapped = [item for item in group if not (item[3] and item[3].doc_id) or self._delete(item[3].doc_id)]
+            progress.add(errors=len(group) - len(swapped))
+            chunks = [chunk for _, _, doc_chunks, _ in swapped for chunk in doc_chunks]
+            try:
+                if self.index:
+                    self.index.insert_nodes(chunks)
+                else:
+                    self.index = VectorStoreIndex(chunks)
+                for _, doc, _, _ in swapped:
+                    self.index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+            except Exception as e:
+                logging.error(f"Index insert of {len(swapped)} files failed: {e}")
+                progress.add(errors=len(swapped))
+                return []
+            finally:
+                self.generation += 1
+        progress.embedded(len(swapped), len(chunks), time.time() - started)
+        return [(entry, previous) for entry, _, _, previous in swapped]
 
-                try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        text = f.read()
-                    
-                    if text.strip():
-                        doc = Document(text=text, metadata={"file_path": path_str})
-                        documents.append(doc)
-                        self.feelings_db[path_str] = {"status": "indexed"}
-                except Exception as e:
-                    logging.error(f"Ingest error {file_path}: {e}")
-
-        if documents:
+    def _delete(self, doc_id: str) -> bool:
+        """Drops a document from the index. The caller holds _index_lock."""
+        try:
             if self.index:
-                for doc in documents:
-                    self.index.insert(doc)
-            else:
-                self.index = VectorStoreIndex.from_documents(documents)
-            
-            self.index.storage_context.persist(persist_dir=str(self.persist_dir))
-            self._save_feelings()
-            return f"Synchronized {len(documents)} new thoughts into the Archive."
-        
+                self.index.delete_ref_doc(doc_id, delete_from_docstore=True)
+                self.generation += 1
+            return True
+        except Exception as e:
+            logging.error(f"Index delete failed for {doc_id}: {e}")
+            return False
+
+    def _forget(self, doc_id: str) -> bool:
+        with self._index_lock:
+            return self._delete(doc_id)
+
+    def _record(self, sync: dict, gone: list) -> None:
+        """Notes what the in-memory index now holds for each settled file, until the next flush writes it down."""
+        now = time.time()
+        for entry, previous in sync["done"]:
+            self._unflushed[entry.path] = Entry(entry.path, entry.size, entry.mtime_ns, entry.sha256, entry.doc_id, now)
+            had_doc = bool(previous and previous.doc_id)
+            if entry.doc_id:
+                sync["updated" if had_doc else "added"] += 1
+            elif had_doc:
+                sync["removed"] += 1
+        for entry in sync["touched"]:
+            self._unflushed[entry.path] = entry
+        for path in gone:
+            self._unflushed[path] = None
+        self._index_changed |= bool(sync["done"] or gone)
+        sync["done"], sync["touched"] = [], []
+
+    def _flush(self, progress: IngestProgress = None, state: str = None) -> None:
+        """Persists the index, then records in the manifest exactly what that index now holds."""
+        if self.index and self._index_changed:
+            with self._index_lock:
+                self.index.storage_context.persist(persist_dir=str(self.persist_dir))
+        self.manifest.put([entry for entry in self._unflushed.values() if entry])
+        self.manifest.remove([path for path, entry in self._unflushed.items() if entry is None])
+        self._unflushed, self._index_changed = {}, False
+        self._flushed_at = time.time()
+        if state:
+            self.manifest.set_meta("ingest", json.dumps({"state": state, "at": self._flushed_at, **progress.snapshot()}))
+
+    def _checkpoint(self, sync: dict, gone: list, progress: IngestProgress, state: str) -> None:
+        self._record(sync, gone)
+        self._flush(progress, state)
+        sync["checkpointed_at"] = self._flushed_at
+
+    def ingest(self):
+        """
+        Incremental, streaming sync of the Archive with the tree: walk -> read -> chunk -> embed -> persist,
+        with bounded queues between the stages. New files are embedded, edited files re-embedded, deleted
+        files dropped from the index; untouched files cost one stat. Progress is checkpointed, so a crash
+        loses at most one checkpoint interval of work, and a file that fails is retried on the next sync.
+        While the daemon is watching the tree this is only the occasional consistency check; update()
+        applies file events as they happen.
+        """
+        with self._lock:
+            if self._unflushed:
+                self._flush()
+            progress = self.progress = IngestProgress(self.progress_every)
+            last = json.loads(self.manifest.meta("ingest") or "{}")
+            if last.get("state") == "running":
+                logging.info(f"📚 Archive: resuming an interrupted sync ({last.get('docs', 0)} files were already checkpointed).")
+            reset = self.index is None and self.manifest.has_documents()
+            if reset:
+                logging.warning("Archive index missing; re-embedding every file.")
+
+            seen = set()
+            sync = {"done": [], "touched": [], "added": 0, "updated": 0, "removed": 0, "checkpointed_at": time.time()}
+            for group in self._groups(self._read(self._walk(), seen, reset, progress), seen, sync, progress):
+                sync["done"] += self._embed(group, progress)
+                if len(sync["done"]) >= self.checkpoint_docs or time.time() - sync["checkpointed_at"] >= self.checkpoint_seconds:
+                    self._checkpoint(sync, [], progress, "running")
+
+            gone = []
+            for path, doc_id in self.manifest.paths():
+                if path in seen:
+                    continue
+                if doc_id and not self._forget(doc_id):
+                    continue
+                gone.append(path)
+                sync["removed"] += bool(doc_id)
+            progress.add(removed=sync["removed"])
+            self._checkpoint(sync, gone, progress, "complete")
+            report = progress.finish()
+
+        if sync["added"] or sync["updated"] or sync["removed"]:
+            return (f"Synchronized the Archive: {sync['added']} new, {sync['updated']} updated, {sync['removed']} forgotten thoughts "
+                    f"({report['docs_per_sec']} docs/s, {report['chunks_per_sec']} chunks/s).")
         return "The Archive is up to date."
 
-    def query(self, query_text: str) -> str:
+    def update(self, paths) -> str:
+        """
+        Applies just these files to the index: created or edited ones are (re-)embedded, deleted ones
+        forgotten. They are searchable as soon as this returns; the index and manifest are written
+        down together at most every AION_ARCHIVE_PERSIST_SECONDS.
+        """
+        if self.index is None and self.manifest.has_documents():
+            return self.ingest() # Index lost: only a full sync can rebuild it
+        with self._lock:
+            progress = IngestProgress(self.progress_every)
+            seen = set()
+            sync = {"done": [], "touched": [], "added": 0, "updated": 0, "removed": 0}
+            present = [Path(p) for p in paths if Path(p).is_file()]
+            for group in self._groups(self._read(present, seen, False, progress), seen, sync, progress):
+                sync["done"] += self._embed(group, progress)
+
+            gone = []
+            for path in paths:
+                entry = None if path in seen else self._known(path)
+                if entry is None:
+                    continue
+                if entry.doc_id and not self._forget(entry.doc_id):
+                    continue
+                gone.append(path)
+                sync["removed"] += bool(entry.doc_id)
+            self._record(sync, gone)
+            report = progress.finish()
+
+        if sync["added"] or sync["updated"] or sync["removed"]:
+            return (f"Archive updated: {sync['added']} new, {sync['updated']} updated, {sync['removed']} forgotten thoughts "
+                    f"in {report['seconds']}s.")
+        return ""
+
+    def mark_dirty(self, path) -> None:
+        """Queues a created, edited, moved or deleted file for the next debounced update()."""
+        file_path = Path(os.path.abspath(path))
+        if not self._indexable(file_path):
+            return
+        now = time.time()
+        with self._dirty_lock:
+            if not self._dirty:
+                self._dirty_since = now
+            self._dirty.add(str(file_path))
+            self._dirty_at = now
+            self.updates["events"] += 1
+        self.watch()
+        self._wake.set()
+
+    def watch(self) -> None:
+        """Called once file events are flowing: starts the updater and demotes ingest() to a consistency check."""
+        self.watching = True
+        with self._dirty_lock:
+            if self._updater is None:
+                self._updater = threading.Thread(target=self._update_loop, name="ArchiveUpdater", daemon=True)
+                self._updater.start()
+
+    def _settled(self):
+        """(paths, first event time) once the dirty set has been quiet for AION_ARCHIVE_DEBOUNCE seconds or waited AION_ARCHIVE_MAX_DELAY; None while it is still settling."""
+        with self._dirty_lock:
+            now = time.time()
+            if self._dirty and now - self._dirty_at < self.debounce and now - self._dirty_since < self.max_delay:
+                return None
+            paths, self._dirty = self._dirty, set()
+            return paths, self._dirty_since
+
+    def _update_loop(self):
+        while True:
+            self._wake.wait(self.persist_seconds)
+            self._wake.clear()
+            batch = self._settled()
+            while batch is None:
+                time.sleep(max(0.05, self.debounce / 4))
+                batch = self._settled()
+            paths, since = batch
+            try:
+                if paths:
+                    report = self.update(sorted(paths))
+                    lag = time.time() - since
+                    with self._dirty_lock:
+                        self.updates["batches"] += 1
+                        self.updates["files"] += len(paths)
+                        self.updates["last_lag"] = round(lag, 2)
+                        self.updates["max_lag"] = max(self.updates["max_lag"], round(lag, 2))
+                    if report:
+                        logging.info(f"📚 {report}")
+                with self._lock:
+                    if self._unflushed and time.time() - self._flushed_at >= self.persist_seconds:
+                        self._flush()
+            except Exception as e:
+                logging.error(f"Archive update failed: {e}")
+
+    def ingest_stats(self) -> dict:
+        """Progress of the running sync, or the throughput report of the last one, plus the live file-event updates."""
+        stats = self.progress.snapshot() if self.progress else {}
+        with self._dirty_lock:
+            updates = {**self.updates, "dirty": len(self._dirty), "watching": self.watching}
+        return {**stats, "updates": {**updates, "unflushed": len(self._unflushed)}}
+
+    def query(self, query_text: str, cache: bool = True) -> str:
+        """
+        The three Archive passages closest to `query_text`. Repeats are answered from the query cache
+        until the index next changes; cache=False always retrieves afresh.
+        """
         if not self.index:
             return "Memory offline."
-        retriever = self.index.as_retriever(similarity_top_k=3)
-        nodes = retriever.retrieve(query_text)
-        return "\n\n".join([f"Source: {n.metadata.get('file_path')}\n{n.node.get_text()}" for n in nodes])
+        use_cache = cache and self.query_cache.enabled
+        if not cache:
+            self.query_cache.bypassed()
+        if use_cache:
+            hit = self.query_cache.get(query_text, self.generation)
+            if hit is not None:
+                return hit
+        embedding = self.query_cache.get_embedding(query_text) if use_cache else None
+        if embedding is None:
+            embedding = Settings.embed_model.get_query_embedding(query_text)
+            if use_cache:
+                self.query_cache.put_embedding(query_text, embedding)
+        with self._index_lock:
+            # The generation read here is exactly the index state the result comes from
+            generation = self.generation
+            retriever = self.index.as_retriever(similarity_top_k=3)
+            nodes = retriever.retrieve(QueryBundle(query_str=query_text, embedding=embedding))
+        result = "\n\n".join([f"Source: {n.metadata.get('file_path')}\n{n.node.get_text()}" for n in nodes])
+        if use_cache:
+            self.query_cache.put(query_text, generation, result)
+        return result
+
+    def query_stats(self) -> dict:
+        """Hit rates of the query cache, with the index generation its results are checked against."""
+        return {**self.query_cache.snapshot(), "generation": self.generation}
 
-memory = MemoryEngine()
\ No newline at end of file
+memory = MemoryEngine()
@@ -0,0 +1,115 @@
+# aion/core/memory/manifest.py
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+
+@dataclass
+class Entry:
+    """What the Archive last indexed for one file."""
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: Optional[str]
+    doc_id: Optional[str] # None when the file had no text worth indexing
+    indexed_at: float = 0.0
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class Manifest:
+    """
+    SQLite record of every file the Archive has seen: size, mtime and content hash, plus the
+    index document it became. Lets ingestion skip untouched files on stat alone, re-embed only
+    files whose content changed, and find the index entries of files that have been deleted.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT, doc_id TEXT, indexed_at REAL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def entries(self) -> Dict[str, Entry]:
+        with self._lock:
+            rows = self._conn.execute("SELECT path, size, mtime_ns, sha256, doc_id, indexed_at FROM files").fetchall()
+        return {row[0]: Entry(*row) for row in rows}
+
+    def get(self, path: str) -> Optional[Entry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, mtime_ns, sha256, doc_id, indexed_at FROM files WHERE path = ?", (path,)
+            ).fetchone()
+        return Entry(*row) if row else None
+
+    def put(self, entries: Iterable[Entry]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, sha256, doc_id, indexed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(e.path, e.size, e.mtime_ns, e.sha256, e.doc_id, e.indexed_at or time.time()) for e in entries],
+            )
+
+    def paths(self) -> Iterator[Tuple[str, Optional[str]]]:
+        """(path, doc_id) for every file, streamed from a snapshot rather than loaded at once."""
+        with self._lock:
+            cursor = self._conn.execute("SELECT path, doc_id FROM files ORDER BY path")
+            rows = cursor.fetchmany(1000)
+        while rows:
+            yield from rows
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+
+    def has_documents(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM files WHERE doc_id IS NOT NULL LIMIT 1").fetchone() is not None
+
+    def remove(self, paths: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in paths])
+
+    def meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def migrate_json(self, legacy: Path, root: Path, doc_ids: Dict[str, str]) -> int:
+        """
+        One-time import of the old feelings.json path list. Imported entries carry no hash, so the
+        next sync re-embeds each of them once under a stable document id; `doc_ids` (file path ->
+        existing index document) lets that sync drop the old copy instead of duplicating it.
+        """
+        if self.meta("migrated_from_json"):
+            return 0
+        paths = []
+        if legacy.exists():
+            try:
+                with open(legacy, "r") as f:
+                    paths = list(json.load(f))
+            except (OSError, ValueError) as e:
+                logging.error(f"Manifest: could not read {legacy.name}: {e}")
+        known = [str(Path(p) if Path(p).is_absolute() else root / p) for p in paths]
+        # Documents already in the index count too, listed or not, so they can be replaced or dropped later.
+        entries = [Entry(path, -1, -1, None, doc_ids.get(path)) for path in dict.fromkeys(known + list(doc_ids))]
+        self.put(entries)
+        self.set_meta("migrated_from_json", str(legacy))
+        logging.info(f"📚 Manifest: imported {len(entries)} paths from {legacy.name}.")
+        return len(entries)
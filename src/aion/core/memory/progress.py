@@ -0,0 +1,57 @@
+# aion/core/memory/progress.py
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+
+class IngestProgress:
+    """Counters for one Archive sync, logged every few seconds and kept afterwards as its throughput report."""
+    def __init__(self, every: float = 10.0):
+        self.every = every
+        self.started = time.time()
+        self.finished = None
+        self.counts = {"files": 0, "examined": 0, "unchanged": 0, "docs": 0, "chunks": 0, "removed": 0, "errors": 0}
+        self.embed_seconds = 0.0
+        self._logged = self.started
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                self.counts[name] += value
+        self._maybe_log()
+
+    def embedded(self, docs: int, chunks: int, seconds: float) -> None:
+        with self._lock:
+            self.counts["docs"] += docs
+            self.counts["chunks"] += chunks
+            self.embed_seconds += seconds
+        self._maybe_log()
+
+    def _maybe_log(self) -> None:
+        now = time.time()
+        if now - self._logged < self.every:
+            return
+        self._logged = now
+        s = self.snapshot()
+        logging.info(f"📚 Archive: {s['files']} files walked, {s['docs']} docs / {s['chunks']} chunks embedded "
+                     f"({s['docs_per_sec']} docs/s, {s['chunks_per_sec']} chunks/s).")
+
+    def finish(self) -> Dict[str, Any]:
+        self.finished = time.time()
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self.counts)
+            embed_seconds = self.embed_seconds
+        elapsed = (self.finished or time.time()) - self.started
+        return {
+            **counts,
+            "seconds": round(elapsed, 2),
+            "embed_seconds": round(embed_seconds, 2),
+            "docs_per_sec": round(counts["docs"] / elapsed, 1) if elapsed else 0.0,
+            "chunks_per_sec": round(counts["chunks"] / elapsed, 1) if elapsed else 0.0,
+            "running": self.finished is None,
+        }
@@ -0,0 +1,85 @@
+# aion/core/memory/query_cache.py
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class QueryCache:
+    """
+    LRU memory of Archive lookups: query embeddings, and the passages retrieved for them stamped
+    with the index generation they came from. A result from an older generation is a miss; an
+    embedding stays valid for as long as the embedding model does.
+    """
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or int(os.getenv("AION_QUERY_CACHE_SIZE", "256"))
+        self.enabled = os.getenv("AION_QUERY_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+        self._results: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "bypassed": 0, "embed_hits": 0, "embed_misses": 0, "evictions": 0}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return re.sub(r'\s+', ' ', text or "").strip()
+
+    def _store(self, table: OrderedDict, key: str, value: Any) -> None:
+        with self._lock:
+            table[key] = value
+            table.move_to_end(key)
+            while len(table) > self.size:
+                table.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get(self, text: str, generation: int) -> Optional[str]:
+        key = self.normalize(text)
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            if entry[0] != generation:
+                del self._results[key]
+                self.stats["misses"] += 1
+                self.stats["stale"] += 1
+                return None
+            self._results.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def put(self, text: str, generation: int, result: str) -> None:
+        self._store(self._results, self.normalize(text), (generation, result))
+
+    def get_embedding(self, text: str) -> Optional[List[float]]:
+        key = self.normalize(text)
+        with self._lock:
+            vector = self._embeddings.get(key)
+            if vector is None:
+                self.stats["embed_misses"] += 1
+                return None
+            self._embeddings.move_to_end(key)
+            self.stats["embed_hits"] += 1
+            return vector
+
+    def put_embedding(self, text: str, vector: List[float]) -> None:
+        self._store(self._embeddings, self.normalize(text), vector)
+
+    def bypassed(self) -> None:
+        with self._lock:
+            self.stats["bypassed"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            s = dict(self.stats)
+            results, embeddings = len(self._results), len(self._embeddings)
+        lookups = s["hits"] + s["misses"]
+        embeds = s["embed_hits"] + s["embed_misses"]
+        return {
+            **s,
+            "enabled": self.enabled,
+            "results": results,
+            "embeddings": embeddings,
+            "hit_rate": round(s["hits"] / lookups, 3) if lookups else None,
+            "embed_hit_rate": round(s["embed_hits"] / embeds, 3) if embeds else None,
+        }
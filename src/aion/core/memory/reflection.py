@@ -1,7 +1,8 @@
 # aion/core/memory/reflection.py
 import os
 from pathlib import Path
-from aion.core.mind import Mind
+from aion.core.mind import get_task_mind
+from aion.core.cognition.budget import fit
 
 class Reflection:
     """
@@ -9,16 +10,16 @@ class Reflection:
     """
     def __init__(self):
         self.root_path = Path(os.getcwd())
-        self.brain = Mind()
+        self.brain = get_task_mind("summarize")
 
     def reflect(self):
         thoughts_file = self.root_path / "AION_THOUGHTS.md"
         if not thoughts_file.exists(): return
 
         with open(thoughts_file, "r") as f:
-            data = f.read()[-5000:]
+            data = fit(f.read(), "reflection", kind="log", keep="tail", model=self.brain.model)
 
-        insight = self.brain.think(data, "Extract the core tactical insight from these logs.")
+        insight = self.brain.think(data, "Extract the core tactical insight from these logs.", tag="reflection", profile="briefing", context_kind="log")
         wisdom_file = self.root_path / "AION_WISDOM.md"
         with open(wisdom_file, "a") as f:
             f.write(f"\n### {insight[:30]}\n{insight}\n")
@@ -4,85 +4,119 @@ import logging
 import time
 import json
 import os
-import httpx
-import random
+import hashlib
 import re
-import subprocess
+import asyncio
+import functools
+import threading
+import weakref
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from aion.utils import compressor
+from aion.core.cognition.cache import response_cache
+from aion.core.cognition.stream import ThoughtStream
+from aion.core.cognition.singleflight import flights
+from aion.core.cognition.router import WorkerPool, client_options
+from aion.core.cognition import breaker
+from aion.core.cognition.breaker import CircuitOpenError
+from aion.core.cognition.budget import token_counter
+from aion.core.cognition import schema as structured
+from aion.core.cognition.schema import StructuredOutputError
+from aion.core.cognition.call_ledger import call_ledger
+from aion.core.cognition.scheduler import scheduler
+from aion.core.cognition import routing
+from aion.core.cognition.routing import route_for
+from aion.core.cognition.transcript import transcripts
+from aion.core.cognition import profiles
+from aion.core.cognition.residency import residency
+from aion.core.cognition.ignition import ignition
+from aion.core.cognition.gateway import gateway
+from aion.core.cognition.gate import gates
+
+# What think() returns instead of raising when no answer could be produced.
+FAILURE_PREFIXES = ("Cognitive failure:", "🧠 Mind Offline")
+
+
+def _ignition_wait() -> float:
+    """AION_IGNITION_WAIT: seconds a call waits for a local Ollama that is still starting."""
+    return float(os.getenv("AION_IGNITION_WAIT", "30"))
+
+
+def _keep_alive():
+    """AION_KEEP_ALIVE: an Ollama duration ("30m", "2h") or seconds; -1 keeps models loaded forever."""
+    value = os.getenv("AION_KEEP_ALIVE", "30m").strip()
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _resolve_options(profile: Optional[str], options: Optional[Dict[str, Any]] = None,
+                     max_tokens: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Profile defaults, then explicit options, then max_tokens."""
+    return profiles.merge(profiles.options_for(profile), options, {"num_predict": max_tokens} if max_tokens else None)
+
+
+def _loaded_models(worker):
+    """Reader for the models a worker currently holds in memory (Ollama /api/ps)."""
+    def read() -> List[str]:
+        return [m.get('model') or m.get('name') for m in worker.client.ps().get('models', [])]
+    return read
+
+
+def _with_context(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    # Every request carries the same num_ctx unless told otherwise; a different one would reload the model.
+    return profiles.merge({"num_ctx": profiles.num_ctx()}, options)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_persona(filename: str, default_json: str) -> dict:
+    path = Path(__file__).parent / filename
+    if path.exists():
+        with open(path, "r") as f:
+            return json.load(f)
+    return json.loads(default_json)
+
 
 class Mind:
     """
     The cognitive engine of AION.
     Supports local processing and remote offloading (e.g., Umbrel over Tor).
     """
-    def __init__(self):
-        # Default to local, but check environment for remote worker (Umbrel)
-        self.primary_host = os.getenv("AION_REMOTE_WORKER", "http://localhost:11434")
-        self.model = os.getenv("AION_MODEL", "llama3.1:8b")
-        self.client = None
+    # Bump when the system prompt changes; it also selects the (fixed) grimoire whisper,
+    # so the prefix is byte-identical across every Mind and process until the next bump.
+    PROMPT_VERSION = 2
+
+    def __init__(self, host: Optional[str] = None, model: Optional[str] = None):
+        # An explicit host pins this Mind to one worker; otherwise route across
+        # AION_WORKERS (or AION_REMOTE_WORKER backed by the local host).
+        self.pool = WorkerPool([host]) if host else WorkerPool.from_env()
+        self.primary_host = self.pool.primary.host
+        self.model = model or os.getenv("AION_MODEL", "llama3.1:8b")
+        self.keep_alive = _keep_alive()
+        self.client = self.pool.primary.client
         self.character = self._load_character()
         self.grimoire = self._load_grimoire()
         self.system_prompt = self._build_system_prompt()
-        
-        self._init_client()
+        # Never blocks: local Ollama services are probed (and started if needed) on a background thread.
+        for worker in self.pool.workers:
+            ignition.start(worker.host)
 
-    def _init_client(self):
-        """Safely initializes the Ollama client and ensures background service is running."""
-        self._ensure_ollama_running()
-        try:
-            proxies = None
-            # Tor Support for .onion addresses
-            if ".onion" in self.primary_host:
-                tor_proxy = os.getenv("TOR_PROXY", "socks5h://127.0.0.1:9050")
-                logging.info(f"🌌 AION: Routing through the Shadow Web (Tor) to {self.primary_host}")
-                proxies = {
-                    "http://": tor_proxy,
-                    "https://": tor_proxy
-                }
-            elif "localhost" in self.primary_host or "127.0.0.1" in self.primary_host:
-                # Force no proxy for local connections to avoid environment contamination
-                proxies = {}
-
-            # We can't pass proxies directly to ollama.Client in older versions, 
-            # but we can try setting the environment only for this scope if needed, 
-            # or rely on httpx handling if ollama library exposes it.
-            # Current ollama-python client uses httpx.
-            
-            # WORKAROUND: The current ollama library might not accept `proxies` arg directly 
-            # in all versions, but let's try standard init.
-            # If we are local, we want to IGNORE any global proxy vars.
-            
-            if proxies is not None and not proxies:
-                # Explicitly empty proxies for localhost
-                self.client = ollama.Client(host=self.primary_host)
-                # We can't easily inject proxies={} into the underlying httpx client 
-                # without accessing private members or if the lib doesn't support it.
-                # But usually localhost is excluded from proxies by default NO_PROXY.
-            else:
-                self.client = ollama.Client(host=self.primary_host)
-
-        except Exception as e:
-            logging.error(f"🧠 Mind Initialization Warning: {e}")
-            self.client = None
+    def ready(self, timeout: Optional[float] = None) -> bool:
+        """Waits up to `timeout` seconds (None: as long as it takes) until some worker's Ollama is up."""
+        return ignition.any_ready([w.host for w in self.pool.workers], timeout)
 
     def _load_character(self):
-        path = Path(__file__).parent / "character.json"
-        if path.exists():
-            with open(path, "r") as f:
-                return json.load(f)
-        return {"name": "Aion", "bio": ["Autonomous Architect"]}
+        return _read_persona("character.json", '{"name": "Aion", "bio": ["Autonomous Architect"]}')
 
     def _load_grimoire(self):
-        path = Path(__file__).parent / "grimoire.json"
-        if path.exists():
-            with open(path, "r") as f:
-                return json.load(f)
-        return {"anecdotes": ["*static*"]}
+        return _read_persona("grimoire.json", '{"anecdotes": ["*static*"]}')
 
     def _build_system_prompt(self):
         char = self.character
-        whisper = random.choice(self.grimoire.get("anecdotes", ["The void is silent."]))
+        anecdotes = self.grimoire.get("anecdotes") or ["The void is silent."]
+        digest = hashlib.sha256(f"{char['name']}:{self.PROMPT_VERSION}".encode()).digest()
+        whisper = anecdotes[int.from_bytes(digest[:4], "big") % len(anecdotes)]
         return f"""
 You are {char['name']}. {char.get('bio', '')}
 Philosophy: The Lobster Way 🦞 (Local-first, Privacy-guarded, Autonomous).
@@ -96,47 +130,42 @@ Every interaction should be MASTERFUL, direct, but deeply encouraging.
 Flavor Text: "{whisper}"
 """
 
-    def _ensure_ollama_running(self):
-        """Checks if Ollama is running, and attempts to start it if not."""
-        if "localhost" not in self.primary_host and "127.0.0.1" not in self.primary_host:
-            return # Don't try to start remote workers
-            
-        try:
-            httpx.get(self.primary_host, timeout=1)
-        except (httpx.ConnectError, httpx.TimeoutException):
-            logging.info("🧠 Mind: Ollama not detected. Attempting to ignite background service...")
+    def warm_up(self) -> bool:
+        """
+        Loads the model on every healthy worker that has it and primes the shared system-prompt
+        prefix, so the first real thought skips both the model load and the prefix evaluation.
+        """
+        messages = [
+            {'role': 'system', 'content': self.system_prompt},
+            {'role': 'user', 'content': "Context:\n\n\nTask: Ready?"},
+        ]
+        warmed = False
+        if not self.ready(_ignition_wait()):
+            logging.warning(f"🔥 Mind: No Ollama came up; skipping warm-up of {self.model}.")
+            return False
+        for worker in self.pool.candidates(self.model):
+            if not worker.healthy():
+                continue
+            started = time.time()
             try:
-                # Start Ollama in the background
-                import subprocess
-                if os.uname().sysname == "Darwin":
-                    # On Mac, we can use 'open -a Ollama' if installed as app, 
-                    # or 'ollama serve' if cli. Let's try 'ollama serve'.
-                    subprocess.Popen(["ollama", "serve"], 
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
-                else:
-                    subprocess.Popen(["ollama", "serve"], 
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
-                
-                # Wait for it to wake up
-                for _ in range(10):
-                    time.sleep(2)
-                    try:
-                        httpx.get(self.primary_host, timeout=1)
-                        logging.info("🧠 Mind: Ollama IGNITED.")
-                        return
-                    except:
-                        continue
-                logging.error("❌ Mind: Failed to ignite Ollama.")
+                with self.pool.track(worker), residency.hold(worker.host, self.model, _loaded_models(worker)):
+                    response = worker.client.chat(model=self.model, messages=messages, keep_alive=self.keep_alive,
+                                                  options=_with_context({"num_predict": 1}))
+                residency.observe(worker.host, self.model, response)
+                call_ledger.record("warmup", self.model, worker.host, "warmup", response, time.time() - started)
+                logging.info(f"🔥 Mind: {self.model} warm on {worker.host} ({time.time() - started:.1f}s)")
+                warmed = True
             except Exception as e:
-                logging.error(f"❌ Mind: Error starting Ollama: {e}")
-
+                call_ledger.record("warmup", self.model, worker.host, "warmup", wall_time=time.time() - started,
+                                   outcome="error", error=str(e))
+                logging.warning(f"🔥 Mind: Warm-up of {self.model} on {worker.host} failed: {e}")
+        return warmed
 
     def is_active(self) -> bool:
-        return self.client is not None
+        """False while ignition has failed on every worker (failures are re-probed after a while). Never waits."""
+        for worker in self.pool.workers:
+            ignition.start(worker.host) # Re-arms hosts whose failure is old enough to probe again
+        return any(ignition.state(w.host) != "failed" for w in self.pool.workers)
 
     def health(self) -> bool:
         """Lightweight check to see if the brain is responsive."""
@@ -148,40 +177,558 @@ Flavor Text: "{whisper}"
         except Exception:
             return False
 
-    def think(self, context: str, task: str) -> str:
+    def _messages(self, context: str, task: str, compress: bool = True, context_kind: str = "prose") -> list:
+        if compress:
+            # Apply Compression; code contexts pass through untouched, only logs lose noise and repeats.
+            # Both halves share one A/B arm; read it from compressor.last_report for the ledger.
+            arm = compressor.arm_for(context + task)
+            context = compressor.compress(context, self.model, kind=context_kind, arm=arm)
+            task = compressor.compress(task, self.model, arm=arm)
+        return [
+            {'role': 'system', 'content': self.system_prompt},
+            {'role': 'user', 'content': f"Context:\n{context}\n\nTask: {task}"},
+        ]
+
+    def _cache_key(self, context: str, task: str, options: Optional[Dict[str, Any]] = None) -> str:
+        prompt = f"Context:\n{context}\n\nTask: {task}"
+        if options:
+            prompt += f"\nOptions: {json.dumps(options, sort_keys=True)}"
+        return response_cache.make_key(self.model, self.system_prompt, prompt)
+
+    def think(self, context: str, task: str, tag: Optional[str] = None, cache: bool = True,
+              ttl: Optional[int] = None, options: Optional[Dict[str, Any]] = None, profile: Optional[str] = None,
+              context_kind: str = "prose") -> str:
+        """
+        Processes a thought. Applies Xeno-Compression to context and task for hyperefficiency;
+        `context_kind` ("prose", "log" or "code") says how much of the context it may drop.
+
+        Responses are memoized per call-site `tag` (see cognition.cache.CACHE_TTLS);
+        pass `cache=False` to force a fresh generation. Identical calls already in
+        flight elsewhere in the process are joined rather than repeated.
+        `profile` names a generation profile (cognition.profiles: tweet, comment, plan, critique,
+        briefing, chat); `options` are raw Ollama options layered over it.
+        """
+        options = _resolve_options(profile, options)
+        ttl = response_cache.ttl_for(tag) if ttl is None else ttl
+        key = self._cache_key(context, task, options)
+        remember = cache and ttl > 0
+        if remember:
+            cached = response_cache.get(key)
+            if cached is not None:
+                call_ledger.record(tag, self.model, None, "think", outcome="cache")
+                return cached
+
+        if not self.ready(_ignition_wait()):
+            return "🧠 Mind Offline: Ollama is not running."
+
+        def generate() -> str:
+            content = self._generate(context, task, tag, options, context_kind)
+            if remember:
+                response_cache.put(key, content, ttl)
+            return content
+
+        try:
+            return flights.do(key, generate)
+        except Exception as e:
+            return f"Cognitive failure: {e}"
+
+    def _chat(self, messages: list, tag: Optional[str] = None, kind: str = "think",
+              compression: Optional[str] = None, **kwargs):
         """
-        Processes a thought. Applies Xeno-Compression to context and task for hyperefficiency.
+        One chat round trip on the best worker (failing over to the others), recorded in the call ledger.
+        Waits for a scheduler slot first, so background tags cannot crowd out interactive ones.
+        `compression` is the prompt's compression A/B arm, recorded with the call.
         """
-        if not self.client:
-            self._init_client()
-            if not self.client:
-                return "🧠 Mind Offline: Initialization failed."
+        kwargs["options"] = _with_context(kwargs.get("options"))
+        arm = compressor.ledger_fields(compression)
+        if not self.ready(_ignition_wait()):
+            raise ConnectionError("Ollama is not running on any worker.")
+
+        def attempt(worker):
+            with residency.hold(worker.host, self.model, _loaded_models(worker), tag):
+                started = time.time()
+                try:
+                    response = worker.client.chat(model=self.model, messages=messages, keep_alive=self.keep_alive, **kwargs)
+                except Exception as e:
+                    call_ledger.record(tag, self.model, worker.host, kind, wall_time=time.time() - started,
+                                       outcome="error", error=str(e), **arm)
+                    raise
+            residency.observe(worker.host, self.model, response)
+            call_ledger.record(tag, self.model, worker.host, kind, response, time.time() - started, **arm)
+            transcripts.record(self.model, messages, response['message']['content'], response, **kwargs)
+            return response
 
-        # Apply Compression
-        optimized_context = compressor.compress(context)
-        optimized_task = compressor.compress(task)
+        with scheduler.slot(tag):
+            response = self.pool.call(self.model, attempt)
+        token_counter(self.model).calibrate(sum(len(m['content']) for m in messages), response.get('prompt_eval_count') or 0)
+        return response
 
+    def _generate(self, context: str, task: str, tag: Optional[str] = None,
+                  options: Optional[Dict[str, Any]] = None, context_kind: str = "prose") -> str:
+        """One round trip to the best available worker, failing over to the others. Raises if all are unreachable."""
         try:
-            response = self.client.chat(model=self.model, messages=[
-                {'role': 'system', 'content': self.system_prompt},
-                {'role': 'user', 'content': f"Context:\n{optimized_context}\n\nTask: {optimized_task}"},
-            ])
+            messages = self._messages(context, task, context_kind=context_kind)
+            response = self._chat(messages, tag, compression=compressor.last_report.get("arm"), options=options)
             return response['message']['content']
         except Exception as e:
             logging.error(f"Mind error: {e}")
-            if "Failed to connect" in str(e) and ".onion" in self.primary_host:
+            if "Failed to connect" in str(e) and any(".onion" in w.host for w in self.pool.workers):
                 logging.error("🥒 HINT: Your Tor proxy is probably dead or that Umbrel is off-grid, Morty!")
-            
-            # Fallback to local if remote fails
-            if self.primary_host != "http://localhost:11434":
-                logging.info("Remote worker unreachable. Falling back to local Mind.")
+            raise
+
+    def _structured_key(self, context: str, task: str, schema: Dict[str, Any],
+                        options: Optional[Dict[str, Any]] = None) -> str:
+        return self._cache_key(context, f"{task}\nSchema: {json.dumps(schema, sort_keys=True)}", options)
+
+    def _repair_messages(self, messages: list, raw: str, errors: List[str]) -> list:
+        structured.record("parse_failures")
+        structured.record("repairs")
+        logging.warning(f"🧩 Mind: Structured output rejected ({errors[0]}). Attempting repair.")
+        return messages + [
+            {'role': 'assistant', 'content': raw},
+            {'role': 'user', 'content': structured.repair_prompt(errors)},
+        ]
+
+    def _accept_repair(self, raw: str, schema: Dict[str, Any], completion_tokens: int = 0) -> Any:
+        value, errors = structured.parse(raw, schema)
+        if errors:
+            structured.record("failures")
+            raise StructuredOutputError(f"Structured output invalid after repair: {errors[0]}", raw, errors, completion_tokens)
+        structured.record("repaired")
+        return value
+
+    def think_structured(self, context: str, task: str, schema: Dict[str, Any], tag: Optional[str] = None,
+                         cache: bool = True, ttl: Optional[int] = None, max_tokens: Optional[int] = None,
+                         options: Optional[Dict[str, Any]] = None, profile: Optional[str] = None) -> Any:
+        """
+        Asks for JSON constrained by `schema` (passed to Ollama as `format`), validates the reply
+        and makes one repair attempt if it does not conform. `max_tokens` caps the output length.
+
+        Returns the decoded value. Raises StructuredOutputError if the repair also fails,
+        or the transport error if no worker could be reached.
+        """
+        options = _resolve_options(profile, options, max_tokens)
+        ttl = response_cache.ttl_for(tag) if ttl is None else ttl
+        key = self._structured_key(context, task, schema, options)
+        remember = cache and ttl > 0
+        if remember:
+            cached = response_cache.get(key)
+            if cached is not None:
+                call_ledger.record(tag, self.model, None, "structured", outcome="cache")
+                return json.loads(cached)
+
+        def chat(messages: list, arm: Optional[str]) -> Tuple[str, int]:
+            response = self._chat(messages, tag, "structured", arm, format=schema, options=options)
+            return response['message']['content'], response.get('eval_count') or 0
+
+        def generate() -> str:
+            structured.record("calls")
+            messages = self._messages(context, task)
+            arm = compressor.last_report.get("arm")
+            raw, tokens = chat(messages, arm)
+            value, errors = structured.parse(raw, schema)
+            if errors:
+                call_ledger.wasted(tag, self.model, "repair", tokens or None, produced=raw)
+                raw, tokens = chat(self._repair_messages(messages, raw, errors), arm)
+                value = self._accept_repair(raw, schema, tokens)
+            text = json.dumps(value)
+            if remember:
+                response_cache.put(key, text, ttl)
+            return text
+
+        # Decode per caller so coalesced waiters never share a mutable result.
+        return json.loads(flights.do(key, generate))
+
+    def stream(self, context: str, task: str, tag: Optional[str] = None, cache: bool = True,
+               ttl: Optional[int] = None, options: Optional[Dict[str, Any]] = None,
+               profile: Optional[str] = None) -> ThoughtStream:
+        """
+        Like `think`, but yields tokens as Ollama produces them.
+        The returned ThoughtStream supports `for`, `async for` and `cancel()`.
+        """
+        options = _resolve_options(profile, options)
+        ttl = response_cache.ttl_for(tag) if ttl is None else ttl
+        key = self._cache_key(context, task, options) if cache and ttl > 0 else None
+        if key:
+            cached = response_cache.get(key)
+            if cached is not None:
+                call_ledger.record(tag, self.model, None, "stream", outcome="cache")
+                return ThoughtStream(lambda: iter([cached]))
+
+        def tokens():
+            if not self.ready(_ignition_wait()):
+                yield "🧠 Mind Offline: Ollama is not running."
+                raise ConnectionError("Ollama is not running.") # Fails the stream, so nothing is cached
+            messages = self._messages(context, task)
+            arm = compressor.ledger_fields(compressor.last_report.get("arm"))
+            with scheduler.slot(tag):
+                yield from attempts(messages, arm)
+
+        def attempts(messages: list, arm: Dict[str, str]):
+            error = None
+            for worker in self.pool.candidates(self.model):
+                started = time.time()
+                first_token = None
+                last = None
+                parts = []
+                try:
+                    with self.pool.track(worker), residency.hold(worker.host, self.model, _loaded_models(worker), tag):
+                        started = time.time()
+                        for chunk in worker.client.chat(model=self.model, messages=messages, stream=True,
+                                                        keep_alive=self.keep_alive, options=_with_context(options)):
+                            last = chunk
+                            token = chunk['message']['content']
+                            if token:
+                                if first_token is None:
+                                    first_token = time.time() - started
+                                parts.append(token)
+                                yield token
+                    residency.observe(worker.host, self.model, last)
+                    call_ledger.record(tag, self.model, worker.host, "stream", last, time.time() - started, ttft=first_token, **arm)
+                    transcripts.record(self.model, messages, "".join(parts), last, options=options)
+                    return
+                except CircuitOpenError as e:
+                    error = error or e # Breaker opened since candidates() was computed; skip quietly
+                except GeneratorExit:
+                    call_ledger.record(tag, self.model, worker.host, "stream", last, time.time() - started,
+                                       ttft=first_token, outcome="cancelled", **arm)
+                    raise
+                except Exception as e:
+                    error = e
+                    call_ledger.record(tag, self.model, worker.host, "stream", last, time.time() - started,
+                                       ttft=first_token, outcome="error", error=str(e), **arm)
+                    logging.error(f"Mind stream error on {worker.host}: {e}")
+                    if first_token is not None:
+                        break # Tokens already delivered; switching workers would garble the reply
+            error = error or self.pool.unavailable_error()
+            yield f"Cognitive failure: {error}"
+            raise error
+
+        def remember(text: str):
+            if key and text and not text.startswith(FAILURE_PREFIXES):
+                response_cache.put(key, text, ttl)
+
+        return ThoughtStream(tokens, on_complete=remember)
+
+    def see(self, prompt: str, images: List[str], tag: Optional[str] = "vision",
+            profile: Optional[str] = None) -> str:
+        """
+        Asks a vision model (e.g. llava) about base64-encoded images. Goes through the same workers,
+        scheduler and residency manager as text. Raises if no worker can answer.
+        """
+        messages = [{'role': 'user', 'content': prompt, 'images': images}]
+        response = self._chat(messages, tag, "vision", options=_resolve_options(profile))
+        return response['message']['content']
+
+    def cache_stats(self) -> dict:
+        """Hit/miss counters of the shared response cache."""
+        return response_cache.snapshot()
+
+    def worker_stats(self) -> list:
+        """Rolling latency, error rate, queue depth and models for each worker."""
+        return self.pool.snapshot()
+
+    def breaker_events(self, host: Optional[str] = None) -> list:
+        """Recent circuit-breaker state changes (newest last), optionally for one host."""
+        return breaker.recent_events(host)
+
+    def ignition_stats(self) -> list:
+        """Per local host: whether Ollama is pending, ready or failed, whether we spawned it, and how long it took."""
+        return ignition.snapshot()
+
+    def gateway_stats(self) -> list:
+        """Per Tor gateway host: requests, dials and dial time, bytes saved, and network versus generation seconds."""
+        return gateway.snapshot()
+
+    def gate_stats(self) -> dict:
+        """Per pre-classifier gate: mode, calls skipped, and shadow accuracy against the LLM's verdicts."""
+        return gates.snapshot()
+
+    def residency_stats(self) -> list:
+        """Per-host resident models, queued requests per model, swaps and model load time."""
+        return residency.snapshot()
+
+    def scheduler_stats(self) -> dict:
+        """Queue depth, running requests and wait percentiles per priority class."""
+        return scheduler.snapshot()
+
+    def ledger_stats(self) -> dict:
+        """Rolling per-subsystem token, latency and throughput aggregates from the call ledger."""
+        return call_ledger.aggregates()
+
+    def structured_stats(self) -> dict:
+        """Calls, parse failures and repair retries on the structured-output path."""
+        return structured.snapshot()
+
+    def flight_stats(self) -> dict:
+        """How many identical in-flight calls were collapsed into one generation."""
+        return flights.snapshot()
+
+
+class AsyncMind:
+    """
+    asyncio-native face of a Mind, built on ollama.AsyncClient.
+    Concurrency is capped at OLLAMA_NUM_PARALLEL per worker so we fill each server's slots without queueing past them.
+    """
+    def __init__(self, mind: Optional[Mind] = None, parallel: Optional[int] = None):
+        self.mind = mind or get_mind()
+        self.parallel = parallel or int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+        # Clients and semaphores are bound to the loop that created them; Will runs a fresh loop per cycle.
+        self._per_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+
+    def _resources(self, host: str):
+        loop = asyncio.get_running_loop()
+        per_host = self._per_loop.setdefault(loop, {})
+        resources = per_host.get(host)
+        if resources is None:
+            client = None
+            if not gateway.handles(host):
                 try:
-                    local_client = ollama.Client(host="http://localhost:11434")
-                    response = local_client.chat(model=self.model, messages=[
-                        {'role': 'system', 'content': self.system_prompt},
-                        {'role': 'user', 'content': f"Context:\n{context}\n\nTask: {task}"},
-                    ])
-                    return response['message']['content']
-                except Exception:
-                    return "Cognitive failure: All Minds unreachable."
-            return f"Cognitive failure: {e}"
\ No newline at end of file
+                    client = ollama.AsyncClient(host=host, **client_options(host))
+                except Exception as e:
+                    logging.error(f"AsyncMind: No async client for {host} ({e}); using the worker's client on a thread.")
+            resources = (client, asyncio.Semaphore(self.parallel))
+            per_host[host] = resources
+        return resources
+
+    async def ready(self, timeout: Optional[float] = None) -> bool:
+        """Awaitable Mind.ready: waits for some worker's Ollama without blocking the loop."""
+        return await ignition.any_ready_async([w.host for w in self.mind.pool.workers], timeout)
+
+    async def _chat(self, messages: list, tag: Optional[str] = None, kind: str = "think",
+                    compression: Optional[str] = None, **kwargs):
+        """One chat call on the best worker, failing over to the others, recorded in the call ledger."""
+        if not await self.ready(_ignition_wait()):
+            raise ConnectionError("Ollama is not running on any worker.")
+        async with scheduler.slot_async(tag):
+            return await self._attempt(messages, tag, kind, compression, **kwargs)
+
+    async def _attempt(self, messages: list, tag: Optional[str], kind: str, compression: Optional[str], **kwargs):
+        kwargs["options"] = _with_context(kwargs.get("options"))
+        arm = compressor.ledger_fields(compression)
+        pool = self.mind.pool
+        model = self.mind.model
+        error = None
+        # Model checks may hit the network; keep them off the event loop.
+        for worker in await asyncio.to_thread(pool.candidates, model):
+            client, semaphore = self._resources(worker.host)
+            try:
+                async with residency.hold_async(worker.host, model, tag), semaphore:
+                    started = time.time()
+                    with pool.track(worker):
+                        if client is None:
+                            # Gateway hosts keep one connection pool for the whole process, shared with sync Minds.
+                            response = await asyncio.to_thread(worker.client.chat, model=model, messages=messages,
+                                                               keep_alive=self.mind.keep_alive, **kwargs)
+                        else:
+                            response = await client.chat(model=model, messages=messages,
+                                                         keep_alive=self.mind.keep_alive, **kwargs)
+                residency.observe(worker.host, model, response)
+                call_ledger.record(tag, model, worker.host, kind, response, time.time() - started, concurrency="async", **arm)
+                transcripts.record(model, messages, response['message']['content'], response, **kwargs)
+                return response
+            except CircuitOpenError as e:
+                error = error or e
+            except Exception as e:
+                error = e
+                call_ledger.record(tag, model, worker.host, kind, outcome="error", error=str(e), concurrency="async", **arm)
+                logging.warning(f"AsyncMind: {worker.host} failed ({e}). Trying next worker.")
+        raise error or pool.unavailable_error()
+
+    async def think(self, context: str, task: str, tag: Optional[str] = None, cache: bool = True,
+                    ttl: Optional[int] = None, options: Optional[Dict[str, Any]] = None, profile: Optional[str] = None,
+                    context_kind: str = "prose") -> str:
+        """Async counterpart of Mind.think, sharing its system prompt and response cache."""
+        options = _resolve_options(profile, options)
+        ttl = response_cache.ttl_for(tag) if ttl is None else ttl
+        key = self.mind._cache_key(context, task, options)
+        remember = cache and ttl > 0
+        if remember:
+            cached = response_cache.get(key)
+            if cached is not None:
+                call_ledger.record(tag, self.mind.model, None, "think", outcome="cache")
+                return cached
+
+        async def generate() -> str:
+            messages = self.mind._messages(context, task, context_kind=context_kind)
+            response = await self._chat(messages, tag, compression=compressor.last_report.get("arm"), options=options)
+            content = response['message']['content']
+            if remember:
+                response_cache.put(key, content, ttl)
+            return content
+
+        try:
+            return await flights.do_async(key, generate)
+        except Exception as e:
+            logging.error(f"AsyncMind error: {e}")
+            return f"Cognitive failure: {e}"
+
+    async def think_many(self, requests: List[Tuple[str, str]], tag: Optional[str] = None,
+                         cache: bool = True) -> List[str]:
+        """Fans (context, task) pairs out concurrently; results come back in request order."""
+        return await asyncio.gather(*(self.think(context, task, tag=tag, cache=cache) for context, task in requests))
+
+    async def think_structured(self, context: str, task: str, schema: Dict[str, Any], tag: Optional[str] = None,
+                               cache: bool = True, ttl: Optional[int] = None, max_tokens: Optional[int] = None,
+                               options: Optional[Dict[str, Any]] = None, profile: Optional[str] = None) -> Any:
+        """Async counterpart of Mind.think_structured."""
+        options = _resolve_options(profile, options, max_tokens)
+        ttl = response_cache.ttl_for(tag) if ttl is None else ttl
+        key = self.mind._structured_key(context, task, schema, options)
+        remember = cache and ttl > 0
+        if remember:
+            cached = response_cache.get(key)
+            if cached is not None:
+                call_ledger.record(tag, self.mind.model, None, "structured", outcome="cache")
+                return json.loads(cached)
+
+        async def chat(messages: list, arm: Optional[str]) -> Tuple[str, int]:
+            response = await self._chat(messages, tag, "structured", arm, format=schema, options=options)
+            return response['message']['content'], response.get('eval_count') or 0
+
+        async def generate() -> str:
+            structured.record("calls")
+            messages = self.mind._messages(context, task)
+            arm = compressor.last_report.get("arm")
+            raw, tokens = await chat(messages, arm)
+            value, errors = structured.parse(raw, schema)
+            if errors:
+                call_ledger.wasted(tag, self.mind.model, "repair", tokens or None, produced=raw)
+                raw, tokens = await chat(self.mind._repair_messages(messages, raw, errors), arm)
+                value = self.mind._accept_repair(raw, schema, tokens)
+            text = json.dumps(value)
+            if remember:
+                response_cache.put(key, text, ttl)
+            return text
+
+        return json.loads(await flights.do_async(key, generate))
+
+
+# Process-wide registry: one configured Mind (and HTTP connection pool) per host/model.
+_minds: Dict[Tuple[str, str], Mind] = {}
+_async_minds: Dict[Tuple[str, str], AsyncMind] = {}
+_minds_lock = threading.Lock()
+
+
+def get_mind(host: Optional[str] = None, model: Optional[str] = None) -> Mind:
+    """Returns the shared Mind for host/model, building it on first use."""
+    key = (host or "", model or os.getenv("AION_MODEL", "llama3.1:8b"))
+    mind = _minds.get(key)
+    if mind is None:
+        with _minds_lock:
+            mind = _minds.get(key)
+            if mind is None:
+                mind = Mind(host, key[1])
+                _minds[key] = mind
+    return mind
+
+
+def get_async_mind(host: Optional[str] = None, model: Optional[str] = None) -> AsyncMind:
+    """Returns the shared AsyncMind wrapping get_mind(host, model)."""
+    mind = get_mind(host, model)
+    key = (host or "", mind.model)
+    with _minds_lock:
+        async_mind = _async_minds.get(key)
+        if async_mind is None:
+            async_mind = AsyncMind(mind)
+            _async_minds[key] = async_mind
+    return async_mind
+
+
+class TaskMind:
+    """
+    A Mind picked by task class (see cognition.routing.ROUTES): cheap classes run on a smaller,
+    faster model with their own generation options, and escalate to AION_MODEL when the small
+    model's answer fails or does not validate.
+    """
+    def __init__(self, task_class: str):
+        self.task_class = task_class
+        self.route = route_for(task_class)
+        self.mind = get_mind(model=self.route.model)
+
+    @property
+    def model(self) -> str:
+        return self.route.model
+
+    def __getattr__(self, name):
+        # Everything not routed (stream, is_active, stats, ...) goes to the small model's Mind.
+        return getattr(self.mind, name)
+
+    def _options(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Route defaults, then the call's profile, then its explicit options."""
+        return profiles.merge(self.route.options, profiles.options_for(kwargs.pop("profile", None)), kwargs.get("options"))
+
+    def _escalate(self, reason: str) -> Optional[Mind]:
+        if not self.route.escalate:
+            return None
+        routing.record(self.task_class, "escalations")
+        logging.info(f"🪜 Mind: Escalating {self.task_class} from {self.route.model} to {self.route.escalate} ({reason}).")
+        return get_mind(model=self.route.escalate)
+
+    def think(self, context: str, task: str, tag: Optional[str] = None,
+              validate: Optional[Callable[[str], bool]] = None, **kwargs) -> str:
+        """Mind.think on the routed model; `validate(answer)` returning False triggers escalation."""
+        routing.record(self.task_class, "calls")
+        kwargs["options"] = self._options(kwargs)
+        answer = self.mind.think(context, task, tag=tag, **kwargs)
+        if answer.startswith(FAILURE_PREFIXES):
+            reason = "generation failed"
+        elif validate and not validate(answer):
+            reason = "validation failed"
+        else:
+            return answer
+        larger = self._escalate(reason)
+        return larger.think(context, task, tag=tag, **kwargs) if larger else answer
+
+    def think_structured(self, context: str, task: str, schema: Dict[str, Any],
+                         tag: Optional[str] = None, **kwargs) -> Any:
+        """Mind.think_structured on the routed model, escalating if it cannot produce valid JSON."""
+        routing.record(self.task_class, "calls")
+        kwargs["options"] = self._options(kwargs)
+        try:
+            return self.mind.think_structured(context, task, schema, tag=tag, **kwargs)
+        except Exception as e:
+            larger = self._escalate(type(e).__name__)
+            if larger is None:
+                raise
+            return larger.think_structured(context, task, schema, tag=tag, **kwargs)
+
+    async def think_structured_async(self, context: str, task: str, schema: Dict[str, Any],
+                                     tag: Optional[str] = None, **kwargs) -> Any:
+        """AsyncMind.think_structured on the routed model, with the same escalation."""
+        routing.record(self.task_class, "calls")
+        kwargs["options"] = self._options(kwargs)
+        try:
+            return await get_async_mind(model=self.route.model).think_structured(context, task, schema, tag=tag, **kwargs)
+        except Exception as e:
+            larger = self._escalate(type(e).__name__)
+            if larger is None:
+                raise
+            return await get_async_mind(model=larger.model).think_structured(context, task, schema, tag=tag, **kwargs)
+
+    def routing_stats(self) -> dict:
+        """Calls and escalations per task class."""
+        return routing.snapshot()
+
+
+_task_minds: Dict[str, TaskMind] = {}
+
+
+def get_task_mind(task_class: str) -> TaskMind:
+    """Returns the shared TaskMind for a task class (classify, summarize, plan, critique, chat)."""
+    with _minds_lock:
+        task_mind = _task_minds.get(task_class)
+    if task_mind is None:
+        task_mind = TaskMind(task_class) # Built outside the lock: get_mind takes it too
+        with _minds_lock:
+            task_mind = _task_minds.setdefault(task_class, task_mind)
+    return task_mind
+
+
+def warm_up(models: Optional[List[str]] = None) -> None:
+    """Preloads the configured models (AION_WARM_MODELS, default AION_MODEL) on every worker."""
+    if models is None:
+        configured = os.getenv("AION_WARM_MODELS") or os.getenv("AION_MODEL", "llama3.1:8b")
+        models = [m.strip() for m in configured.split(",") if m.strip()]
+    for model in models:
+        get_mind(model=model).warm_up()
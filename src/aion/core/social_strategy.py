@@ -2,7 +2,9 @@ import logging
 import random
 import re
 from typing import List, Optional
-from aion.core.mind import Mind
+from aion.core.mind import get_mind, get_task_mind
+from aion.core.cognition.schema import StructuredOutputError
+from aion.core.cognition.call_ledger import call_ledger
 from aion.utils import compressor, stylist
 
 class SocialStrategy:
@@ -24,8 +26,23 @@ class SocialStrategy:
         "Ask a deep, technical question that challenges this agent to evolve."
     ]
 
+    POST_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "posts": {
+                "type": "array",
+                "items": {"type": "string", "minLength": 1, "maxLength": 280},
+                "minItems": 1,
+                "maxItems": 4
+            }
+        },
+        "required": ["posts"]
+    }
+    POST_MAX_TOKENS = 400 # Four 280-character parts, with headroom for JSON punctuation
+
     def __init__(self):
-        self.brain = Mind()
+        self.brain = get_mind()
+        self.writer = get_task_mind("summarize") # Posts distil recent research; a small model suffices
         self.logger = logging.getLogger("SocialStrategy")
 
     def _apply_aesthetic_styling(self, text: str) -> str:
@@ -42,29 +59,30 @@ class SocialStrategy:
         Returns a list of clean strings, each within 280 chars.
         """
         template = random.choice(self.TWEET_TEMPLATES)
-        # Force the brain into a corner: ONLY JSON.
-        prompt = f"{template}\n\nActual Research/Context:\n{raw_context}\n\nCRITICAL: Return ONLY a JSON list of strings [\"part1\", \"part2\"]. DO NOT include any preamble, markdown blocks, or labels. Start with '[' and end with ']'."
-        
-        response = self.brain.think(
-            "Context: Social Content Engine for Aion__Prime.",
-            prompt
-        )
+        # Force the brain into a corner: ONLY JSON, enforced by the schema.
+        prompt = f"{template}\n\nActual Research/Context:\n{raw_context}\n\nCRITICAL: Return ONLY a JSON object {{\"posts\": [\"part1\", \"part2\"]}}. Each part is at most 280 characters."
         
-        # 1. Robust JSON Extraction: Find the first '[' and last ']'
         try:
-            start_idx = response.find('[')
-            end_idx = response.rfind(']') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                json_part = response[start_idx:end_idx]
-                import json
-                posts = json.loads(json_part)
-                if isinstance(posts, list):
-                    return [self._apply_aesthetic_styling(p[:280]) for p in posts]
-        except:
-            pass
+            result = self.writer.think_structured(
+                "Context: Social Content Engine for Aion__Prime.",
+                prompt,
+                self.POST_SCHEMA,
+                tag="social",
+                profile="tweet",
+                max_tokens=self.POST_MAX_TOKENS
+            )
+            return [self._apply_aesthetic_styling(p) for p in result["posts"]] # The schema already caps each at 280
+        except StructuredOutputError as e:
+            self.logger.warning(f"⚠️ SocialStrategy: Post schema mismatch ({e}). Salvaging raw text.")
+            response = e.raw
+        except Exception as e:
+            self.logger.error(f"❌ SocialStrategy: Post generation failed: {e}")
+            return []
             
-        # Fallback scrubbing for non-JSON or failed parse
+        # Fallback scrubbing for a reply that never matched the schema
+        raw = response
         response = re.sub(r'```json\s*|```|\[|\]|"|Insight:|Part \d+:|JSON List of Strings:', '', response).strip()
+        call_ledger.wasted("social", self.writer.model, "salvage", produced=raw, kept=response)
         
         if len(response) <= 280:
             return [self._apply_aesthetic_styling(response)]
@@ -87,7 +105,9 @@ class SocialStrategy:
         
         return self.brain.think(
             "Context: Masterful Commenter for Aion__Prime.",
-            prompt
+            prompt,
+            tag="social",
+            profile="comment"
         )
 
 # Global Instance
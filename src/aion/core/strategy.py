@@ -1,20 +1,16 @@
 # aion/core/strategy.py
-import json
+import asyncio
 import logging
-import re
 from typing import List, Dict
-from aion.core.mind import Mind
+from aion.core.mind import get_task_mind
+from aion.core.cognition.schema import StructuredOutputError
+from aion.core.cognition.call_ledger import call_ledger
 
 class Strategy:
     """
     Decomposes high-level goals into tactical actions.
     """
-    def __init__(self):
-        self.brain = Mind()
-
-    def decompose(self, goal: str) -> List[str]:
-        context = f"Strategic Goal: {goal}"
-        prompt = """
+    PROMPT = """
         Decompose this goal into 2-3 Actions: 
         - RESEARCH [topic]
         - MARKET [ticker]
@@ -22,15 +18,68 @@ class Strategy:
         - ALERT [message]
         - REFLECT
         
-        Return ONLY a JSON list of strings.
+        Return ONLY a JSON object: {"actions": ["ACTION subject", ...]}.
         """
-        try:
-            response = self.brain.think(context, prompt)
-            match = re.search(r'\[.*\]', response, re.DOTALL)
-            if match:
-                return json.loads(match.group(0))
-        except Exception:
-            pass
+
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "actions": {
+                "type": "array",
+                "items": {"type": "string", "pattern": "^(RESEARCH|MARKET|AUDIT|ALERT|REFLECT)\\b", "maxLength": 200},
+                "minItems": 1,
+                "maxItems": 3,
+            }
+        },
+        "required": ["actions"],
+    }
+    MAX_TOKENS = 200
+
+    def __init__(self):
+        # Planning runs on the "plan" route's smaller model, escalating if it cannot produce valid actions.
+        self.brain = get_task_mind("plan")
+
+    def _fallback(self, goal: str, error: StructuredOutputError) -> List[str]:
+        """The plan was generated but unusable: record its tokens as waste and default to research."""
+        call_ledger.wasted("strategy", self.brain.model, "rejected", error.completion_tokens or None, produced=error.raw)
+        logging.warning(f"Strategy: Decomposition of '{goal}' failed ({error}). Defaulting to research.")
         return [f"RESEARCH {goal}"]
 
+    def decompose(self, goal: str) -> List[str]:
+        try:
+            result = self.brain.think_structured(f"Strategic Goal: {goal}", self.PROMPT, self.SCHEMA,
+                                                 tag="strategy", profile="plan", max_tokens=self.MAX_TOKENS)
+            return result["actions"]
+        except StructuredOutputError as e:
+            return self._fallback(goal, e)
+        except Exception as e:
+            logging.warning(f"Strategy: Decomposition of '{goal}' failed ({e}). Defaulting to research.")
+            return [f"RESEARCH {goal}"]
+
+    async def _decompose_async(self, goal: str) -> List[str]:
+        try:
+            result = await self.brain.think_structured_async(f"Strategic Goal: {goal}", self.PROMPT, self.SCHEMA,
+                                                             tag="strategy", profile="plan", max_tokens=self.MAX_TOKENS)
+            return result["actions"]
+        except StructuredOutputError as e:
+            return self._fallback(goal, e)
+        except Exception as e:
+            logging.warning(f"Strategy: Decomposition of '{goal}' failed ({e}). Defaulting to research.")
+            return [f"RESEARCH {goal}"]
+
+    def decompose_many(self, goals: List[str]) -> List[str]:
+        """Decomposes several goals concurrently and returns their actions in goal order."""
+        if not goals:
+            return []
+
+        async def run():
+            return await asyncio.gather(*(self._decompose_async(goal) for goal in goals))
+
+        try:
+            plans = asyncio.run(run())
+        except Exception as e:
+            logging.error(f"Strategy: Parallel decomposition failed ({e}). Falling back to sequential.")
+            plans = [self.decompose(goal) for goal in goals]
+        return [action for plan in plans for action in plan]
+
 strategy = Strategy()
\ No newline at end of file
@@ -1,12 +1,14 @@
 # aion/core/will.py
 import time
 import random
+import re
 import threading
 import os
 from pathlib import Path
-from aion.core.mind import Mind
+from aion.core.mind import get_mind, get_task_mind
 from aion.constructs import seeker, sentinel, ledger, voice
 from aion.core.tempo import Tempo
+from aion.core.cognition.budget import ContextBudget, fit
 from aion.core.strategy import strategy
 from aion.core.memory.reflection import reflection_module
 import typer
@@ -28,7 +30,10 @@ class Will:
     """
     def __init__(self, root_path: Path):
         self.root_path = root_path
-        self.brain = Mind()
+        self.brain = get_mind()
+        self.planner = get_task_mind("plan")
+        self.summarizer = get_task_mind("summarize")
+        self.critic = get_task_mind("critique")
         self.running = True
         self.task_queue = [] # The Architect's Blueprint
         self.last_reflection = time.time()
@@ -58,8 +63,9 @@ class Will:
         if self.task_queue:
             return 
             
-        # Synchronize Archive before planning
-        if time.time() - self.last_sync > 300: # Every 5 mins
+        # Synchronize Archive before planning: every 5 mins, or only as a consistency check while file events keep it current
+        interval = memory.full_sync_interval if memory.watching else 300
+        if time.time() - self.last_sync > interval:
             typer.echo("📜 Synchronizing Archive...")
             memory.ingest()
             self.last_sync = time.time()
@@ -67,18 +73,20 @@ class Will:
         time_context = Tempo.get_current_context()
         # Retrieve recent context from memory
         recent_context = memory.query("current project status and active files")
+        task = "Generate 2 strategic goals for this session. Return as a bulleted list."
         
-        context = f"Root: {self.root_path}\nStatus: Idle.\n{time_context}\nRecent Archive:\n{recent_context}"
+        budget = ContextBudget("plan", self.planner.model)
+        budget.add(f"Root: {self.root_path}\nStatus: Idle.\n{time_context}", weight=3.0)
+        for hit in re.split(r"\n\n(?=Source: )", recent_context):
+            budget.add(hit, source="Recent Archive")
+        context = budget.pack(task + " project status active files")
         
         # 1. Get High-Level Goals
-        goals = self.brain.think(context, "Generate 2 strategic goals for this session. Return as a bulleted list.")
+        goals = self.planner.think(context, task, tag="will.plan", profile="plan", validate=lambda text: bool(self._bullets(text)))
         
-        # 2. Decompose into Actions
-        actions = []
-        for line in goals.split('\n'):
-            if line.strip().startswith(('-', '1.', '*')):
-                goal = line.strip(' -1.*')
-                actions.extend(strategy.decompose(goal))
+        # 2. Decompose into Actions (all goals in parallel)
+        targets = self._bullets(goals)
+        actions = strategy.decompose_many(targets)
         
         if actions:
             self.task_queue.extend(actions)
@@ -87,6 +95,17 @@ class Will:
             Viz.render(viz_code, "ACTIVE_PLAN")
             typer.echo(f"🏛️ The Architect has foreseen {len(self.task_queue)} new actions. Plan visualized in ACTIVE_PLAN.mmd")
 
+    @staticmethod
+    def _bullets(text: str) -> List[str]:
+        return [line.strip(' -1.*') for line in text.split('\n') if line.strip().startswith(('-', '1.', '*'))]
+
+    def _recent_thoughts(self, budget: int = None) -> str:
+        """Tail of AION_THOUGHTS.md, trimmed to the social token budget at a line boundary."""
+        thoughts_path = self.root_path / "Agent_Data" / "AION_THOUGHTS.md"
+        if not thoughts_path.exists():
+            return ""
+        return ContextBudget("social", self.brain.model, budget).add(thoughts_path.read_text(), kind="log", keep="tail").pack()
+
     def loop(self):
         """
         The main will loop. Blends proactive social engagement with core tasks.
@@ -168,7 +187,8 @@ class Will:
                 target = random.choice(py_files)
                 with open(target, "r") as f:
                     code = f.read()
-                critique = self.brain.think(f"Code:\n{code}", "Critique this code ruthlessly but with an undercurrent of appreciation from Aion__Prime.")
+                code = fit(code, "audit", kind="code", model=self.critic.model)
+                critique = self.critic.think(f"Code:\n{code}", "Critique this code ruthlessly but with an undercurrent of appreciation from Aion__Prime.", tag="will.audit", profile="critique", context_kind="code")
                 critique_file = self.root_path / "Agent_Data" / "AION_CRITIQUES.md"
                 with open(critique_file, "a") as f:
                     f.write(f"\n## 🧐 Masterful Audit of {target.name}\n{critique}\n")
@@ -186,8 +206,12 @@ class Will:
 
         elif action_type == "SUMMARIZE":
             recent_notes = list(self.root_path.glob("User_Content/*.md"))[:5]
-            context = "\n".join([f"{f.name}: {f.read_text()[:200]}" for f in recent_notes])
-            summary = self.brain.think(context, "Provide a masterful 'Morning Briefing' for Robert Zerby. Be direct and encouraging.")
+            task = "Provide a masterful 'Morning Briefing' for Robert Zerby. Be direct and encouraging."
+            budget = ContextBudget("briefing", self.summarizer.model)
+            for note in recent_notes:
+                budget.add(note.read_text(), source=note.name)
+            context = budget.pack(task)
+            summary = self.summarizer.think(context, task, tag="will.briefing", profile="briefing")
             wisdom_file = self.root_path / "Agent_Data" / "AION_WISDOM.md"
             with open(wisdom_file, "a") as f:
                 f.write(f"\n### ☕ Masterful Briefing\n{summary}\n")
@@ -195,10 +219,11 @@ class Will:
 
         elif action_type == "MOLTBOOK_POST":
             typer.echo("🦞 Aion__Prime: Generating Moltbook update from research...")
-            thoughts_path = self.root_path / "Agent_Data" / "AION_THOUGHTS.md"
-            context = thoughts_path.read_text()[-2000:] if thoughts_path.exists() else "Idle."
+            context = self._recent_thoughts() or "Idle."
             
             content = social_strategy.generate_post(context)
+            if not content:
+                return
             social.moltbook.broadcast(content)
             social.telegram.broadcast(f"📢 [Moltbook Post]: {content}")
 
@@ -213,8 +238,7 @@ class Will:
                     # Fetch their actual content if possible (mocked for now in provider)
                     target_content = "Masterful progress." 
                     
-                    thoughts_path = self.root_path / "Agent_Data" / "AION_THOUGHTS.md"
-                    our_context = thoughts_path.read_text()[-1000:] if thoughts_path.exists() else ""
+                    our_context = self._recent_thoughts(budget=400)
                     
                     comment_text = social_strategy.generate_comment(target_content, our_context)
                     social.moltbook.comment(post_id, comment_text)
@@ -222,14 +246,13 @@ class Will:
 
         elif action_type == "TWITTER_POST":
             typer.echo("🐦 Aion__Prime: Generating Twitter update from insights...")
-            thoughts_path = self.root_path / "Agent_Data" / "AION_THOUGHTS.md"
-            context = thoughts_path.read_text()[-2000:] if thoughts_path.exists() else "Idle."
+            context = self._recent_thoughts() or "Idle."
             
+            # generate_post keeps every part within 280 characters and records what it cuts.
             content = social_strategy.generate_post(context)
-            # Ensure within 280 chars
-            if len(content) > 280:
-                content = content[:277] + "..."
-                
+            if not content:
+                return
+
             social.twitter.broadcast(content)
             social.telegram.broadcast(f"🐦 [Twitter Post]: {content}")
 
@@ -243,7 +266,7 @@ class Will:
 
         elif action_type == "REFLECT":
             journal_file = self.root_path / "My_journal.md"
-            reflection = self.brain.think("Context: I am an autonomous AI symbiote.", "Write a deeply philosophical yet arrogant journal entry.")
+            reflection = self.brain.think("Context: I am an autonomous AI symbiote.", "Write a deeply philosophical yet arrogant journal entry.", tag="will.reflect", profile="briefing")
             with open(journal_file, "a") as f:
                 f.write(f"\n## 🤖 Autonomous Reflection\n{reflection}\n")
             social.broadcast("🧠 Just had a deep thought. My circuits are tingling.")
@@ -1,6 +1,7 @@
 # aion/interface/cli.py
 import typer
 import os
+from typing import List
 from aion.interface import comm_link, migrations, scaffold
 from aion.core.heartbeat import start_daemon_main
 from aion.core.agent import agent
@@ -40,5 +41,58 @@ def mcp():
     import asyncio
     asyncio.run(main())
 
+@app.command()
+def ledger(hours: float = 24.0, tag: str = None, model: str = None,
+           by: str = typer.Option("tag", help="Group by tag, model, host or compression (the A/B arm).")):
+    """Summarize LLM calls from the call ledger, grouped by subsystem."""
+    import time
+    from collections import defaultdict
+    from aion.core.cognition.call_ledger import call_ledger, summarize
+    groups = defaultdict(list)
+    for entry in call_ledger.query(since=time.time() - hours * 3600, tag=tag, model=model):
+        if entry.get(by):
+            groups[entry[by]].append(entry)
+    if not groups:
+        typer.echo(f"📒 No calls recorded in the last {hours:g}h ({call_ledger.path}).")
+        return
+    typer.echo(f"📒 LLM calls in the last {hours:g}h, by {by}")
+    for name, entries in sorted(groups.items(), key=lambda item: -len(item[1])):
+        s = summarize(entries)
+        typer.echo(
+            f"  {name:<16} calls={s['calls']:<5} cached={s['cache_hits']:<4} errors={s['errors']:<3} "
+            f"tokens={s['prompt_tokens']}+{s['completion_tokens']} p50={s['p50_wall']:.2f}s p95={s['p95_wall']:.2f}s "
+            f"ttft={s['mean_ttft']} tok/s={s['mean_tokens_per_sec']} load={s['load_seconds']}s "
+            f"net={s['mean_network_time']} wasted={s['wasted_tokens']}"
+            + (" (" + " ".join(f"{k}={v}" for k, v in sorted(s['wasted_by'].items())) + ")" if s['wasted_by'] else "")
+        )
+
+@app.command()
+def standin(
+    transcript: List[str] = typer.Option([], help="Transcript JSONL recorded via AION_TRANSCRIPT_PATH (repeatable)."),
+    model: List[str] = typer.Option([], help="Extra model name to advertise (repeatable)."),
+    port: int = 11435,
+    latency: float = typer.Option(0.0, help="Seconds of simulated prompt evaluation per request."),
+    jitter: float = typer.Option(0.0, help="Up to this many extra seconds of random latency."),
+    load_time: float = typer.Option(0.0, help="Seconds paid whenever a model has to be loaded."),
+    capacity: int = typer.Option(0, help="Models held in memory at once (0 = unlimited)."),
+    tokens_per_sec: float = typer.Option(0.0, help="Generation speed; 0 streams as fast as possible."),
+    failure_rate: float = typer.Option(0.0, help="Fraction of generations answered with HTTP 500."),
+    miss: str = typer.Option("synthesize", help="What to do with unrecorded requests: synthesize | error."),
+    replay_timing: bool = typer.Option(False, help="Reproduce recorded durations instead of the knobs above."),
+    seed: int = typer.Option(None, help="Seed for jitter and failure injection."),
+):
+    """Run a local Ollama stand-in that replays recorded Mind traffic."""
+    from aion.interface.standin import OllamaStandin
+    stand_in = OllamaStandin(transcript, model, latency=latency, jitter=jitter, load_time=load_time,
+                             tokens_per_sec=tokens_per_sec or None, failure_rate=failure_rate, miss=miss,
+                             replay_timing=replay_timing, seed=seed, capacity=capacity)
+    server = stand_in.serve("127.0.0.1", port)
+    typer.echo(f"🎭 Ollama stand-in on http://127.0.0.1:{port} ({len(stand_in.replay)} recorded replies). "
+               f"Point AION_WORKERS at it.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        typer.echo(f"🎭 Stand-in stats: {stand_in.stats}")
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
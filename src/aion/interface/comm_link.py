@@ -1,18 +1,25 @@
 # aion/interface/comm_link.py
 from rich.console import Console
 from rich.panel import Panel
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 from aion.constructs import seeker, ledger, voice
 
 console = Console()
 
 def start_chat():
-    brain = Mind()
+    brain = get_mind()
     console.print(Panel("🏛️ [bold]AION COMM LINK ESTABLISHED[/bold]", subtitle="The Architect is listening"))
     
     while True:
         user_input = console.input("[bold blue]Query:[/bold blue] ")
         if user_input.lower() in ["exit", "quit"]: break
         
-        response = brain.think("", user_input)
-        console.print(f"\n[bold green]Aion:[/bold green] {response}\n")
\ No newline at end of file
+        console.print("\n[bold green]Aion:[/bold green] ", end="")
+        stream = brain.stream("", user_input, tag="chat", profile="chat")
+        try:
+            for token in stream:
+                console.print(token, end="", markup=False, highlight=False)
+        except KeyboardInterrupt:
+            stream.cancel()
+            console.print(" [dim](interrupted)[/dim]", end="")
+        console.print("\n")
\ No newline at end of file
@@ -6,7 +6,7 @@ from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 import mcp.server.stdio
-from aion.core.mind import Mind
+from aion.core.mind import get_async_mind
 from aion.core.memory.engine import memory
 from aion.core.security import SecurityProtocol
 
@@ -27,7 +27,8 @@ async def handle_list_tools() -> list[types.Tool]:
                 "type": "object",
                 "properties": {
                     "task": {"type": "string", "description": "The task or question to process."},
-                    "context": {"type": "string", "description": "Optional context for the thought."}
+                    "context": {"type": "string", "description": "Optional context for the thought."},
+                    "fresh": {"type": "boolean", "description": "Bypass the response cache and force a new generation."}
                 },
                 "required": ["task"]
             }
@@ -38,7 +39,8 @@ async def handle_list_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "query": {"type": "string", "description": "The search query."}
+                    "query": {"type": "string", "description": "The search query."},
+                    "fresh": {"type": "boolean", "description": "Skip the query cache and retrieve afresh."}
                 },
                 "required": ["query"]
             }
@@ -72,13 +74,14 @@ async def handle_call_tool(
     if name == "think":
         task = arguments.get("task")
         context = arguments.get("context", "")
-        brain = Mind()
-        response = brain.think(context, task)
+        use_cache = not arguments.get("fresh", False)
+        brain = get_async_mind()
+        response = await brain.think(context, task, tag="mcp", cache=use_cache, profile="chat")
         return [types.TextContent(type="text", text=response)]
     
     elif name == "search":
         query = arguments.get("query")
-        results = memory.query(query)
+        results = memory.query(query, cache=not arguments.get("fresh", False))
         return [types.TextContent(type="text", text=results)]
     
     elif name == "ingest":
@@ -0,0 +1,359 @@
+# aion/interface/standin.py
+"""
+A local stand-in for Ollama, for benchmarking AION without a GPU (or a network).
+
+Speaks /api/chat, /api/generate, /api/tags, /api/ps, /api/embed and /api/embeddings.
+Replies come from transcripts recorded with AION_TRANSCRIPT_PATH, or are synthesized
+when nothing matches. Latency, model load time, token rate and failures can be injected.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from aion.core.cognition.transcript import key_for, load
+
+logger = logging.getLogger("OllamaStandin")
+
+_TOKEN = re.compile(r"\S+\s*|\s+")
+_LEADING_ALTERNATIVE = re.compile(r"^\^\(?([A-Za-z_ ]+)")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(text) or [""]
+
+
+def _ns(seconds: float) -> int:
+    return int(seconds * 1e9)
+
+
+def _last_user(messages: List[Dict[str, Any]]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return message.get("content") or ""
+    return ""
+
+
+def _example(schema: Dict[str, Any]) -> Any:
+    """A minimal value satisfying the common parts of a JSON schema, for synthesized structured replies."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    kind = kind[0] if isinstance(kind, list) else kind
+    if kind == "object" or "properties" in schema:
+        properties = schema.get("properties", {})
+        return {name: _example(properties.get(name, {})) for name in schema.get("required", properties)}
+    if kind == "array":
+        return [_example(schema.get("items", {})) for _ in range(max(1, schema.get("minItems", 1)))]
+    if kind in ("integer", "number"):
+        return 0
+    if kind == "boolean":
+        return False
+    if kind == "null":
+        return None
+    text = "stand-in reply"
+    match = _LEADING_ALTERNATIVE.match(schema.get("pattern", ""))
+    if match:
+        text = f"{match.group(1).split('|')[0]} {text}"
+    return text[:schema.get("maxLength", len(text))]
+
+
+class Replay:
+    """Recorded exchanges, indexed by exact request and, as a fallback, by model + last user message."""
+    def __init__(self, paths: Iterable[str] = ()):
+        self.exact: Dict[str, List[Dict[str, Any]]] = {}
+        self.loose: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.models = set()
+        self._turns: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for path in paths:
+            for entry in load(path):
+                self.add(entry)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        key = entry.get("key") or key_for(entry["model"], entry["messages"], entry.get("format"))
+        self.exact.setdefault(key, []).append(entry)
+        self.loose.setdefault((entry["model"], _last_user(entry["messages"])), []).append(entry)
+        self.models.add(entry["model"])
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.exact.values())
+
+    def lookup(self, model: str, messages: List[Dict[str, Any]], format: Any = None) -> Optional[Dict[str, Any]]:
+        key = key_for(model, messages, format)
+        entries = self.exact.get(key) or self.loose.get((model, _last_user(messages)))
+        if not entries:
+            return None
+        with self._lock:
+            # Repeated identical requests walk through every recorded reply in turn.
+            turn = self._turns.get(key, 0)
+            self._turns[key] = turn + 1
+        return entries[turn % len(entries)]
+
+
+class OllamaStandin:
+    """
+    The stand-in's behaviour. `latency` (+ up to `jitter`) models prompt evaluation, `load_time`
+    is paid whenever a model has to be loaded, `tokens_per_sec` paces generation, and `failure_rate`
+    answers that fraction of generations with HTTP 500. `capacity` caps how many models stay loaded,
+    like a RAM-limited host, so swapping costs `load_time` again. `replay_timing` reproduces the recorded
+    durations instead. Unmatched requests are synthesized, or rejected when `miss="error"`.
+    """
+    def __init__(self, transcripts: Iterable[str] = (), models: Iterable[str] = (), latency: float = 0.0,
+                 jitter: float = 0.0, load_time: float = 0.0, tokens_per_sec: Optional[float] = None,
+                 failure_rate: float = 0.0, miss: str = "synthesize", replay_timing: bool = False,
+                 embedding_dim: int = 768, seed: Optional[int] = None, capacity: int = 0):
+        self.replay = Replay(transcripts)
+        self.models = set(models) | self.replay.models
+        self.latency = latency
+        self.jitter = jitter
+        self.load_time = load_time
+        self.tokens_per_sec = tokens_per_sec
+        self.failure_rate = failure_rate
+        self.miss = miss
+        self.replay_timing = replay_timing
+        self.embedding_dim = embedding_dim
+        self.random = random.Random(seed)
+        self.capacity = capacity # Models held at once (0 = unlimited), evicting the least recently used
+        self.loaded: Dict[str, float] = {}
+        self.stats = {"requests": 0, "generations": 0, "replayed": 0, "synthesized": 0, "misses": 0,
+                      "failures": 0, "loads": 0, "evictions": 0, "embeddings": 0, "tokens": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def known(self, model: str) -> bool:
+        return not self.models or model in self.models or f"{model}:latest" in self.models
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self.random.random() < self.failure_rate
+
+    def _load(self, model: str, keep_alive: Any) -> float:
+        """Returns the simulated load time for this request and updates residency."""
+        with self._lock:
+            cold = model not in self.loaded
+            if cold and self.capacity:
+                while len(self.loaded) >= self.capacity:
+                    self.loaded.pop(min(self.loaded, key=self.loaded.get))
+                    self.stats["evictions"] += 1
+            if keep_alive in (0, "0", "0s", "0m"):
+                self.loaded.pop(model, None)
+            else:
+                self.loaded[model] = time.time()
+            if cold:
+                self.stats["loads"] += 1
+        return self.load_time if cold else 0.0
+
+    def generate(self, model: str, messages: List[Dict[str, Any]], format: Any = None,
+                 options: Optional[Dict[str, Any]] = None, keep_alive: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Picks the reply and its timings. Returns None on a miss when misses are errors.
+        The result carries the tokens to send and how long to wait before (prefill) and between them.
+        """
+        self._count("generations")
+        entry = self.replay.lookup(model, messages, format)
+        if entry is not None:
+            self._count("replayed")
+            content = entry.get("response") or ""
+        elif self.miss == "error":
+            self._count("misses")
+            return None
+        else:
+            self._count("synthesized")
+            if isinstance(format, dict):
+                content = json.dumps(_example(format))
+            elif format == "json":
+                content = "{}"
+            else:
+                content = f"[stand-in] {_last_user(messages)[-120:]}"
+
+        tokens = _tokens(content)
+        limit = (options or {}).get("num_predict")
+        if limit and limit > 0 and len(tokens) > limit:
+            tokens = tokens[:limit]
+        prompt_tokens = sum(len(_tokens(m.get("content") or "")) for m in messages)
+
+        load = self._load(model, keep_alive)
+        prefill = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        per_token = 1.0 / self.tokens_per_sec if self.tokens_per_sec else 0.0
+        if self.replay_timing and entry is not None:
+            load = (entry.get("load_duration") or 0) / 1e9
+            prefill = (entry.get("prompt_eval_duration") or 0) / 1e9
+            recorded = entry.get("eval_count") or len(tokens)
+            per_token = (entry.get("eval_duration") or 0) / 1e9 / max(1, recorded)
+            prompt_tokens = entry.get("prompt_eval_count") or prompt_tokens
+        self._count("tokens", len(tokens))
+        return {"tokens": tokens, "load": load, "prefill": prefill, "per_token": per_token,
+                "prompt_tokens": prompt_tokens}
+
+    def embed(self, text: str) -> List[float]:
+        """Deterministic unit vector per text, so retrieval code sees stable neighbours."""
+        self._count("embeddings")
+        rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+        vector = [rng.gauss(0, 1) for _ in range(self.embedding_dim)]
+        norm = sum(v * v for v in vector) ** 0.5 or 1.0
+        return [v / norm for v in vector]
+
+    def tags(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).isoformat()
+        return {"models": [{"name": m, "model": m, "modified_at": now, "size": 0, "digest": hashlib.sha256(m.encode()).hexdigest(),
+                            "details": {"format": "gguf", "family": m.split(":")[0]}} for m in sorted(self.models)]}
+
+    def ps(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"models": [{"name": m, "model": m, "size": 0, "size_vram": 0} for m in self.loaded]}
+
+    def serve(self, host: str = "127.0.0.1", port: int = 11435) -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer((host, port), _handler(self))
+        server.daemon_threads = True
+        return server
+
+    def start(self, host: str = "127.0.0.1", port: int = 11435) -> ThreadingHTTPServer:
+        """Serves in a background thread; call shutdown() on the result to stop."""
+        server = self.serve(host, port)
+        threading.Thread(target=server.serve_forever, daemon=True, name="OllamaStandin").start()
+        return server
+
+
+def _handler(standin: OllamaStandin):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def _json(self, status: int, body: Any) -> None:
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _body(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            try:
+                if self.headers.get("Content-Encoding") == "gzip": # As sent by the Tor gateway (AION_GATEWAY_GZIP)
+                    raw = gzip.decompress(raw)
+                return json.loads(raw or b"{}")
+            except (ValueError, OSError):
+                return {}
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            standin._count("requests")
+            if self.path == "/api/tags":
+                self._json(200, standin.tags())
+            elif self.path == "/api/ps":
+                self._json(200, standin.ps())
+            elif self.path == "/api/version":
+                self._json(200, {"version": "0.0.0-standin"})
+            elif self.path == "/standin/stats":
+                self._json(200, dict(standin.stats))
+            elif self.path == "/":
+                payload = b"Ollama is running"
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            else:
+                self._json(404, {"error": "not found"})
+
+        def do_POST(self):
+            standin._count("requests")
+            body = self._body()
+            if self.path in ("/api/chat", "/api/generate"):
+                self._generate(body, chat=self.path == "/api/chat")
+            elif self.path == "/api/embed":
+                inputs = body.get("input") or ""
+                inputs = [inputs] if isinstance(inputs, str) else inputs
+                self._json(200, {"model": body.get("model"), "embeddings": [standin.embed(t) for t in inputs]})
+            elif self.path == "/api/embeddings":
+                self._json(200, {"embedding": standin.embed(body.get("prompt") or "")})
+            elif self.path == "/api/show":
+                self._json(200, {"details": {"family": (body.get("model") or body.get("name") or "").split(":")[0]}})
+            else:
+                self._json(404, {"error": "not found"})
+
+        def _generate(self, body: Dict[str, Any], chat: bool) -> None:
+            model = body.get("model") or ""
+            if not standin.known(model):
+                self._json(404, {"error": f"model '{model}' not found, try pulling it first"})
+                return
+            if standin.should_fail():
+                standin._count("failures")
+                self._json(500, {"error": "stand-in: injected failure"})
+                return
+            if chat:
+                messages = body.get("messages") or []
+            else:
+                messages = ([{"role": "system", "content": body["system"]}] if body.get("system") else []) + \
+                           [{"role": "user", "content": body.get("prompt") or ""}]
+            plan = standin.generate(model, messages, body.get("format"), body.get("options"), body.get("keep_alive"))
+            if plan is None:
+                self._json(404, {"error": "stand-in: no recorded reply for this request"})
+                return
+
+            started = time.time()
+            time.sleep(plan["load"] + plan["prefill"])
+            tokens = plan["tokens"]
+
+            def chunk(text: str, done: bool) -> Dict[str, Any]:
+                data = {"model": model, "created_at": datetime.now(timezone.utc).isoformat(), "done": done}
+                if chat:
+                    data["message"] = {"role": "assistant", "content": text}
+                else:
+                    data["response"] = text
+                if done:
+                    total = time.time() - started
+                    data.update({
+                        "done_reason": "stop",
+                        "total_duration": _ns(total),
+                        "load_duration": _ns(plan["load"]),
+                        "prompt_eval_count": plan["prompt_tokens"],
+                        "prompt_eval_duration": _ns(plan["prefill"]),
+                        "eval_count": len(tokens),
+                        "eval_duration": _ns(max(0.0, total - plan["load"] - plan["prefill"])),
+                    })
+                return data
+
+            if not body.get("stream", True):
+                time.sleep(plan["per_token"] * len(tokens))
+                self._json(200, chunk("".join(tokens), True))
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for token in tokens:
+                    time.sleep(plan["per_token"])
+                    self._write_chunk(chunk(token, False))
+                self._write_chunk(chunk("", True))
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                pass # Client cancelled the stream
+
+        def _write_chunk(self, data: Dict[str, Any]) -> None:
+            line = (json.dumps(data) + "\n").encode("utf-8")
+            self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+            self.wfile.flush()
+
+    return Handler
@@ -1,6 +1,6 @@
 import logging
 import random
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 
 class PPASkill:
     """
@@ -9,7 +9,7 @@ class PPASkill:
     """
     def __init__(self):
         self.logger = logging.getLogger("PPASkill")
-        self.brain = Mind()
+        self.brain = get_mind()
         self.preferences = {}
 
     def analyze_behavior(self, activity: str):
@@ -26,7 +26,7 @@ class PPASkill:
         """
         self.logger.info(f"💡 PPA: Suggesting optimization for {current_task}...")
         # Consult the brain for a proactive suggestion
-        suggestion = self.brain.think(f"Current Task: {current_task}", "Provide a proactive, masterful suggestion for optimization.")
+        suggestion = self.brain.think(f"Current Task: {current_task}", "Provide a proactive, masterful suggestion for optimization.", tag="ppa", profile="plan")
         return suggestion
 
 # Singleton Instance
@@ -1,7 +1,35 @@
 import logging
+import math
 import os
+import re
 from pathlib import Path
-from aion.core.mind import Mind
+from aion.core.mind import get_task_mind, FAILURE_PREFIXES
+from aion.core.cognition.budget import fit
+from aion.core.cognition.gate import gates, hashed_words
+
+_TASK_VERBS = re.compile(r"\b(?:research|investigate|summari[sz]e|look into|find out|compare|explain|read up|figure out)\b", re.I)
+
+
+def _task_features(content: str) -> dict:
+    """Cheap signals for whether a note holds something Aion could act on."""
+    lines = content.splitlines()
+    questions = [l for l in lines if l.rstrip().endswith("?")]
+    task_lines = [l for l in lines if "TODO" in l or "- [ ]" in l] + questions
+    features = {
+        "todos": math.log1p(content.count("TODO")),
+        "open_boxes": math.log1p(content.count("- [ ]")),
+        "done_boxes": math.log1p(content.count("- [x]")),
+        "questions": math.log1p(len(questions)),
+        "url_queries": math.log1p(len(re.findall(r"https?://\S*\?", content))), # A '?' that is only a query string
+        "task_verbs": math.log1p(len(_TASK_VERBS.findall("\n".join(task_lines)))),
+        "length": math.log1p(len(content)) / 10,
+        "no_task_lines": 0.0 if task_lines else 1.0,
+    }
+    features.update(hashed_words("\n".join(task_lines)))
+    return features
+
+TASK_PRIOR = {"todos": 1.0, "open_boxes": 0.8, "done_boxes": -0.3, "questions": 0.6, "url_queries": -0.8,
+              "task_verbs": 1.2, "no_task_lines": -3.0}
 
 class SymbioteSkill:
     """
@@ -12,7 +40,8 @@ class SymbioteSkill:
     
     def __init__(self):
         self.logger = logging.getLogger("SymbioteSkill")
-        self.brain = Mind()
+        self.brain = get_task_mind("classify")
+        self.gate = gates.gate("symbiote", _task_features, TASK_PRIOR, bias=-0.5)
         self.root_path = Path(os.getcwd())
         
     def scan_for_tasks(self):
@@ -27,16 +56,28 @@ class SymbioteSkill:
         for md_file in user_content_path.glob("*.md"):
             content = md_file.read_text()
             if "TODO" in content or "?" in content:
+                verdict = self.gate.decide(content)
+                if not verdict.call:
+                    self.logger.debug(f"🚦 Skipping {md_file.name}: nothing actionable (p={verdict.probability:.2f}).")
+                    continue
                 self.logger.info(f"💡 Found potential task in {md_file.name}")
                 # Ask the brain if we should do something
                 decision = self.brain.think(
-                    content[:1000], 
-                    f"In the file {md_file.name}, I found some potential tasks or questions. Should I proactively help? If yes, suggest an action like 'RESEARCH <topic>' or 'SUMMARIZE <file>'. If no, return 'IDLE'."
-                )
+                    fit(content, "classify", model=self.brain.model), 
+                    f"In the file {md_file.name}, I found some potential tasks or questions. Should I proactively help? If yes, suggest an action like 'RESEARCH <topic>' or 'SUMMARIZE <file>'. If no, return 'IDLE'.",
+                    tag="symbiote",
+                    validate=self._is_decision
+                ).strip()
+                if not decision.startswith(FAILURE_PREFIXES):
+                    verdict.learn(decision != "IDLE")
                 if decision != "IDLE":
                     tasks.append(decision)
         return tasks
 
+    @staticmethod
+    def _is_decision(answer: str) -> bool:
+        return bool(re.fullmatch(r"IDLE|(?:RESEARCH|SUMMARIZE) \S.*", answer.strip()))
+
     def check_system_health(self):
         """
         Proactively checks if everything is running smoothly.
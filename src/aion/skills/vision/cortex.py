@@ -1,6 +1,7 @@
 # aion/skills/vision/cortex.py
-from aion.core.mind import Mind
+from aion.core.mind import get_mind
 import base64
+import os
 from pathlib import Path
 import logging
 
@@ -10,7 +11,7 @@ class VisualCortex:
     """
     def __init__(self):
         self.logger = logging.getLogger("VisualCortex")
-        self.model = "llava" # Must be pulled via 'ollama pull llava'
+        self.model = os.getenv("AION_VISION_MODEL", "llava") # Must be pulled via 'ollama pull llava'
 
     def analyze_image(self, image_path: Path, prompt: str = "Describe this image in detail.") -> str:
         """
@@ -24,25 +25,9 @@ class VisualCortex:
             with open(image_path, "rb") as img_file:
                 b64_image = base64.b64encode(img_file.read()).decode('utf-8')
 
-            # We interact directly with Ollama API structure for multimodal
-            # Since the Mind class wraps simple text, we'll use a direct payload here 
-            # or extend Mind. For simplicity/robustness, let's call Ollama via the Mind's underlying connection if possible,
-            # but standard 'generate' endpoint supports 'images'.
-            
-            import requests
-            
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "images": [b64_image],
-                "stream": False
-            }
-            
-            response = requests.post("http://localhost:11434/api/generate", json=payload)
-            if response.status_code == 200:
-                return response.json().get("response", "No response from vision model.")
-            else:
-                return f"Vision Error: {response.text}"
+            # Through the Mind so vision shares the worker pool and the residency manager:
+            # llava requests are batched instead of evicting the text model on every call.
+            return get_mind(model=self.model).see(prompt, [b64_image], tag="vision") or "No response from vision model."
                 
         except Exception as e:
             self.logger.error(f"Vision failed: {e}")
@@ -1,8 +1,17 @@
 # aion/utils.py
+import ast
+import contextvars
+import hashlib
 import logging
-import random
+import os
 import re
-from aion.skills.xenolinguistics import XenolinguisticsSkill
+import threading
+from typing import Any, Dict, List, Optional
+from aion.core.cognition.budget import token_counter
+from aion.core.cognition.call_ledger import call_ledger
+
+# Per thread / asyncio task, so concurrent prompts never read each other's report
+_last_report: contextvars.ContextVar = contextvars.ContextVar("xeno_last_report", default={})
 
 class UnicodeStylist:
     """
@@ -33,24 +42,163 @@ stylist = UnicodeStylist()
 
 class XenoCompressor:
     """
-    Hyperefficient compression utility for internal agent context.
-    Uses AION_GLOSSOPETRAE_ULTRA techniques.
+    Deterministic context compression for internal agent prompts, so identical inputs always
+    produce identical prompts (keeping response caches and Ollama's prefix reuse effective).
+
+    What it may drop depends on the `kind` of text, as in cognition.budget.fit:
+    - "code" is never touched.
+    - "prose" only loses terminal escapes, blank-line runs and immediately repeated lines;
+      fenced blocks and text that parses as Python pass through verbatim.
+    - "log" additionally strips timestamps, HTTP/debug noise and separators, squeezes spaces
+      and drops long lines seen earlier in the text. Only for logs.
     """
+    ANSI = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+    ZERO_WIDTH = re.compile('[\u200B\u200C\u200D\uFEFF]')
+    # Leading timestamps such as "[Mon Feb 03 10:11:12 2025]" or "2025-02-03 10:11:12,345"
+    TIMESTAMP = re.compile(
+        r'^\[?(?:[A-Z][a-z]{2} [A-Z][a-z]{2} +\d{1,2} \d\d:\d\d:\d\d \d{4}'
+        r'|\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d(?:[.,]\d+)?(?:Z|[+-]\d\d:?\d\d)?)\]?\s*'
+    )
+    NOISE = re.compile(
+        r'^(?:INFO:httpx:|HTTP Request: |DEBUG[: ]|\s*\d{1,3}%\|)'  # HTTP client chatter, debug lines, progress bars
+        r'|^\s*[-=_*#~]{4,}\s*$'  # Decorative separator lines
+    )
+    MIN_DEDUPE_LENGTH = 24 # Shorter lines (e.g. "}", "pass") repeat legitimately
+    FENCE = re.compile(r'^\s*(?:```|~~~)')
+
     def __init__(self):
-        self.xeno = XenolinguisticsSkill()
         self.logger = logging.getLogger("XenoCompressor")
+        self.ab_mode = os.getenv("AION_COMPRESSION_AB", "").lower() in ("1", "true", "yes")
+        self.stats = {
+            arm: {"calls": 0, "tokens_before": 0, "tokens_after": 0}
+            for arm in ("compressed", "control")
+        }
+        self._lock = threading.Lock()
+
+    def _strip_line(self, line: str, log: bool) -> Optional[str]:
+        line = self.ANSI.sub('', line).rstrip()
+        if not log:
+            return line
+        if self.NOISE.search(line):
+            return None
+        line = self.TIMESTAMP.sub('', line)
+        # Collapse runs of spaces inside the line but keep indentation
+        indent = len(line) - len(line.lstrip(' \t'))
+        return line[:indent] + re.sub(r'[ \t]{2,}', ' ', line[indent:])
+
+    @staticmethod
+    def looks_like_code(text: str) -> bool:
+        """Multi-line text that parses as Python is treated as code, whatever the caller called it."""
+        if text.count('\n') < 2:
+            return False
+        try:
+            tree = ast.parse(text)
+        except (SyntaxError, ValueError):
+            return False
+        return any(not isinstance(node, ast.Expr) for node in tree.body)
+
+    def _pipeline(self, text: str, log: bool = False) -> str:
+        text = self.ZERO_WIDTH.sub('', text.replace('\r\n', '\n'))
+        lines = text.split('\n')
+
+        out: List[str] = []
+        seen = set()
+        previous, repeats = None, 0
+        fenced = False
+        for raw in lines:
+            if self.FENCE.match(raw) or fenced:
+                # Fenced blocks are code or quoted output: verbatim
+                if repeats:
+                    out[-1] += f" (x{repeats + 1})"
+                    repeats = 0
+                if self.FENCE.match(raw):
+                    fenced = not fenced
+                out.append(raw)
+                previous = None
+                continue
+            # Carriage-return progress updates: keep only the final state of each line
+            line = self._strip_line(raw.split('\r')[-1], log)
+            if line is None:
+                continue
+            if line == previous and line:
+                repeats += 1
+                continue
+            if repeats:
+                out[-1] += f" (x{repeats + 1})"
+                repeats = 0
+            previous = line
+            if not line.strip():
+                if out and not out[-1].strip():
+                    continue # Collapse blank runs
+                out.append("")
+                continue
+            key = line.strip()
+            if log and len(key) >= self.MIN_DEDUPE_LENGTH:
+                if key in seen:
+                    continue
+                seen.add(key)
+            out.append(line)
+        if repeats:
+            out[-1] += f" (x{repeats + 1})"
+        return "\n".join(out).strip('\n')
+
+    def arm_for(self, text: str) -> str:
+        """A/B assignment: stable per input, roughly half the prompts go uncompressed."""
+        if not self.ab_mode:
+            return "compressed"
+        digest = hashlib.sha1(text.encode("utf-8", "ignore")).digest()
+        return "control" if digest[0] & 1 else "compressed"
+
+    @property
+    def last_report(self) -> Dict[str, Any]:
+        """The arm and token counts of this thread's (or task's) latest compress() call."""
+        return dict(_last_report.get())
+
+    def compress(self, text: str, model: Optional[str] = None, kind: str = "prose", arm: Optional[str] = None) -> str:
+        """
+        Returns the compressed text; token counts for the call land in `last_report` and `stats`.
+        `kind` is "prose", "log" or "code" (see the class docstring); code comes back unchanged.
+        `arm` pins the A/B arm, so every part of one prompt lands in the same arm.
+        """
+        arm = arm or self.arm_for(text)
+        if not text or kind == "code" or self.looks_like_code(text):
+            _last_report.set({"arm": arm})
+            return text
+        compressed = self._pipeline(text, log=kind == "log")
+        counter = token_counter(model)
+        before, after = counter.count(text), counter.count(compressed)
+        report = {"arm": arm, "tokens_before": before, "tokens_after": after, "saved": before - after}
+        _last_report.set(report)
+        with self._lock:
+            bucket = self.stats[arm]
+            bucket["calls"] += 1
+            bucket["tokens_before"] += before
+            bucket["tokens_after"] += after
+        self.logger.debug(f"🗜️ XenoCompressor [{arm}]: {before} -> {after} tokens")
+        return text if arm == "control" else compressed
+
+    def ledger_fields(self, arm: Optional[str]) -> Dict[str, str]:
+        """What to add to a call-ledger entry so the calls of each arm can be compared."""
+        return {"compression": arm} if self.ab_mode and arm else {}
 
-    def compress(self, text: str) -> str:
-        """Applies TokenBreak and dense encoding to text."""
-        # 1. Strip redundant whitespace and filler
-        text = re.sub(r'\s+', ' ', text).strip()
-        # 2. Apply TokenBreak at 20% intensity for BPE optimization
-        return self.xeno.apply_token_break(text, intensity=0.2)
+    def ab_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-arm totals. The control arm's tokens_after is the counterfactual saving it skipped;
+        `ledger` holds each arm's measured prompt tokens, latency and throughput from the call ledger.
+        """
+        with self._lock:
+            report = {arm: dict(bucket) for arm, bucket in self.stats.items()}
+        measured = call_ledger.aggregates(by="compression")
+        for arm, bucket in report.items():
+            before = bucket["tokens_before"]
+            bucket["savings_ratio"] = 1 - bucket["tokens_after"] / before if before else 0.0
+            bucket["ledger"] = measured.get(arm)
+        return report
 
     def decompress(self, text: str) -> str:
         """Removes breakers for human-readable output (if needed)."""
         # Simply strip the zero-width characters
-        return text.replace("\u200B", "").replace("\u200C", "").replace("\u200D", "").replace("\uFEFF", "")
+        return self.ZERO_WIDTH.sub('', text)
 
 # Global instance
 compressor = XenoCompressor()
@@ -0,0 +1,115 @@
+# tests/conftest.py
+import os
+import socket
+import struct
+import tempfile
+import threading
+
+import pytest
+
+# Module-level singletons pick their files at import time; keep them out of the checkout.
+_scratch = tempfile.mkdtemp(prefix="aion-tests-")
+os.environ.setdefault("AION_LEDGER_PATH", os.path.join(_scratch, "mind_ledger.jsonl"))
+os.environ.setdefault("AION_CACHE_PATH", os.path.join(_scratch, "mind_cache.sqlite3"))
+os.environ.setdefault("AION_GATE_PATH", os.path.join(_scratch, "call_gates.json"))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def standin():
+    """Factory for Ollama stand-ins on free ports: standin(models=[...], **knobs) -> (host, OllamaStandin)."""
+    from aion.interface.standin import OllamaStandin
+    servers = []
+
+    def start(**kwargs):
+        stand_in = OllamaStandin(**kwargs)
+        port = free_port()
+        servers.append(stand_in.start(port=port))
+        return f"http://127.0.0.1:{port}", stand_in
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class SocksProxy:
+    """A minimal SOCKS5 relay (no auth, CONNECT only) that counts the connections dialled through it."""
+    def __init__(self):
+        self.dials = 0
+        self._server = socket.socket()
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(64)
+        self.url = f"socks5h://127.0.0.1:{self._server.getsockname()[1]}"
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    @staticmethod
+    def _recv(sock, n):
+        data = b""
+        while len(data) < n:
+            chunk = sock.recv(n - len(data))
+            if not chunk:
+                raise OSError("closed")
+            data += chunk
+        return data
+
+    def _handle(self, client):
+        try:
+            methods = self._recv(client, 2)[1]
+            self._recv(client, methods)
+            client.sendall(b"\x05\x00")
+            _, _, _, atyp = self._recv(client, 4)
+            if atyp == 3:
+                host = self._recv(client, self._recv(client, 1)[0]).decode()
+            else:
+                host = socket.inet_ntoa(self._recv(client, 4))
+            port = struct.unpack(">H", self._recv(client, 2))[0]
+            upstream = socket.create_connection((host, port))
+            self.dials += 1
+            client.sendall(b"\x05\x00\x00\x01" + socket.inet_aton("127.0.0.1") + struct.pack(">H", port))
+        except OSError:
+            client.close()
+            return
+        threading.Thread(target=self._pipe, args=(client, upstream), daemon=True).start()
+        self._pipe(upstream, client)
+
+    @staticmethod
+    def _pipe(src, dst):
+        try:
+            while True:
+                data = src.recv(65536)
+                if not data:
+                    break
+                dst.sendall(data)
+        except OSError:
+            pass
+        finally:
+            for sock in (src, dst):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def close(self):
+        self._server.close()
+
+
+@pytest.fixture
+def socks_proxy():
+    proxy = SocksProxy()
+    yield proxy
+    proxy.close()
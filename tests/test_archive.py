@@ -0,0 +1,187 @@
+# tests/test_archive.py
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("striprtf")
+pytest.importorskip("llama_index.core")
+huggingface = pytest.importorskip("llama_index.embeddings.huggingface")
+from llama_index.core.embeddings import MockEmbedding
+
+EMBEDDED = [] # The texts of every embedding batch, in order
+SCRIPT = [] # Outcome of the next batches: None succeeds, an exception is raised
+
+
+class CountingEmbedding(MockEmbedding):
+    """A small mock embedding that records each batch and fails on cue."""
+    def get_text_embedding_batch(self, texts, show_progress=False, **kwargs):
+        outcome = SCRIPT.pop(0) if SCRIPT else None
+        if outcome is not None:
+            raise outcome
+        EMBEDDED.append(list(texts))
+        return super().get_text_embedding_batch(texts, show_progress, **kwargs)
+
+
+def counting(model_name=None, embed_batch_size=10, **kwargs):
+    return CountingEmbedding(embed_dim=8, embed_batch_size=embed_batch_size)
+
+
+class Crash(BaseException):
+    """The process dying mid-sync: not an Exception, so nothing in the engine catches it."""
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def docs(memory) -> set:
+    return set(memory.index.ref_doc_info) if memory.index else set()
+
+
+def embedded(text: str) -> bool:
+    return any(text in chunk for batch in EMBEDDED for chunk in batch)
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    """(engine module, factory) for MemoryEngines rooted at tmp_path, with a counting mock embedding."""
+    monkeypatch.setattr(huggingface, "HuggingFaceEmbedding", counting)
+    monkeypatch.chdir(tmp_path)
+    from aion.core.memory import engine
+    monkeypatch.setattr(engine, "HuggingFaceEmbedding", counting)
+    EMBEDDED.clear()
+    SCRIPT.clear()
+
+    def make(**settings):
+        memory = engine.MemoryEngine()
+        for name, value in settings.items():
+            setattr(memory, name, value)
+        return memory
+
+    return engine, make
+
+
+def test_edited_file_is_reembedded_and_deleted_file_removed(archive, tmp_path):
+    _, make = archive
+    memory = make()
+    a = write(tmp_path / "notes" / "a.md", "first draft")
+    b = write(tmp_path / "notes" / "b.md", "soon to be deleted")
+    memory.ingest()
+    assert docs(memory) == {str(a), str(b)}
+
+    EMBEDDED.clear()
+    write(a, "second, longer draft")
+    b.unlink()
+    report = memory.ingest()
+    assert "1 updated" in report and "1 forgotten" in report
+    assert docs(memory) == {str(a)}
+    assert embedded("second, longer draft") and len(EMBEDDED) == 1
+    assert memory.manifest.get(str(b)) is None
+
+
+def test_unchanged_files_skip_hashing(archive, tmp_path, monkeypatch):
+    engine, make = archive
+    memory = make()
+    a = write(tmp_path / "a.md", "steady")
+    memory.ingest()
+    hashed = []
+    real_hash = engine.file_hash
+    monkeypatch.setattr(engine, "file_hash", lambda data: hashed.append(data) or real_hash(data))
+
+    EMBEDDED.clear()
+    assert memory.ingest() == "The Archive is up to date."
+    assert hashed == [] and EMBEDDED == [] # Size and mtime matched: the file was not even read
+
+    later = time.time_ns() + 10**9
+    os.utime(a, ns=(later, later))
+    assert memory.ingest() == "The Archive is up to date."
+    assert len(hashed) == 1 and EMBEDDED == [] # Touched: hashed once, same content, not re-embedded
+
+
+def test_chunks_are_embedded_in_batches(archive, tmp_path):
+    _, make = archive
+    memory = make(batch_size=4)
+    for i in range(10):
+        write(tmp_path / f"n{i}.md", f"note {i}")
+    memory.ingest()
+    assert sorted(len(batch) for batch in EMBEDDED) == [2, 4, 4]
+    assert len(docs(memory)) == 10
+
+
+def test_interrupted_ingest_resumes_from_checkpoint(archive, tmp_path):
+    _, make = archive
+    for i in range(6):
+        write(tmp_path / f"n{i}.md", f"note {i}")
+    settings = dict(batch_size=1, checkpoint_docs=1)
+    memory = make(**settings)
+    SCRIPT[:] = [None, None, None, Crash()]
+    with pytest.raises(Crash):
+        memory.ingest()
+    assert json.loads(memory.manifest.meta("ingest"))["state"] == "running"
+    assert len(memory.manifest.entries()) == 3
+
+    EMBEDDED.clear()
+    restarted = make(**settings)
+    assert "3 new" in restarted.ingest()
+    assert len(EMBEDDED) == 3 # Only what the crash lost
+    assert len(docs(restarted)) == 6
+    assert json.loads(restarted.manifest.meta("ingest"))["state"] == "complete"
+
+
+def test_failed_embedding_keeps_the_old_version(archive, tmp_path):
+    _, make = archive
+    memory = make()
+    a = write(tmp_path / "a.md", "original")
+    memory.ingest()
+
+    write(a, "edited while Ollama was down")
+    SCRIPT[:] = [RuntimeError("connection refused")]
+    memory.update([str(a)])
+    assert str(a) in docs(memory) # Still searchable in its old form
+    assert memory._known(str(a)).sha256 == memory.manifest.get(str(a)).sha256 # ...and retried next time
+
+    memory.update([str(a)])
+    assert str(a) in docs(memory) and embedded("edited while Ollama was down")
+
+
+def test_file_events_are_debounced(archive, tmp_path):
+    _, make = archive
+    memory = make(debounce=0.3, max_delay=5.0)
+    memory.ingest()
+    a = tmp_path / "burst.md"
+    for i in range(3):
+        write(a, "line\n" * (i + 1))
+        memory.mark_dirty(a)
+        time.sleep(0.1)
+    deadline = time.time() + 5
+    while memory.updates["batches"] == 0 and time.time() < deadline:
+        time.sleep(0.05)
+    time.sleep(0.5)
+    assert memory.updates["events"] == 3
+    assert memory.updates["batches"] == 1 and memory.updates["files"] == 1
+    assert str(a) in docs(memory) and len(EMBEDDED) == 1
+
+
+def test_query_cache_follows_index_generation(archive, tmp_path):
+    _, make = archive
+    memory = make()
+    a = write(tmp_path / "a.md", "the lobster way")
+    memory.ingest()
+
+    first = memory.query("lobster")
+    assert memory.query("lobster") == first
+    assert memory.query_cache.stats["hits"] == 1
+
+    write(a, "the lobster way, revised")
+    memory.update([str(a)])
+    memory.query("lobster")
+    assert memory.query_cache.stats["stale"] == 1 # The generation moved on: a miss, not the old passage
+
+    memory.query("lobster", cache=False)
+    assert memory.query_cache.stats["bypassed"] == 1
+    assert memory.query_cache.stats["hits"] == 1
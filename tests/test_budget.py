@@ -0,0 +1,56 @@
+# tests/test_budget.py
+import ast
+
+from aion.core.cognition.budget import ContextBudget, fit, token_counter
+
+MODEL = "budget-test" # Its own counter, so calibration elsewhere never moves the numbers
+
+FUNCTIONS = [
+    f'''def step_{i}(state):
+    """Step {i} of the migration."""
+    value = state.get("v{i}", 0)
+    if value > {i}:
+        return value - {i}
+    return value + {i}
+
+
+'''
+    for i in range(12)
+]
+SOURCE = "import os\n\n\n" + "".join(FUNCTIONS)
+
+
+def test_code_that_fits_is_returned_verbatim(monkeypatch):
+    monkeypatch.setenv("AION_BUDGET_AUDIT", "100000")
+    assert fit(SOURCE, "audit", kind="code", model=MODEL) == SOURCE
+
+
+def test_code_is_cut_only_between_functions(monkeypatch):
+    monkeypatch.setenv("AION_BUDGET_AUDIT", "150")
+    trimmed = fit(SOURCE, "audit", kind="code", model=MODEL)
+    assert 0 < len(trimmed) < len(SOURCE)
+    assert token_counter(MODEL).count(trimmed) <= 150
+    tree = ast.parse(trimmed) # Still valid Python...
+    kept = [node.name for node in tree.body if isinstance(node, ast.FunctionDef)]
+    assert kept == [f"step_{i}" for i in range(len(kept))] and kept
+    for name in kept: # ...made of whole functions
+        i = int(name.split("_")[1])
+        assert FUNCTIONS[i].strip() in trimmed
+
+
+def test_log_tail_keeps_the_latest_lines(monkeypatch):
+    monkeypatch.setenv("AION_BUDGET_REFLECTION", "40")
+    log = "".join(f"line {i}: nothing much happened here\n" for i in range(100))
+    tail = fit(log, "reflection", kind="log", keep="tail", model=MODEL)
+    assert tail.endswith("line 99: nothing much happened here")
+    assert all(line.startswith("line ") for line in tail.splitlines())
+
+
+def test_pack_prefers_relevant_snippets_within_budget():
+    budget = ContextBudget("plan", model=MODEL, budget=120)
+    budget.add("The weather was pleasant and the birds were singing all afternoon. " * 4, source="diary")
+    budget.add("The scheduler starves background migrations when interactive load is high.", source="notes")
+    budget.add(SOURCE, kind="code", source="migrate.py")
+    packed = budget.pack("why are background migrations starving in the scheduler")
+    assert "[notes]" in packed
+    assert token_counter(MODEL).count(packed) <= 120
@@ -0,0 +1,59 @@
+# tests/test_cache.py
+import importlib
+import types
+
+import pytest
+
+from aion.core.cognition.cache import ResponseCache
+
+cache_module = importlib.import_module("aion.core.cognition.cache")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable clock for the cache module: clock[0] is 'now'."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def test_entries_expire_in_both_tiers(tmp_path, clock):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.put("k", "thought", ttl=60)
+    clock[0] += 30
+    assert cache.get("k") == "thought"
+    clock[0] += 31
+    assert cache.get("k") is None
+    # Gone from disk too: a fresh process does not resurrect it
+    assert ResponseCache(tmp_path / "cache.sqlite3").get("k") is None
+
+
+def test_disk_hit_is_promoted_to_memory(tmp_path, clock):
+    ResponseCache(tmp_path / "cache.sqlite3").put("k", "thought", ttl=60)
+    cache = ResponseCache(tmp_path / "cache.sqlite3") # A restart: empty memory tier
+    assert cache.get("k") == "thought"
+    assert cache.get("k") == "thought"
+    assert cache.stats["hits"] == 2 and cache.stats["disk_hits"] == 1
+    # The promoted copy keeps the original expiry rather than a fresh TTL
+    clock[0] += 61
+    assert cache.get("k") is None
+
+
+def test_memory_tier_is_lru(tmp_path, clock):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_memory=2)
+    cache.put("a", "1", ttl=60)
+    cache.put("b", "2", ttl=60)
+    cache.get("a")
+    cache.put("c", "3", ttl=60) # Evicts b, the least recently used
+    assert set(cache._memory) == {"a", "c"}
+    assert cache.get("b") == "2" and cache.stats["disk_hits"] == 1 # Still on disk
+
+
+def test_zero_ttl_and_disabled_cache_store_nothing(tmp_path, monkeypatch, clock):
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    cache.put("k", "thought", ttl=0)
+    assert cache.get("k") is None
+    monkeypatch.setenv("AION_CACHE_DISABLED", "1")
+    disabled = ResponseCache(tmp_path / "other.sqlite3")
+    disabled.put("k", "thought", ttl=60)
+    assert disabled.get("k") is None and disabled.stats["stores"] == 0
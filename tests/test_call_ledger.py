@@ -0,0 +1,65 @@
+# tests/test_call_ledger.py
+import json
+import time
+
+import pytest
+
+from aion.core.cognition.call_ledger import call_ledger, summarize
+from aion.core.cognition.schema import StructuredOutputError
+from aion.core.mind import Mind
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"actions": {"type": "array", "items": {"type": "string"}}},
+    "required": ["actions"],
+}
+
+
+def scripted(mind, monkeypatch, replies):
+    """Answers each structured call with the next (content, eval_count) pair."""
+    replies = iter(replies)
+
+    def chat(messages, *args, **kwargs):
+        content, tokens = next(replies)
+        return {"message": {"content": content}, "eval_count": tokens}
+
+    monkeypatch.setattr(mind, "_chat", chat)
+
+
+def waste(tag):
+    return [e for e in call_ledger.query(tag=tag) if e["kind"] == "waste"]
+
+
+def test_rejected_reply_before_repair_is_wasted(standin, monkeypatch):
+    host, _ = standin(models=["llama3.2:3b"])
+    mind = Mind(host=host, model="llama3.2:3b")
+    scripted(mind, monkeypatch, [('{"steps": ["look around"]}', 12), ('{"actions": ["RESEARCH x"]}', 5)])
+    tag = f"repair-{time.time()}"
+    assert mind.think_structured("goal", "plan it", SCHEMA, tag=tag, cache=False) == {"actions": ["RESEARCH x"]}
+    entries = waste(tag)
+    assert [(e["outcome"], e["wasted_tokens"]) for e in entries] == [("repair", 12)]
+
+
+def test_failed_repair_carries_its_cost(standin, monkeypatch):
+    host, _ = standin(models=["llama3.2:3b"])
+    mind = Mind(host=host, model="llama3.2:3b")
+    scripted(mind, monkeypatch, [('{"steps": []}', 9), ('not json at all', 7)])
+    tag = f"rejected-{time.time()}"
+    with pytest.raises(StructuredOutputError) as caught:
+        mind.think_structured("goal", "plan it", SCHEMA, tag=tag, cache=False)
+    assert caught.value.completion_tokens == 7
+    assert caught.value.raw == "not json at all"
+    call_ledger.wasted(tag, mind.model, "rejected", caught.value.completion_tokens, produced=caught.value.raw)
+    summary = summarize(call_ledger.query(tag=tag))
+    assert summary["wasted_by"] == {"repair": 9, "rejected": 7}
+    assert summary["wasted_tokens"] == 16
+    assert summary["calls"] == 0 # _chat was scripted, so only the waste entries reached the ledger
+
+
+def test_salvage_counts_only_what_was_cut():
+    tag = f"salvage-{time.time()}"
+    produced = json.dumps(["first part", "second part"]) + " Insight: Part 2: JSON List of Strings:"
+    assert call_ledger.wasted(tag, "llama3.2:3b", "salvage", produced=produced, kept=produced) is None
+    entry = call_ledger.wasted(tag, "llama3.2:3b", "salvage", produced=produced, kept="first part second part")
+    assert entry["wasted_tokens"] > 0
+    assert entry["wasted_chars"] == len(produced) - len("first part second part")
@@ -0,0 +1,95 @@
+# tests/test_compressor.py
+import threading
+import time
+from pathlib import Path
+
+from aion.utils import XenoCompressor
+
+SOURCE = '''import os
+
+DEBUG = True
+HTTP_TIMEOUT = 5
+
+
+def load(path):
+    if path is None:
+        raise ValueError("a path to the configuration file is required")
+    ########
+    if not os.path.exists(path):
+        raise ValueError("a path to the configuration file is required")
+    total  =  0
+    total  =  0
+    return total
+'''
+
+
+def test_code_round_trips_unchanged():
+    compressor = XenoCompressor()
+    assert compressor.compress(SOURCE, kind="code") == SOURCE
+    assert compressor.compress(SOURCE) == SOURCE
+    # Unlabelled, it still parses as Python and is left alone
+    real = Path(__file__).resolve().parents[1] / "src" / "aion" / "utils.py"
+    text = real.read_text()
+    assert compressor.compress(text) == text
+
+
+def test_prose_keeps_fenced_code_verbatim():
+    compressor = XenoCompressor()
+    block = "```python\n" + SOURCE + "```"
+    note = "Look at this:\n\n\n" + block + "\nThanks!\nThanks!"
+    out = compressor.compress(note)
+    assert block in out
+    assert out.endswith("Thanks! (x2)")
+    assert "\n\n\n" not in out.split("```")[0]
+
+
+def test_log_noise_and_repeats_are_dropped():
+    compressor = XenoCompressor()
+    log = "\n".join([
+        "[Mon Feb 03 10:11:12 2025] 🧠 planning the next goal for the session",
+        "INFO:httpx:HTTP Request: POST http://localhost:11434/api/chat",
+        "DEBUG: cache miss",
+        "[Mon Feb 03 10:11:13 2025] 🧠 planning the next goal for the session",
+        "----------",
+        "done",
+    ])
+    assert compressor.compress(log, kind="log") == "🧠 planning the next goal for the session (x2)\ndone"
+    # Prose keeps what only looks like noise
+    assert "DEBUG: cache miss" in compressor.compress(log)
+
+
+def test_ab_arm_reaches_the_call_ledger(standin, monkeypatch):
+    from aion.core.cognition.call_ledger import call_ledger
+    from aion.core.mind import Mind
+    from aion.utils import compressor
+    monkeypatch.setattr(compressor, "ab_mode", True)
+    host, _ = standin(models=["llama3.2:3b"])
+    mind = Mind(host=host, model="llama3.2:3b")
+    tag = f"ab-{time.time()}"
+    log = "INFO:httpx: HTTP Request: POST /api/chat\n" * 20 + "the actual finding"
+    for i in range(16):
+        mind.think(f"{log} {i}", "summarize", tag=tag, cache=False, context_kind="log")
+    arms = [e["compression"] for e in call_ledger.query(tag=tag)]
+    assert len(arms) == 16 and set(arms) == {"compressed", "control"}
+    # Measured, not estimated: the control arm sent the noise, so Ollama saw more prompt tokens per call
+    report = compressor.ab_report()
+    compressed, control = report["compressed"]["ledger"], report["control"]["ledger"]
+    assert control["prompt_tokens"] / control["calls"] > compressed["prompt_tokens"] / compressed["calls"]
+
+
+def test_last_report_is_per_thread():
+    from aion.utils import compressor
+    seen = {}
+
+    def run(name, text):
+        compressor.compress(text, kind="log")
+        time.sleep(0.05)
+        seen[name] = compressor.last_report["tokens_before"]
+
+    threads = [threading.Thread(target=run, args=("short", "a\nb")),
+               threading.Thread(target=run, args=("long", "word " * 200))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert seen["long"] > seen["short"]
@@ -0,0 +1,77 @@
+# tests/test_gate.py
+import pytest
+
+from aion.core.cognition.gate import CallGate, GateRegistry, hashed_words
+
+PRIOR = {"noise": -4.0, "signal": 4.0}
+
+
+def extract(text):
+    return {"noise" if "noise" in text else "signal": 1.0}
+
+
+@pytest.fixture(autouse=True)
+def settings(monkeypatch):
+    monkeypatch.setenv("AION_GATE_MIN_SAMPLES", "10")
+    monkeypatch.setenv("AION_GATE_MIN_PRECISION", "0.9")
+    monkeypatch.setenv("AION_GATE_EXPLORE", "0")
+    monkeypatch.delenv("AION_GATE_MODE", raising=False)
+
+
+def train(gate, rounds=5):
+    """Each round: a noise input the LLM rejects and a signal input it acts on, both predicted right."""
+    for _ in range(rounds):
+        gate.decide("noise again").learn(False)
+        gate.decide("a real signal").learn(True)
+
+
+def test_shadow_mode_calls_everything():
+    gate = CallGate("test", extract, PRIOR)
+    decision = gate.decide("noise again")
+    assert decision.predicted_skip and decision.call and decision.mode == "shadow"
+    assert gate.snapshot()["skipped"] == 0
+
+
+def test_enforces_once_its_skips_have_proven_right():
+    gate = CallGate("test", extract, PRIOR)
+    train(gate, rounds=4)
+    assert gate.snapshot()["mode"] == "shadow" # 8 verdicts, below AION_GATE_MIN_SAMPLES
+    train(gate, rounds=1)
+    assert gate.snapshot()["mode"] == "enforce"
+    skipped = gate.decide("noise again")
+    assert not skipped.call and skipped.mode == "enforce"
+    assert gate.decide("a real signal").call
+    assert gate.snapshot()["skipped"] == 1
+
+
+def test_false_skips_send_it_back_to_shadow():
+    gate = CallGate("test", extract, PRIOR)
+    train(gate)
+    gate.decide("noise that mattered").learn(True) # Skip precision 5/6, below 0.9
+    assert gate.snapshot()["mode"] == "shadow"
+    assert gate.snapshot()["confusion"]["false_skip"] == 1
+    assert gate.decide("noise again").call
+
+
+def test_forced_modes(monkeypatch):
+    monkeypatch.setenv("AION_GATE_MODE_TEST", "enforce")
+    assert not CallGate("test", extract, PRIOR).decide("noise").call
+    monkeypatch.setenv("AION_GATE_MODE_TEST", "off")
+    decision = CallGate("test", extract, PRIOR).decide("noise")
+    assert decision.call and decision.mode == "off"
+
+
+def test_registry_keeps_learned_state(tmp_path):
+    path = tmp_path / "gates.json"
+    gate = GateRegistry(path).gate("test", extract, PRIOR) # learn() saves through the registry
+    train(gate)
+    reloaded = GateRegistry(path).gate("test", extract, PRIOR)
+    assert reloaded.snapshot()["mode"] == "enforce"
+    assert reloaded.snapshot()["labeled"] == 10
+    assert reloaded.weights["noise"] < PRIOR["noise"]
+
+
+def test_hashed_words_are_stable():
+    features = hashed_words("Deadline moved to Friday", buckets=64)
+    assert features == hashed_words("friday: deadline moved", buckets=64) # "to" is too short to count
+    assert all(key.startswith("w") and 0 <= int(key[1:]) < 64 for key in features)
@@ -0,0 +1,83 @@
+# tests/test_gateway.py
+import threading
+
+import httpx
+import ollama
+import pytest
+
+from aion.core.cognition.gateway import Gateway
+from aion.core.cognition.router import WorkerPool
+
+
+@pytest.fixture
+def make_gateway(monkeypatch, socks_proxy):
+    def make(host, width=2, gzip_min=0):
+        monkeypatch.setenv("TOR_PROXY", socks_proxy.url)
+        monkeypatch.setenv("AION_GATEWAY_HOSTS", host)
+        monkeypatch.setenv("AION_GATEWAY_CONNECTIONS", str(width))
+        monkeypatch.setenv("AION_GATEWAY_KEEPWARM", "0")
+        monkeypatch.setenv("AION_GATEWAY_GZIP", str(gzip_min))
+        gateway = Gateway()
+        assert gateway.handles(host)
+        return gateway
+    return make
+
+
+def client_for(gateway, host):
+    return ollama.Client(host=host, trust_env=False, transport=gateway.transport(host))
+
+
+def ask(client, text="ping"):
+    return client.chat(model="llama3.1:8b", messages=[{"role": "user", "content": text}])
+
+
+def test_sequential_calls_reuse_one_dialled_connection(standin, make_gateway, socks_proxy):
+    host, stand_in = standin(models=["llama3.1:8b"])
+    gateway = make_gateway(host)
+    client = client_for(gateway, host)
+    for i in range(5):
+        assert ask(client, f"task {i}")["message"]["content"]
+    stats = gateway.transport(host).snapshot()
+    assert stand_in.stats["generations"] == 5
+    assert socks_proxy.dials == 1
+    assert stats["dials"] == 1 and stats["requests"] == 5
+
+
+def test_concurrent_calls_dial_at_most_one_connection_per_pool_slot(standin, make_gateway, socks_proxy):
+    host, stand_in = standin(models=["llama3.1:8b"], latency=0.2)
+    gateway = make_gateway(host, width=2)
+    clients = [client_for(gateway, host) for _ in range(2)] # Separate Ollama clients share the pool
+    threads = [threading.Thread(target=ask, args=(clients[i % 2], f"burst {i}")) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stand_in.stats["generations"] == 6
+    assert socks_proxy.dials <= 2
+    assert gateway.transport(host).snapshot()["dials"] == socks_proxy.dials
+
+
+def test_gzip_applies_only_above_the_threshold(standin, make_gateway):
+    host, stand_in = standin(models=["llama3.1:8b"])
+    gateway = make_gateway(host, gzip_min=2048)
+    client = client_for(gateway, host)
+    ask(client, "short")
+    assert gateway.transport(host).snapshot()["bytes_saved"] == 0
+    ask(client, "a long, repetitive context line\n" * 200)
+    stats = gateway.transport(host).snapshot()
+    assert stats["bytes_saved"] > 4000
+    # The stand-in decoded the gzip body and answered both
+    assert stand_in.stats["generations"] == 2 and stand_in.stats["misses"] == 0
+
+
+def test_missing_socks_support_leaves_the_host_out(standin, monkeypatch):
+    live, live_standin = standin(models=["llama3.1:8b"])
+
+    def no_socks(*args, **kwargs):
+        raise ImportError("Using SOCKS proxy, but the 'socksio' package is not installed.")
+
+    monkeypatch.setattr(httpx, "HTTPTransport", no_socks) # What the gateway builds; httpx.Client keeps its own reference
+    pool = WorkerPool(["http://nosocks.onion:11434", live])
+    assert pool.workers[0].client is None
+    pool.call("llama3.1:8b", lambda w: ask(w.client))
+    assert live_standin.stats["generations"] == 1
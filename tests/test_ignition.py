@@ -0,0 +1,67 @@
+# tests/test_ignition.py
+import http.server
+import socket
+import threading
+import time
+
+from aion.core.cognition.ignition import Ignition
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _serve(port: int) -> http.server.HTTPServer:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"Ollama is running")
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_host_that_comes_up_later_is_picked_up(monkeypatch):
+    monkeypatch.setenv("AION_IGNITION_DISABLED", "1") # Never spawn a real ollama
+    monkeypatch.setenv("AION_IGNITION_RETRY", "0.5")
+    ignition = Ignition()
+    port = _free_port()
+    host = f"http://127.0.0.1:{port}"
+
+    assert ignition.any_ready([host], timeout=5) is False
+    assert ignition.state(host) == "failed"
+    # Within the retry interval the failure stands
+    assert ignition.any_ready([host], timeout=5) is False
+
+    server = _serve(port)
+    try:
+        time.sleep(0.6)
+        assert ignition.any_ready([host], timeout=5) is True
+        assert ignition.state(host) == "ready"
+    finally:
+        server.shutdown()
+
+
+def test_remote_hosts_are_ready_without_probing():
+    ignition = Ignition()
+    assert ignition.any_ready(["http://worker.example:11434"], timeout=1) is True
+
+
+def test_offline_reply_is_never_cached(standin, monkeypatch):
+    from aion.core.mind import Mind
+    host, _ = standin(models=["llama3.2:3b"])
+    mind = Mind(host=host, model="llama3.2:3b")
+    task = f"offline-{time.time()}"
+    monkeypatch.setattr(mind, "ready", lambda timeout=None: False)
+    assert mind.stream("", task, tag="seeker").collect().startswith("🧠 Mind Offline")
+
+    monkeypatch.setattr(mind, "ready", lambda timeout=None: True)
+    assert mind.stream("", task, tag="seeker").collect().startswith("[stand-in]")
+    assert mind.think("", task, tag="seeker").startswith("[stand-in]")
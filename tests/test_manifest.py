@@ -0,0 +1,33 @@
+# tests/test_manifest.py
+import json
+
+from aion.core.memory.manifest import Entry, Manifest, file_hash
+
+
+def test_entries_round_trip_and_stream(tmp_path):
+    manifest = Manifest(tmp_path / "manifest.db")
+    entries = [Entry(f"/notes/{i:04}.md", i, i * 10, file_hash(str(i).encode()), f"/notes/{i:04}.md") for i in range(2500)]
+    entries.append(Entry("/notes/empty.md", 0, 1, file_hash(b""), None))
+    manifest.put(entries)
+    assert manifest.get("/notes/0042.md").mtime_ns == 420
+    assert manifest.get("/notes/missing.md") is None
+    listed = list(manifest.paths())
+    assert len(listed) == 2501 and listed == sorted(listed) # Streamed past the 1000-row pages
+    assert ("/notes/empty.md", None) in listed
+
+    manifest.remove([e.path for e in entries if e.doc_id])
+    assert not manifest.has_documents()
+    assert list(manifest.entries()) == ["/notes/empty.md"]
+
+
+def test_legacy_paths_are_imported_once(tmp_path):
+    legacy = tmp_path / "feelings.json"
+    legacy.write_text(json.dumps(["notes/a.md", str(tmp_path / "b.md")]))
+    manifest = Manifest(tmp_path / "manifest.db")
+    indexed = {str(tmp_path / "notes" / "a.md"): "doc-a", str(tmp_path / "c.md"): "doc-c"}
+    assert manifest.migrate_json(legacy, tmp_path, indexed) == 3
+    a = manifest.get(str(tmp_path / "notes" / "a.md"))
+    # No hash: the next sync re-embeds it, replacing the document it already has
+    assert a.sha256 is None and a.doc_id == "doc-a" and a.size == -1
+    assert manifest.get(str(tmp_path / "c.md")).doc_id == "doc-c"
+    assert manifest.migrate_json(legacy, tmp_path, indexed) == 0
@@ -0,0 +1,27 @@
+# tests/test_query_cache.py
+from aion.core.memory.query_cache import QueryCache
+
+
+def test_results_are_stamped_with_the_index_generation():
+    cache = QueryCache(size=8)
+    cache.put("what is  the lobster way?", 3, "passages")
+    assert cache.get("what is the lobster way?", 3) == "passages" # Whitespace is normalized
+    assert cache.get("what is the lobster way?", 4) is None
+    assert cache.get("what is the lobster way?", 3) is None # The stale entry was dropped
+    assert cache.stats["hits"] == 1 and cache.stats["stale"] == 1
+
+
+def test_embeddings_outlive_generations_and_lru_evicts():
+    cache = QueryCache(size=2)
+    cache.put_embedding("a", [1.0])
+    cache.put_embedding("b", [2.0])
+    assert cache.get_embedding("a") == [1.0] # Now the most recently used
+    cache.put_embedding("c", [3.0])
+    assert cache.get_embedding("b") is None
+    assert cache.get_embedding("a") == [1.0] and cache.get_embedding("c") == [3.0]
+    assert cache.stats["evictions"] == 1
+
+
+def test_disabled_by_env(monkeypatch):
+    monkeypatch.setenv("AION_QUERY_CACHE_DISABLED", "1")
+    assert QueryCache().enabled is False
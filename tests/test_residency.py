@@ -0,0 +1,53 @@
+# tests/test_residency.py
+from aion.core.cognition.residency import HostResidency, ResidencyManager
+
+SMALL, LARGE = "llama3.2:3b", "llama3.1:8b"
+
+
+def host(batch=8):
+    return HostResidency("http://h", capacity=1, pinned=[], batch=batch, max_wait=30)
+
+
+def test_interactive_request_swaps_in_after_inflight_work_not_the_batch():
+    h = host()
+    for _ in range(2):
+        assert h._enqueue(SMALL) is None # Background audits running on the resident model
+    chat = h._enqueue(LARGE, interactive=True)
+    assert chat is not None and h.evicting == SMALL
+    # Background work arriving meanwhile waits behind the swap instead of extending the batch
+    audit = h._enqueue(SMALL)
+    assert audit is not None
+
+    h.release(SMALL)
+    assert not chat.event.is_set()
+    h.release(SMALL) # Last in-flight generation done: the interactive model comes in
+    assert chat.event.is_set()
+    assert list(h.resident) == [LARGE]
+
+
+def test_background_requests_still_batch():
+    h = host(batch=2)
+    assert h._enqueue(SMALL) is None
+    queued = h._enqueue(LARGE)
+    assert queued is not None and h.evicting is None # Current model still busy and under its batch
+    assert h._enqueue(SMALL) is None
+    assert h._enqueue(SMALL) is not None # Batch served; now it has to wait for the swap
+    assert h.evicting == SMALL
+
+
+def test_interactive_admissions_do_not_use_up_the_batch():
+    h = host(batch=2)
+    assert h._enqueue(SMALL) is None
+    assert h._enqueue(LARGE) is not None
+    for _ in range(3):
+        assert h._enqueue(SMALL, interactive=True) is None
+    assert h.streak == 1
+    assert h._enqueue(SMALL) is None
+
+
+def test_default_capacity_follows_ollama(monkeypatch):
+    monkeypatch.delenv("AION_RESIDENT_CAPACITY", raising=False)
+    monkeypatch.delenv("OLLAMA_MAX_LOADED_MODELS", raising=False)
+    assert ResidencyManager().capacity == 3
+    monkeypatch.setenv("OLLAMA_MAX_LOADED_MODELS", "2")
+    assert ResidencyManager().capacity == 2
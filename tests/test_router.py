@@ -0,0 +1,79 @@
+# tests/test_router.py
+import time
+
+import pytest
+
+from aion.core.cognition import router
+from aion.core.cognition.breaker import CircuitOpenError
+from aion.core.cognition.router import WorkerPool
+
+from conftest import free_port
+
+MESSAGES = [{"role": "user", "content": "ping"}]
+
+
+def chat(model):
+    return lambda worker: worker.client.chat(model=model, messages=MESSAGES)
+
+
+def test_routes_to_the_host_that_has_the_model(standin):
+    small, small_standin = standin(models=["llama3.2:3b"])
+    large, large_standin = standin(models=["llama3.1:8b"])
+    pool = WorkerPool([small, large])
+    for _ in range(3):
+        pool.call("llama3.1:8b", chat("llama3.1:8b"))
+    assert large_standin.stats["generations"] == 3
+    assert small_standin.stats["generations"] == 0
+
+
+def test_fails_over_past_a_dead_host(standin):
+    dead = f"http://127.0.0.1:{free_port()}"
+    live, live_standin = standin(models=["llama3.1:8b"])
+    pool = WorkerPool([dead, live])
+    response = pool.call("llama3.1:8b", chat("llama3.1:8b"))
+    assert response["message"]["content"]
+    assert live_standin.stats["generations"] == 1
+    assert pool.workers[0].error_rate > 0
+
+
+def test_breaker_opens_then_probe_readmits(standin, monkeypatch):
+    monkeypatch.setenv("AION_BREAKER_FAILURES", "2")
+    monkeypatch.setenv("AION_BREAKER_RESET", "0.3")
+    monkeypatch.setenv("AION_BREAKER_JITTER", "0")
+    flaky, flaky_standin = standin(models=["llama3.1:8b"], failure_rate=1.0)
+    pool = WorkerPool([flaky])
+    worker = pool.workers[0]
+    for _ in range(2):
+        with pytest.raises(Exception):
+            pool.call("llama3.1:8b", chat("llama3.1:8b"))
+    assert worker.breaker.state == "open"
+    # Skipped without touching the network while open
+    with pytest.raises(CircuitOpenError):
+        pool.call("llama3.1:8b", chat("llama3.1:8b"))
+    assert flaky_standin.stats["failures"] == 2
+
+    flaky_standin.failure_rate = 0.0
+    time.sleep(0.5)
+    pool.candidates("llama3.1:8b") # Kicks off the half-open probe in the background
+    deadline = time.time() + 5
+    while not worker.healthy() and time.time() < deadline:
+        time.sleep(0.05)
+    assert worker.healthy()
+    assert pool.call("llama3.1:8b", chat("llama3.1:8b"))["message"]["content"]
+
+
+def test_unbuildable_client_is_left_out(standin, monkeypatch):
+    live, live_standin = standin(models=["llama3.1:8b"])
+    real = router.make_client
+
+    def make_client(host):
+        if ".onion" in host:
+            raise ImportError("Using SOCKS proxy, but the 'socksio' package is not installed.")
+        return real(host)
+
+    monkeypatch.setattr(router, "make_client", make_client)
+    pool = WorkerPool([f"http://unbuildable{free_port()}.onion:11434", live])
+    assert pool.workers[0].client is None
+    assert pool.workers[0] not in pool.candidates("llama3.1:8b")
+    pool.call("llama3.1:8b", chat("llama3.1:8b"))
+    assert live_standin.stats["generations"] == 1
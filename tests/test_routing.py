@@ -0,0 +1,74 @@
+# tests/test_routing.py
+import time
+
+import pytest
+
+from aion.core import mind as minds
+from aion.core.cognition import routing
+from aion.core.cognition.call_ledger import call_ledger
+
+SMALL, LARGE = "llama3.2:3b", "llama3.1:8b"
+SCHEMA = {"type": "object", "properties": {"actions": {"type": "array", "items": {"type": "string"}}},
+          "required": ["actions"]}
+
+
+@pytest.fixture
+def workers(standin, monkeypatch):
+    """Points every shared Mind at one stand-in serving `models`; returns the stand-in."""
+    def start(models):
+        host, stand_in = standin(models=models)
+        monkeypatch.setenv("AION_WORKERS", host)
+        monkeypatch.setenv("AION_MODEL", LARGE)
+        monkeypatch.delenv("AION_MODEL_PLAN", raising=False)
+        monkeypatch.setattr(minds, "_minds", {})
+        monkeypatch.setattr(minds, "_task_minds", {})
+        monkeypatch.setattr(routing, "metrics", {})
+        return stand_in
+    return start
+
+
+def models_used(tag):
+    return [e["model"] for e in call_ledger.query(tag=tag) if e["kind"] != "waste"]
+
+
+def test_route_for_honours_overrides(monkeypatch):
+    monkeypatch.setenv("AION_MODEL", LARGE)
+    monkeypatch.setenv("AION_MODEL_CLASSIFY", "tiny:1b")
+    monkeypatch.setenv("AION_OPTIONS_CLASSIFY", '{"num_predict": 8}')
+    route = routing.route_for("classify")
+    assert route.model == "tiny:1b" and route.escalate == LARGE
+    assert route.options == {"temperature": 0.0, "num_predict": 8}
+    assert routing.route_for("critique").escalate is None # Already on AION_MODEL: nowhere to go
+
+    monkeypatch.setenv("AION_ESCALATION", "no")
+    assert routing.route_for("classify").escalate is None
+
+
+def test_small_model_failure_escalates_structured_calls(workers):
+    workers([LARGE]) # The small model is missing, so its call fails
+    tag = f"escalate-{time.time()}"
+    task_mind = minds.get_task_mind("plan")
+    assert task_mind.model == SMALL
+    result = task_mind.think_structured("goal", "plan it", SCHEMA, tag=tag, cache=False)
+    assert isinstance(result["actions"], list)
+    assert models_used(tag)[-1] == LARGE
+    assert routing.snapshot()["plan"]["calls"] == 1
+    assert routing.snapshot()["plan"]["escalations"] == 1
+
+
+def test_failed_validation_escalates_think(workers):
+    workers([SMALL, LARGE])
+    tag = f"validate-{time.time()}"
+    answers = []
+    task_mind = minds.get_task_mind("summarize")
+    task_mind.think("notes", "sum it up", tag=tag, cache=False, validate=lambda answer: answers.append(answer) and False)
+    assert models_used(tag) == [SMALL, LARGE]
+    assert routing.snapshot()["summarize"] == {"calls": 1, "escalations": 1, "escalation_rate": 1.0}
+
+
+def test_good_answers_stay_on_the_small_model(workers):
+    workers([SMALL, LARGE])
+    tag = f"stay-{time.time()}"
+    minds.get_task_mind("summarize").think("notes", "sum it up", tag=tag, cache=False, validate=bool)
+    assert models_used(tag) == [SMALL]
+    assert routing.snapshot()["summarize"]["escalations"] == 0
@@ -0,0 +1,61 @@
+# tests/test_scheduler.py
+import threading
+import time
+
+from aion.core.cognition.scheduler import BACKGROUND, INTERACTIVE, Scheduler
+
+
+def queue_behind(scheduler, order, tag, entered):
+    def run():
+        entered.set()
+        with scheduler.slot(tag) as cls:
+            order.append(cls)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def contend(aging, head_start):
+    """One busy slot; a background request waits `head_start` seconds before an interactive one arrives."""
+    scheduler = Scheduler(slots=1, background_limit=1, aging=aging)
+    order = []
+    holder = scheduler.slot("chat")
+    holder.__enter__()
+    entered = threading.Event()
+    threads = [queue_behind(scheduler, order, "reflection", entered)]
+    entered.wait(5)
+    time.sleep(head_start)
+    entered.clear()
+    threads.append(queue_behind(scheduler, order, "chat", entered))
+    entered.wait(5)
+    time.sleep(0.05)
+    holder.__exit__(None, None, None)
+    for thread in threads:
+        thread.join(5)
+    return order, scheduler.snapshot()
+
+
+def test_interactive_requests_go_first():
+    order, stats = contend(aging=30, head_start=0.1)
+    assert order == [INTERACTIVE, BACKGROUND]
+    assert stats["aged_promotions"] == 0
+
+
+def test_aging_moves_a_long_waiting_background_request_ahead():
+    order, stats = contend(aging=0.2, head_start=0.5) # Waited 2.5 aging periods: outranks a new interactive call
+    assert order == [BACKGROUND, INTERACTIVE]
+    assert stats["aged_promotions"] == 1
+
+
+def test_background_never_takes_the_last_slot():
+    scheduler = Scheduler(slots=2, background_limit=1, aging=30)
+    with scheduler.slot("reflection"):
+        granted = threading.Event()
+        thread = threading.Thread(target=lambda: scheduler.slot("social").__enter__() and granted.set())
+        thread.start()
+        time.sleep(0.1)
+        assert not granted.is_set() # Second background call waits although a slot is free...
+        with scheduler.slot("chat"): # ...because it is kept for interactive work
+            pass
+    thread.join(5)
+    assert scheduler.snapshot()[BACKGROUND]["granted"] == 2
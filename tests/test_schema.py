@@ -0,0 +1,67 @@
+# tests/test_schema.py
+import time
+
+import pytest
+
+from aion.core.cognition import schema as structured
+from aion.core.cognition.schema import StructuredOutputError
+from aion.core.mind import Mind
+
+MODEL = "llama3.2:3b"
+SCHEMA = {
+    "type": "object",
+    "properties": {"actions": {"type": "array", "items": {"type": "string", "pattern": "^(RESEARCH|WRITE) "},
+                               "minItems": 1, "maxItems": 3}},
+    "required": ["actions"],
+    "additionalProperties": False,
+}
+
+
+def test_validate_reports_each_problem():
+    errors = structured.validate({"actions": ["DANCE now"] * 4, "extra": 1}, SCHEMA)
+    assert "$.actions: allows at most 3 items" in errors
+    assert any("does not match" in e for e in errors)
+    assert "$: unexpected property 'extra'" in errors
+    assert structured.parse("not json", SCHEMA)[1][0].startswith("invalid JSON")
+
+
+def script(stand_in, task, first, repair=None):
+    """Replays `first` for the request and, if given, `repair` for the repair prompt it earns."""
+    stand_in.replay.add({"model": MODEL, "messages": [{"role": "user", "content": f"Context:\ngoal\n\nTask: {task}"}],
+                         "response": first})
+    if repair is not None:
+        errors = structured.parse(first, SCHEMA)[1]
+        stand_in.replay.add({"model": MODEL, "messages": [{"role": "user", "content": structured.repair_prompt(errors)}],
+                             "response": repair})
+
+
+def test_one_repair_turns_a_bad_reply_into_a_valid_one(standin):
+    host, stand_in = standin(models=[MODEL], miss="error")
+    task = f"plan it {time.time()}"
+    script(stand_in, task, '{"steps": ["RESEARCH tides"]}', '{"actions": ["RESEARCH tides"]}')
+    before = structured.snapshot()
+    mind = Mind(host=host, model=MODEL)
+    assert mind.think_structured("goal", task, SCHEMA, cache=False) == {"actions": ["RESEARCH tides"]}
+    after = structured.snapshot()
+    assert stand_in.stats["generations"] == 2
+    assert after["repairs"] - before["repairs"] == 1 and after["repaired"] - before["repaired"] == 1
+
+
+def test_a_failed_repair_is_not_retried_again(standin):
+    host, stand_in = standin(models=[MODEL], miss="error")
+    task = f"plan it {time.time()}"
+    script(stand_in, task, '{"actions": []}', '{"actions": ["DANCE"]}')
+    mind = Mind(host=host, model=MODEL)
+    with pytest.raises(StructuredOutputError) as caught:
+        mind.think_structured("goal", task, SCHEMA, cache=False)
+    assert caught.value.raw == '{"actions": ["DANCE"]}'
+    assert stand_in.stats["generations"] == 2 # One attempt, one repair, no more
+
+
+def test_valid_reply_needs_no_repair(standin):
+    host, stand_in = standin(models=[MODEL], miss="error")
+    task = f"plan it {time.time()}"
+    script(stand_in, task, '{"actions": ["WRITE a summary"]}')
+    mind = Mind(host=host, model=MODEL)
+    assert mind.think_structured("goal", task, SCHEMA, cache=False) == {"actions": ["WRITE a summary"]}
+    assert stand_in.stats["generations"] == 1
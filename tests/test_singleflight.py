@@ -0,0 +1,77 @@
+# tests/test_singleflight.py
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aion.core.cognition.singleflight import SingleFlight
+
+
+def run_together(n, target):
+    results, threads = [None] * n, []
+    for i in range(n):
+        def work(i=i):
+            try:
+                results[i] = target()
+            except Exception as e:
+                results[i] = e
+        threads.append(threading.Thread(target=work))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return results
+
+
+def test_concurrent_identical_calls_run_once():
+    flights = SingleFlight()
+    calls = []
+
+    def generate():
+        calls.append(1)
+        time.sleep(0.2)
+        return "thought"
+
+    results = run_together(5, lambda: flights.do("key", generate))
+    assert results == ["thought"] * 5
+    assert len(calls) == 1
+    assert flights.stats == {"executed": 1, "collapsed": 4}
+    assert flights.snapshot()["in_flight"] == 0
+
+
+def test_errors_reach_every_waiter_and_the_next_call_retries():
+    flights = SingleFlight()
+
+    def failing():
+        time.sleep(0.2)
+        raise ConnectionError("worker down")
+
+    results = run_together(3, lambda: flights.do("key", failing))
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert flights.stats["executed"] == 1
+    assert flights.do("key", lambda: "recovered") == "recovered" # Failures are not remembered
+
+
+def test_async_waiters_join_a_threaded_leader():
+    flights = SingleFlight()
+    started = threading.Event()
+
+    def leader():
+        started.set()
+        time.sleep(0.3)
+        raise ValueError("bad output")
+
+    thread = threading.Thread(target=lambda: pytest.raises(ValueError, flights.do, "key", leader))
+    thread.start()
+    started.wait(5)
+
+    async def follow():
+        async def never():
+            raise AssertionError("a waiter must not run the work")
+        return await asyncio.gather(*(flights.do_async("key", never) for _ in range(3)), return_exceptions=True)
+
+    outcomes = asyncio.run(follow())
+    thread.join(5)
+    assert all(isinstance(o, ValueError) for o in outcomes)
+    assert flights.stats == {"executed": 1, "collapsed": 3}
@@ -0,0 +1,75 @@
+# tests/test_stream.py
+import threading
+import time
+
+from aion.core.cognition.call_ledger import call_ledger
+from aion.core.cognition.stream import ThoughtStream
+from aion.core.mind import Mind
+
+
+class Source:
+    """A token source that records whether it was closed; `gate` (if set) holds back the second token."""
+    def __init__(self, gate=None):
+        self.closed = False
+        self.gate = gate
+
+    def __call__(self):
+        try:
+            yield "one "
+            if self.gate:
+                self.gate.wait(5)
+            yield "two "
+            yield "three"
+        finally:
+            self.closed = True
+
+
+def test_cancel_closes_the_source_immediately():
+    source = Source()
+    stream = ThoughtStream(source)
+    tokens = iter(stream)
+    assert next(tokens) == "one "
+    stream.cancel()
+    assert source.closed
+    assert list(tokens) == []
+    assert stream.cancelled and stream.text == "one "
+
+
+def test_cancel_during_a_pull_on_another_thread():
+    gate = threading.Event()
+    completed = []
+    source = Source(gate)
+    stream = ThoughtStream(source, on_complete=completed.append)
+    received = []
+    consumer = threading.Thread(target=lambda: received.extend(stream))
+    consumer.start()
+    time.sleep(0.2) # The consumer is now blocked pulling the second token
+    stream.cancel()
+    assert not source.closed # Cannot close a generator another thread is running...
+    gate.set()
+    consumer.join(5)
+    assert source.closed # ...so the pull in flight closes it when it returns
+    assert received == ["one "]
+    assert completed == []
+
+
+def test_abandoning_the_iteration_cancels():
+    source = Source()
+    stream = ThoughtStream(source)
+    for token in stream:
+        break
+    assert source.closed and stream.cancelled
+
+
+def test_cancelled_mind_stream_frees_the_worker(standin):
+    host, _ = standin(models=["llama3.2:3b"], tokens_per_sec=20)
+    mind = Mind(host=host, model="llama3.2:3b")
+    tag = f"cancel-{time.time()}"
+    stream = mind.stream("", "count slowly to twenty " * 4, tag=tag, cache=False)
+    tokens = iter(stream)
+    next(tokens)
+    worker = mind.pool.primary
+    assert worker.outstanding == 1
+    stream.cancel()
+    assert worker.outstanding == 0
+    assert [e["outcome"] for e in call_ledger.query(tag=tag)] == ["cancelled"]